@@ -2,16 +2,20 @@
 import pygame
 import vectors
 from math import pi, sqrt, cos, sin, atan2
-from random import randint, uniform
+from random import randint, uniform, choice
 from linear_solver import do_segments_intersect
+from collisions import (pack_edges, pack_vertices, raycast, remove_indices,
+                        convex_polygons_collide, polygons_collide, is_convex)
 import numpy as np
 import sys
 
 # DEFINE OBJECTS OF THE GAME
 
 class PolygonModel():
-    def __init__(self,points):
+    def __init__(self,points,radius=None,convex=None):
         self.points = points
+        self.radius = radius or max(vectors.length(p) for p in points)
+        self.convex = is_convex(points) if convex is None else convex
         self.rotation_angle = 0
         self.x = 0
         self.y = 0
@@ -44,6 +48,21 @@ class PolygonModel():
                 for i in range(0,point_count)]
 
     def does_collide(self, other_poly):
+        # bounding circles first, then a separating axis test, which also
+        # catches one polygon lying entirely inside the other. It's exact
+        # only for convex polygons: otherwise an overlap it finds may be
+        # only the convex hulls', so the edges and vertices decide.
+        reach = self.radius + other_poly.radius
+        if vectors.distance((self.x,self.y), (other_poly.x,other_poly.y)) > reach:
+            return False
+        points, other_points = self.transformed(), other_poly.transformed()
+        if not convex_polygons_collide(points, other_points):
+            return False
+        if self.convex and other_poly.convex:
+            return True
+        return bool(polygons_collide(points, other_points))
+
+    def does_collide_segments(self, other_poly):
         for other_segment in other_poly.segments():
             if self.does_intersect(other_segment):
                 return True
@@ -65,29 +84,66 @@ class Ship(PolygonModel):
         return (x,y), (x + dist * cos(self.rotation_angle), y + dist*sin(self.rotation_angle))
 
 
+# ASTEROID SHAPES
+
+# Asteroids share vertex tuples from a fixed library of random shapes
+# instead of generating (and allocating) new vertices for every spawn.
+
+def random_asteroid_shape():
+    sides = randint(5,9)
+    vs = tuple(vectors.to_cartesian((uniform(0.5,1.0), 2 * pi * i / sides))
+                for i in range(0,sides))
+    return vs, max(vectors.length(v) for v in vs), is_convex(vs)
+
+asteroid_shape_count = 64
+asteroid_shapes = [random_asteroid_shape() for _ in range(0,asteroid_shape_count)]
+
 class Asteroid(PolygonModel):
-    def __init__(self):
-        sides = randint(5,9)
-        vs = [vectors.to_cartesian((uniform(0.5,1.0), 2 * pi * i / sides))
-                for i in range(0,sides)]
-        super().__init__(vs)
+    def __init__(self, shape=None):
+        shape = shape or choice(asteroid_shapes)
+        super().__init__(*shape)
+        self.reset(shape)
+
+    def reset(self, shape=None):
+        # restore a fresh random asteroid, so instances can be recycled
+        self.points, self.radius, self.convex = shape or choice(asteroid_shapes)
+        self.rotation_angle = 0
+        self.x = 0
+        self.y = 0
         self.vx = uniform(-1,1)
         self.vy = uniform(-1,1)
         self.angular_velocity = uniform(-pi/2,pi/2)
+        self.draw_center = False
+
+class AsteroidPool():
+    # released asteroids are kept and handed out again by acquire
+    def __init__(self):
+        self.free = []
+
+    def acquire(self, shape=None):
+        if self.free:
+            ast = self.free.pop()
+            ast.reset(shape)
+            return ast
+        return Asteroid(shape)
+
+    def release(self, *asts):
+        self.free.extend(asts)
+
+asteroid_pool = AsteroidPool()
 
 
 # ASTEROID HELPERS
 
-def trajectory(start,end,steps):
+def trajectory(start,end,steps,pool=asteroid_pool):
     xi,yi = start
     xf,yf = end
     xs = np.linspace(xi,xf,steps+1)
     ys = np.linspace(yi,yf,steps+1)
-    model = Asteroid()
-    asts = [Asteroid() for _ in range(0,steps+1)]
+    shape = choice(asteroid_shapes)
+    asts = [pool.acquire(shape) for _ in range(0,steps+1)]
     for x,y,ast in zip(xs,ys,asts):
         ast.vx = ast.vy = ast.angular_velocity = 0
-        ast.points = model.points
         ast.x = x
         ast.y = y
         ast.draw_center = True
@@ -126,6 +182,25 @@ def draw_poly(screen, polygon_model, color=BLACK):
         cx, cy = to_pixels(polygon_model.x, polygon_model.y)
         pygame.draw.circle(screen, BLACK, (int(cx), int(cy)), 4, 4)
 
+def to_pixels_array(points):
+    # to_pixels for a whole (n,2) array of world coordinates at once
+    points = np.asarray(points, dtype=float)
+    return np.column_stack((width/2 + width * points[:,0] / 20,
+                            height/2 - height * points[:,1] / 20))
+
+def draw_polys(screen, polygon_models, color=BLACK):
+    # converts the vertices of every model to pixels in one NumPy operation
+    # before issuing the per-polygon draw calls
+    if not polygon_models:
+        return
+    world, owners, offsets = pack_vertices(polygon_models)
+    pixels = to_pixels_array(world)
+    for model, pixel_points in zip(polygon_models, np.split(pixels, offsets[1:])):
+        pygame.draw.lines(screen, color, True, pixel_points, 2)
+        if model.draw_center:
+            cx, cy = to_pixels(model.x, model.y)
+            pygame.draw.circle(screen, BLACK, (int(cx), int(cy)), 4, 4)
+
 def draw_segment(screen, v1,v2,color=RED):
     pygame.draw.line(screen, color, to_pixels(*v1), to_pixels(*v2), 2)
 
@@ -138,6 +213,18 @@ def draw_grid(screen):
     draw_segment(screen, (-10, 0), (10, 0), color=DARK_GRAY)
     draw_segment(screen, (0, -10), (0, 10), color=DARK_GRAY)
 
+_backgrounds = {}
+
+def background(size):
+    # the white screen with its grid never changes, so it is drawn once per
+    # screen size and blitted each frame
+    if size not in _backgrounds:
+        surface = pygame.Surface(size)
+        surface.fill(WHITE)
+        draw_grid(surface)
+        _backgrounds[size] = surface
+    return _backgrounds[size]
+
 
 
 acceleration = 3
@@ -210,20 +297,18 @@ def main(asteroids=default_asteroids):
 
         # DRAW THE SCENE
 
-        screen.fill(WHITE)
-
-        draw_grid(screen)
+        screen.blit(background(screen.get_size()), (0,0))
 
         if keys[pygame.K_SPACE]:
             draw_segment(screen, *laser)
 
         draw_poly(screen,ship)
 
-        for asteroid in asteroids:
-            if keys[pygame.K_SPACE] and asteroid.does_intersect(laser):
-                asteroids.remove(asteroid)
-            else:
-                draw_poly(screen, asteroid, color=GREEN)
+        if keys[pygame.K_SPACE]:
+            hits = raycast(laser, *pack_edges(asteroids))
+            asteroid_pool.release(*remove_indices(asteroids, hits))
+
+        draw_polys(screen, asteroids, color=GREEN)
 
 
         pygame.display.flip()
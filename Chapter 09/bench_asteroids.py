@@ -0,0 +1,144 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from math import pi, cos, sin
+from random import seed, uniform, randrange
+from timeit import default_timer as timer
+import gc
+import tracemalloc
+import asteroids
+from collisions import pack_edges, raycast, collide_pairs
+
+# Rough per-frame timings for the asteroid game with a large field.
+# Run from this directory:  python bench_asteroids.py
+
+def random_field(count):
+    seed(0)
+    field = [asteroids.Asteroid() for _ in range(0,count)]
+    for ast in field:
+        ast.x, ast.y = uniform(-10,10), uniform(-10,10)
+        ast.rotation_angle = uniform(0,6.28)
+    return field
+
+def best_of(f, repeats=3):
+    best = float('inf')
+    for _ in range(0,repeats):
+        start = timer()
+        result = f()
+        best = min(best, timer() - start)
+    return best, result
+
+def bench_laser(count=10000):
+    field = random_field(count)
+    ship = asteroids.Ship()
+    ship.rotation_angle = 0.3
+    laser = ship.laser_segment()
+    loop_time, loop_hits = best_of(
+        lambda: [i for i,a in enumerate(field) if a.does_intersect(laser)], 1)
+    ray_time, ray_hits = best_of(lambda: raycast(laser, *pack_edges(field)))
+    assert sorted(loop_hits) == sorted(ray_hits.tolist())
+    print("laser, %d asteroids: loop %.1f ms, raycast %.1f ms (%d hits)"
+          % (count, 1000*loop_time, 1000*ray_time, len(ray_hits)))
+
+def bench_collisions(count=2000):
+    field = random_field(2 * count)
+    a, b = field[:count], field[count:]
+    seg_time, seg = best_of(
+        lambda: [m.does_collide_segments(n) for m,n in zip(a,b)], 1)
+    one_time, one = best_of(lambda: [m.does_collide(n) for m,n in zip(a,b)])
+    batch_time, batch = best_of(lambda: collide_pairs(a, b))
+    assert one == batch.tolist()
+    # every segment crossing is a collision, and so is one polygon inside
+    # the other, which the segment test misses
+    assert all(s <= t for s,t in zip(seg, batch))
+    print("collisions, %d pairs: segments %.1f ms, does_collide %.1f ms, "
+          "collide_pairs %.1f ms (%d vs %d colliding)"
+          % (count, 1000*seg_time, 1000*one_time, 1000*batch_time,
+             sum(seg), batch.sum()))
+
+def check_concave_notch():
+    # a triangle in a notch of a star-shaped asteroid, inside its convex
+    # hull but outside the asteroid, doesn't collide with it
+    star = asteroids.PolygonModel([(r*cos(pi*i/4), r*sin(pi*i/4))
+                                   for i,r in enumerate([1.0,0.5]*4)])
+    triangle = asteroids.PolygonModel([(0.41,0.43), (0.51,0.43), (0.46,0.52)])
+    assert not star.convex and triangle.convex
+    assert not star.does_collide(triangle) and not triangle.does_collide(star)
+    assert not collide_pairs([star, triangle], [triangle, star]).any()
+    triangle.x = triangle.y = -0.45
+    assert star.does_collide(triangle) and collide_pairs([triangle], [star]).all()
+
+def spawn_churn(spawn, release, spawns, live=100):
+    # keep a field of `live` asteroids, replacing a random one per spawn
+    field = [spawn() for _ in range(0,live)]
+    for _ in range(0,spawns):
+        release(field.pop(randrange(len(field))))
+        field.append(spawn())
+
+def measure_spawns(spawn, release, spawns):
+    pauses = []
+    def on_gc(phase, info):
+        if phase == "start":
+            pauses.append(timer())
+        else:
+            pauses[-1] = timer() - pauses[-1]
+    constructed = [0]
+    original_init = asteroids.Asteroid.__init__
+    def counting_init(self, *args):
+        constructed[0] += 1
+        original_init(self, *args)
+    seed(0)
+    gc.collect()
+    asteroids.Asteroid.__init__ = counting_init
+    gc.callbacks.append(on_gc)
+    tracemalloc.start()
+    start = timer()
+    spawn_churn(spawn, release, spawns)
+    elapsed = timer() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.callbacks.remove(on_gc)
+    asteroids.Asteroid.__init__ = original_init
+    return elapsed, constructed[0], peak, len(pauses), sum(pauses)
+
+def bench_spawns(spawns=10000):
+    def fresh_shape_asteroid():
+        return asteroids.Asteroid(asteroids.random_asteroid_shape())
+    pool = asteroids.AsteroidPool()
+    for name, spawn, release in [
+            ("new vertices", fresh_shape_asteroid, lambda a: None),
+            ("shape library", asteroids.Asteroid, lambda a: None),
+            ("shape library + pool", pool.acquire, pool.release)]:
+        elapsed, constructed, peak, collections, paused = measure_spawns(spawn, release, spawns)
+        print("%d spawns, %s: %.1f ms, %d asteroids constructed, "
+              "peak %.0f KiB traced, %d gc runs, %.2f ms in gc"
+              % (spawns, name, 1000*elapsed, constructed, peak/1024, collections, 1000*paused))
+
+def bench_rendering(count=1000, frames=20):
+    import pygame
+    field = random_field(count)
+    old_screen = pygame.Surface((asteroids.width, asteroids.height))
+    new_screen = pygame.Surface((asteroids.width, asteroids.height))
+    def old_frame():
+        old_screen.fill(asteroids.WHITE)
+        asteroids.draw_grid(old_screen)
+        for ast in field:
+            asteroids.draw_poly(old_screen, ast, color=asteroids.GREEN)
+    def new_frame():
+        new_screen.blit(asteroids.background(new_screen.get_size()), (0,0))
+        asteroids.draw_polys(new_screen, field, color=asteroids.GREEN)
+    old_time, _ = best_of(lambda: [old_frame() for _ in range(0,frames)])
+    new_time, _ = best_of(lambda: [new_frame() for _ in range(0,frames)])
+    same = (pygame.image.tostring(old_screen, "RGB") ==
+            pygame.image.tostring(new_screen, "RGB"))
+    print("rendering, %d asteroids: per-model %.2f ms/frame, batched %.2f ms/frame "
+          "(identical pixels: %s)"
+          % (count, 1000*old_time/frames, 1000*new_time/frames, same))
+
+if __name__ == "__main__":
+    check_concave_notch()
+    bench_laser()
+    bench_collisions()
+    bench_spawns()
+    bench_rendering(1000)
+    bench_rendering(5000)
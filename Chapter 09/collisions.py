@@ -0,0 +1,161 @@
+import numpy as np
+
+# Vectorized geometry for the asteroid game. Polygon models are packed into
+# flat NumPy arrays of edges so that a whole field of asteroids can be tested
+# in a handful of array operations instead of one Python loop per edge.
+
+def pack_vertices(models):
+    # world coordinates of every vertex of every model, the index of the model
+    # each vertex belongs to, and the offset of each model's first vertex
+    counts = np.array([len(m.points) for m in models], dtype=int)
+    if counts.sum() == 0:
+        return np.zeros((0,2)), np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    local = np.array([p for m in models for p in m.points], dtype=float)
+    owners = np.repeat(np.arange(len(models)), counts)
+    angles = np.array([m.rotation_angle for m in models], dtype=float)[owners]
+    centers = np.array([(m.x, m.y) for m in models], dtype=float)[owners]
+    c, s = np.cos(angles), np.sin(angles)
+    world = np.column_stack((c * local[:,0] - s * local[:,1],
+                             s * local[:,0] + c * local[:,1])) + centers
+    offsets = np.cumsum(counts) - counts
+    return world, owners, offsets
+
+def pack_edges(models):
+    # one row per polygon edge: start point, end point and owning model index
+    world, owners, offsets = pack_vertices(models)
+    if len(world) == 0:
+        return world, world, owners
+    counts = np.diff(np.append(offsets, len(world)))
+    next_index = np.arange(1, len(world) + 1)
+    next_index[offsets + counts - 1] = offsets
+    return world, world[next_index], owners
+
+def cross2d(u, v):
+    return u[...,0] * v[...,1] - u[...,1] * v[...,0]
+
+def segment_hits(segment, starts, ends):
+    # parameter t along the segment at which it crosses each edge,
+    # or nan where the segment misses the edge (parallel edges never hit,
+    # matching do_segments_intersect)
+    p1, p2 = np.asarray(segment, dtype=float)
+    d = p2 - p1
+    e = ends - starts
+    w = starts - p1
+    denom = cross2d(d, e)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = cross2d(w, e) / denom
+        u = cross2d(w, d) / denom
+    hit = (denom != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    return np.where(hit, t, np.nan)
+
+def raycast(segment, starts, ends, owners):
+    # indices of the models hit by the segment, nearest to the segment's
+    # first point first
+    t = segment_hits(segment, starts, ends)
+    hit = ~np.isnan(t)
+    t, hit_owners = t[hit], owners[hit]
+    order = np.argsort(t, kind='stable')
+    t, hit_owners = t[order], hit_owners[order]
+    # np.unique keeps the first (nearest) hit of each model
+    indices, first = np.unique(hit_owners, return_index=True)
+    return indices[np.argsort(first, kind='stable')]
+
+def remove_indices(items, indices):
+    # delete from the list in place, last index first, so earlier
+    # deletions don't shift the positions of later ones; returns the
+    # removed items
+    removed = []
+    for i in sorted(set(int(i) for i in indices), reverse=True):
+        removed.append(items.pop(i))
+    return removed
+
+def padded_vertices(models):
+    # world vertices as a (models, max vertex count, 2) array; shorter
+    # polygons repeat their last vertex, which adds only zero-length edges
+    world, owners, offsets = pack_vertices(models)
+    counts = np.diff(np.append(offsets, len(world)))
+    width = counts.max() if len(counts) else 0
+    index = offsets[:,None] + np.minimum(np.arange(width)[None,:], counts[:,None] - 1)
+    return world[index]
+
+def edge_normals(polygons):
+    edges = np.roll(polygons, -1, axis=-2) - polygons
+    return np.stack((-edges[...,1], edges[...,0]), axis=-1)
+
+def convex_polygons_collide(polygons_a, polygons_b):
+    # separating axis test for batches of convex polygons, shaped
+    # (pairs, vertices, 2); two polygons overlap unless their projections onto
+    # one of their edge normals are disjoint. Touching counts as colliding.
+    a, b = np.asarray(polygons_a, dtype=float), np.asarray(polygons_b, dtype=float)
+    axes = np.concatenate((edge_normals(a), edge_normals(b)), axis=-2)
+    proj_a = np.einsum('...vd,...kd->...vk', a, axes)
+    proj_b = np.einsum('...vd,...kd->...vk', b, axes)
+    separated = ((proj_a.max(axis=-2) < proj_b.min(axis=-2)) |
+                 (proj_b.max(axis=-2) < proj_a.min(axis=-2)))
+    return ~separated.any(axis=-1)
+
+def is_convex(points):
+    # every turn from one edge to the next is in the same direction
+    p = np.asarray(points, dtype=float)
+    edges = np.roll(p, -1, axis=0) - p
+    turns = cross2d(edges, np.roll(edges, -1, axis=0))
+    return bool((turns >= 0).all() or (turns <= 0).all())
+
+def edges_cross(polygons_a, polygons_b):
+    # whether any edge of each polygon crosses any edge of its partner, for
+    # batches shaped (pairs, vertices, 2), by the same test as segment_hits
+    a, b = np.asarray(polygons_a, dtype=float), np.asarray(polygons_b, dtype=float)
+    p, d = a[...,:,None,:], (np.roll(a, -1, axis=-2) - a)[...,:,None,:]
+    q, e = b[...,None,:,:], (np.roll(b, -1, axis=-2) - b)[...,None,:,:]
+    w = q - p
+    denom = cross2d(d, e)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = cross2d(w, e) / denom
+        u = cross2d(w, d) / denom
+    hit = (denom != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+    return hit.any(axis=(-2,-1))
+
+def points_inside(points, polygons):
+    # even-odd rule: whether each point, shaped (pairs, 2), is inside its
+    # polygon, shaped (pairs, vertices, 2). Zero-length padding edges never
+    # straddle the point's horizontal line, so they don't count.
+    x, y = points[...,0,None], points[...,1,None]
+    x1, y1 = polygons[...,0], polygons[...,1]
+    following = np.roll(polygons, -1, axis=-2)
+    x2, y2 = following[...,0], following[...,1]
+    straddles = (y1 > y) != (y2 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crossing = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    return (straddles & (x < crossing)).sum(axis=-1) % 2 == 1
+
+def polygons_collide(polygons_a, polygons_b):
+    # exact test for batches of simple polygons, convex or not: some edges
+    # cross, or else one polygon is entirely inside the other, and then so
+    # is its first vertex
+    a, b = np.asarray(polygons_a, dtype=float), np.asarray(polygons_b, dtype=float)
+    return (edges_cross(a, b) | points_inside(a[...,0,:], b) |
+            points_inside(b[...,0,:], a))
+
+def collide_pairs(models_a, models_b):
+    # elementwise collision of two equal-length lists of models; pairs whose
+    # bounding circles are apart never reach the separating axis test, and
+    # only pairs it can't separate with a non-convex polygon (where it can
+    # report a collision of the convex hulls) go on to the exact test
+    result = np.zeros(len(models_a), dtype=bool)
+    if len(models_a) == 0:
+        return result
+    centers_a = np.array([(m.x, m.y) for m in models_a], dtype=float)
+    centers_b = np.array([(m.x, m.y) for m in models_b], dtype=float)
+    radii = np.array([m.radius + n.radius for m,n in zip(models_a, models_b)])
+    near = np.flatnonzero(((centers_a - centers_b)**2).sum(axis=1) <= radii**2)
+    if len(near):
+        result[near] = convex_polygons_collide(
+            padded_vertices([models_a[i] for i in near]),
+            padded_vertices([models_b[i] for i in near]))
+    concave = np.array([not (m.convex and n.convex) for m,n in zip(models_a, models_b)])
+    check = np.flatnonzero(result & concave)
+    if len(check):
+        result[check] = polygons_collide(
+            padded_vertices([models_a[i] for i in check]),
+            padded_vertices([models_b[i] for i in check]))
+    return result
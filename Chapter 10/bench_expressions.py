@@ -0,0 +1,591 @@
+from random import Random
+from timeit import default_timer as timer
+import math
+import os
+import tracemalloc
+import pickle
+import numpy as np
+from expressions import *
+from expression_parser import parse, tokenize
+import expression_codec
+from jacobians import jacobian, hessian
+
+# Rough timings for operations on expression trees.
+# Run from this directory:  python bench_expressions.py
+
+def random_tree(nodes, rng, variables=(x, y)):
+    # a random expression with about the given number of nodes
+    if nodes <= 1:
+        if rng.random() < 0.7:
+            return rng.choice(variables)
+        return Number(rng.randint(1,5))
+    kind = rng.randrange(5)
+    if kind == 0:
+        return Apply(Function(rng.choice(["sin", "cos"])), random_tree(nodes - 1, rng, variables))
+    if kind == 1 and nodes < 50:
+        return Power(random_tree(nodes - 2, rng, variables), Number(2))
+    left = (nodes - 1) // 2
+    op = [Sum, Product, Difference, Sum][rng.randrange(4)]
+    return op(random_tree(left, rng, variables), random_tree(nodes - 1 - left, rng, variables))
+
+def count_nodes(exp):
+    if isinstance(exp, (Number, Variable)):
+        return 1
+    if isinstance(exp, Sum):
+        return 1 + sum(count_nodes(e) for e in exp.exps)
+    if isinstance(exp, (Product, Difference)):
+        return 1 + count_nodes(exp.exp1) + count_nodes(exp.exp2)
+    if isinstance(exp, Quotient):
+        return 1 + count_nodes(exp.numerator) + count_nodes(exp.denominator)
+    if isinstance(exp, Power):
+        return 1 + count_nodes(exp.base) + count_nodes(exp.exponent)
+    if isinstance(exp, Negative):
+        return 1 + count_nodes(exp.exp)
+    if isinstance(exp, Apply):
+        return 1 + count_nodes(exp.argument)
+
+def children(exp):
+    if isinstance(exp, Sum):
+        return exp.exps
+    if isinstance(exp, (Product, Difference)):
+        return (exp.exp1, exp.exp2)
+    if isinstance(exp, Quotient):
+        return (exp.numerator, exp.denominator)
+    if isinstance(exp, Power):
+        return (exp.base, exp.exponent)
+    if isinstance(exp, Negative):
+        return (exp.exp,)
+    if isinstance(exp, Apply):
+        return (exp.argument,)
+    return ()
+
+def count_operations(exp):
+    # compound nodes, i.e. arithmetic operations and function calls
+    if isinstance(exp, (Number, Variable)):
+        return 0
+    return 1 + sum(count_operations(c) for c in children(exp))
+
+def count_distinct_nodes(exp):
+    # number of distinct node objects, counting shared subtrees once
+    seen, stack = {id(exp)}, [exp]
+    while stack:
+        for child in children(stack.pop()):
+            if id(child) not in seen:
+                seen.add(id(child))
+                stack.append(child)
+    return len(seen)
+
+def per_call(f, min_time=0.2):
+    calls, start = 0, timer()
+    while timer() - start < min_time:
+        f()
+        calls += 1
+    return (timer() - start) / calls
+
+def bench_compile(sizes=(10, 1000, 100000)):
+    for size in sizes:
+        exp = random_tree(size, Random(size))
+        start = timer()
+        f = exp.compile(("x", "y"))
+        compile_time = timer() - start
+        assert abs(f(0.3, 0.7) - exp.evaluate(x=0.3, y=0.7)) <= 1e-9 * (1 + abs(f(0.3, 0.7)))
+        evaluate_time = per_call(lambda: exp.evaluate(x=0.3, y=0.7))
+        compiled_time = per_call(lambda: f(0.3, 0.7))
+        print("compile, %d nodes: compile %.2f ms, evaluate %.1f us/call, "
+              "compiled %.1f us/call (%.0fx)"
+              % (count_nodes(exp), 1000*compile_time, 1e6*evaluate_time,
+                 1e6*compiled_time, evaluate_time / compiled_time))
+
+def trig_chain(factors):
+    # sin(x)*cos(x)*sin(x)*...
+    exp = Sin(x)
+    for i in range(1, factors):
+        exp = Product(exp, Cos(x) if i % 2 else Sin(x))
+    return exp
+
+def bench_derivatives(factors=6, order=4):
+    clear_caches()
+    tracemalloc.start()
+    start = timer()
+    exp = trig_chain(factors)
+    for _ in range(0, order):
+        exp = exp.derivative(x)
+    elapsed = timer() - start
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("derivative %d of a %d-factor sin/cos chain: %.1f ms, %d tree nodes "
+          "(%d distinct objects), %.0f KiB retained, %.0f KiB peak"
+          % (order, factors, 1000*elapsed, count_nodes(exp), count_distinct_nodes(exp),
+             size/1024, peak/1024))
+
+def bench_memoized_derivatives(order=5, size=60):
+    # every mixed partial derivative of a two-variable expression up to the
+    # given order, e.g. the entries of repeated Jacobians
+    exp = random_tree(size, Random(1))
+    for maxsize in (16, 4096):
+        clear_caches()
+        set_cache_size(maxsize)
+        start = timer()
+        level = [exp]
+        for _ in range(0, order):
+            level = [d.derivative(v) for d in level for v in (x, y)]
+        elapsed = timer() - start
+        stats = cache_stats()
+        print("%d derivatives of order %d, cache size %d: %.1f ms, derivative "
+              "cache hit rate %.0f%%"
+              % (len(level), order, maxsize, 1000*elapsed,
+                 100*stats["derivative"]["hit_rate"]))
+    set_cache_size(4096)
+
+def bench_simplify(factors=6, max_order=5):
+    clear_caches()
+    raw = simplified = trig_chain(factors)
+    for order in range(1, max_order + 1):
+        raw = raw.derivative(x)
+        start = timer()
+        simplified = raw.simplify()
+        simplify_time = timer() - start
+        raw_time = per_call(lambda: raw.evaluate(x=0.7), 0.1)
+        simplified_time = per_call(lambda: simplified.evaluate(x=0.7), 0.1)
+        print("derivative %d of a %d-factor sin/cos chain: %d -> %d nodes after "
+              "simplify (%.1f ms), evaluate %.0f -> %.0f us"
+              % (order, factors, count_nodes(raw), count_nodes(simplified),
+                 1000*simplify_time, 1e6*raw_time, 1e6*simplified_time))
+
+def bench_cse(size=200, variables=(x, y, z)):
+    exp = random_tree(size, Random(2), variables)
+    gradient = [exp.derivative(v) for v in variables]
+    names = [v.symbol for v in variables]
+    separate = [d.compile(names) for d in gradient]
+    together = compile_many(gradient, names)
+    point = (0.3, 0.7, 1.1)
+    assert all(abs(f(*point) - g) <= 1e-9 * (1 + abs(g))
+               for f, g in zip(separate, together(*point)))
+    tree_ops = sum(count_operations(d) for d in gradient)
+    dag_ops = straight_line_source(gradient, names).count(" = ")
+    separate_time = per_call(lambda: [f(*point) for f in separate])
+    together_time = per_call(lambda: together(*point))
+    print("gradient of a %d-node f(x,y,z): %d operations without CSE, %d with CSE; "
+          "%.1f -> %.1f us/call"
+          % (count_nodes(exp), tree_ops, dag_ops, 1e6*separate_time, 1e6*together_time))
+
+def many_variable_function(n):
+    # sum of sin(v_i) * v_(i+1), plus the square of the sum of all the v_i
+    vs = [Variable("v%d" % i) for i in range(0, n)]
+    terms = [Product(Sin(vs[i]), vs[(i + 1) % n]) for i in range(0, n)]
+    return Sum(Sum(*terms), Power(Sum(*vs), Number(2))), vs
+
+def bench_gradient(sizes=(2, 10, 100, 1000), h=1e-6):
+    for n in sizes:
+        clear_caches()
+        exp, vs = many_variable_function(n)
+        names = [v.symbol for v in vs]
+        point = [0.1 + 0.5 * i / n for i in range(0, n)]
+        bindings = dict(zip(names, point))
+        # symbolic: one derivative per variable, compiled together with CSE
+        start = timer()
+        symbolic = compile_many([exp.derivative(v) for v in vs], names)(*point)
+        symbolic_time = timer() - start
+        # finite differences: two calls of the compiled function per variable
+        f = exp.compile(names)
+        def finite_differences():
+            result = []
+            for i in range(0, n):
+                up, down = list(point), list(point)
+                up[i] += h
+                down[i] -= h
+                result.append((f(*up) - f(*down)) / (2 * h))
+            return result
+        finite_time = per_call(finite_differences, 0.1)
+        finite = finite_differences()
+        reverse_time = per_call(lambda: gradient(exp, **bindings), 0.1)
+        _, reverse = gradient(exp, **bindings)
+        reverse = [reverse[name] for name in names]
+        assert all(abs(r - s) <= 1e-9 * (1 + abs(s)) for r, s in zip(reverse, symbolic))
+        error = max(abs(r - d) for r, d in zip(reverse, finite))
+        print("gradient in %d variables (%d nodes): symbolic %.1f ms, finite "
+              "differences %.3f ms (max error %.1e), reverse mode %.3f ms"
+              % (n, count_nodes(exp), 1000*symbolic_time, 1000*finite_time,
+                 error, 1000*reverse_time))
+
+def check_gradient_constant_subtrees():
+    # gradient only propagates into subtrees with variables: 0^0.5 has no
+    # partial derivative with respect to its base, and in 2^x the base's
+    # partial isn't needed
+    for exp in [Sum(x, Power(Number(0), Number(0.5))),
+                Product(Power(Number(0), Number(0.5)), x),
+                Power(Number(2), x)]:
+        value, partials = gradient(exp, x=1.0)
+        assert abs(partials["x"] - exp.derivative(x).evaluate(x=1.0)) <= 1e-12
+
+def bench_evaluate_batch(size=1000, nodes=30):
+    exp = Sum(random_tree(nodes, Random(3)), Sqrt(Power(x, Number(2)) + Power(y, Number(2))), Apply(Function("ln"), Number(2)))
+    xs, ys = np.meshgrid(np.linspace(-3, 3, size), np.linspace(-3, 3, size))
+    points = min(size * size, 20000)
+    start = timer()
+    looped = [exp.evaluate(x=u, y=v) for u, v in zip(xs.flat[:points], ys.flat[:points])]
+    loop_time = (timer() - start) * size * size / points
+    start = timer()
+    batch = exp.evaluate_batch(x=xs, y=ys)
+    batch_time = timer() - start
+    f = exp.compile(("x", "y"), backend="numpy")
+    start = timer()
+    compiled = f(xs, ys)
+    compiled_time = timer() - start
+    assert np.allclose(batch.flat[:points], looped) and np.allclose(batch, compiled)
+    print("%dx%d grid, %d-node f(x,y): evaluate loop %.1f s (extrapolated from %d points), "
+          "evaluate_batch %.1f ms (%.0f Mpoints/s), compiled numpy %.1f ms"
+          % (size, size, count_nodes(exp), loop_time, points, 1000*batch_time,
+             size * size / batch_time / 1e6, 1000*compiled_time))
+
+def deep_tree(depth):
+    # a chain nested `depth` nodes deep, cycling through Sum, Product and sin
+    exp = x
+    for i in range(0, depth):
+        if i % 3 == 0:
+            exp = Sum(exp, y)
+        elif i % 3 == 1:
+            exp = Product(Number(0.5), exp)
+        else:
+            exp = Sin(exp)
+    return exp
+
+def check_deep_simplify_latex(depth=1000):
+    # a Sum/Product chain past the recursion limit, and its derivative
+    exp = x
+    for i in range(0, depth):
+        exp = Sum(exp, y) if i % 2 else Product(exp, x)
+    # every product but the first has a sum as its first factor
+    assert exp.latex().count("\\left(") == depth // 2 - 1
+    for e in (exp, exp.derivative(x)):
+        simplified = e.simplify()
+        expected = e.evaluate(x=0.9, y=0.3)
+        assert abs(simplified.evaluate(x=0.9, y=0.3) - expected) <= 1e-9 * (1 + abs(expected))
+        assert e.latex() and simplified.latex()
+
+def bench_deep(depths=(10**4, 10**5, 10**6)):
+    # the recursive versions of these operations stopped at Python's
+    # recursion limit, around depth 1000
+    for depth in depths:
+        clear_caches()
+        start = timer()
+        exp = deep_tree(depth)
+        timings = ["build %.0f ms" % (1000 * (timer() - start))]
+        for name, f in [
+                ("evaluate", lambda: exp.evaluate(x=0.3, y=0.7)),
+                ("display", exp.display),
+                ("latex", exp.latex),
+                ("simplify", exp.simplify),
+                ("expand", exp.expand),
+                ("_python_expr", exp._python_expr),
+                ("derivative", lambda: exp.derivative(x)),
+                ("substitute", lambda: exp.substitute(y, Number(2))),
+                ("contains", lambda: contains(exp, y)),
+                ("distinct_variables", lambda: distinct_variables(exp)),
+                ("contains_sum", lambda: contains_sum(exp))]:
+            start = timer()
+            f()
+            timings.append("%s %.0f ms" % (name, 1000 * (timer() - start)))
+        print("depth %d: %s" % (depth, ", ".join(timings)))
+
+def infix_text(exp):
+    # text for parse, from the Python source of the expression
+    return exp._python_expr().replace("math.log", "ln").replace("math.", "")
+
+def bench_parse(sizes=(1000, 100000, 1000000)):
+    for size in sizes:
+        exp = random_tree(size, Random(size), (x, y, z))
+        text = infix_text(exp)
+        start = timer()
+        tokens = tokenize(text)
+        tokenize_time = timer() - start
+        start = timer()
+        parsed = parse(text)
+        parse_time = timer() - start
+        point = {"x": 0.3, "y": 0.7, "z": 1.1}
+        expected = exp.evaluate(**point)
+        assert abs(parsed.evaluate(**point) - expected) <= 1e-9 * (1 + abs(expected))
+        # for comparison, rebuilding the tree from display() with eval
+        displayed = exp.display()
+        start = timer()
+        assert eval(displayed) is exp
+        eval_time = timer() - start
+        print("parse, %.2f MB of text, %d tokens: tokenize %.0f ms, parse %.0f ms total "
+              "(%.2f MB/s, %.0f k tree nodes/s, %d distinct nodes); eval of %.2f MB "
+              "display() %.0f ms"
+              % (len(text) / 1e6, len(tokens), 1000*tokenize_time, 1000*parse_time,
+                 len(text) / 1e6 / parse_time, count_nodes(parsed) / parse_time / 1000,
+                 len(postorder([parsed])), len(displayed) / 1e6, 1000*eval_time))
+
+def check_parse_negative_exponents():
+    # a minus in front of a number is part of the number, so these
+    # differentiate like the trees built by hand
+    for text, built in [("x^-1", Power(x, Number(-1))), ("x^(-2)", Power(x, Number(-2))),
+                        ("x^-0.5", Power(x, Number(-0.5)))]:
+        parsed = parse(text)
+        assert parsed is built
+        assert parsed.derivative(x) is built.derivative(x)
+        n = built.exponent.number
+        assert abs(parsed.derivative(x).evaluate(x=2.0) - n * 2.0 ** (n - 1)) <= 1e-12
+    assert parse("-x^2") is Negative(Power(x, Number(2)))
+
+def check_codec_errors():
+    # Function("sqrt") and Sqrt's function are different nodes, and both
+    # round-trip; damaged streams fail with ValueError
+    exp = Sum(Sqrt(x), Apply(Function("sqrt"), y), Sin(x))
+    data = expression_codec.encode(exp)
+    assert expression_codec.decode(data) is exp
+    header = expression_codec._header
+    for damaged in [header, data[:-1], data[:len(data) // 2],
+                    header + bytes([expression_codec._PRODUCT]),
+                    header + bytes([expression_codec._NEGATIVE, expression_codec._END]),
+                    data.replace(bytes([expression_codec._APPLY, 0]), bytes([expression_codec._APPLY, 9]))]:
+        try:
+            expression_codec.decode(damaged)
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert "truncated or corrupt" in str(e)
+
+def check_negative_zero():
+    # -0.0 == 0.0, but they're different numbers to interning, pickling and
+    # the codec
+    negative, positive = Number(-0.0), Number(0.0)
+    assert negative is not positive and negative is Number(-0.0)
+    assert math.copysign(1.0, negative.number) == -1.0
+    assert pickle.loads(pickle.dumps(negative)) is negative
+    assert expression_codec.decode(expression_codec.encode(Sum(negative, positive))) is Sum(negative, positive)
+
+def check_empty_compile():
+    # no expressions, or no variables, compile to functions of empty results
+    assert compile_many([])() == ()
+    assert compile_many([x * y])(2, 3) == (6,)
+    assert jacobian([], [x])(1).shape == (0, 0)
+    assert hessian(x * y, [])().shape == (0, 0)
+
+def check_evaluate_batch_writable():
+    # results are the caller's to modify, even a bare variable or a constant
+    xs = np.linspace(0, 1, 5)
+    for exp in (x, Number(3), Product(x, y)):
+        result = evaluate_batch(exp, x=xs, y=2)
+        assert result.shape == xs.shape and result.flags.writeable
+        assert not np.shares_memory(result, xs)
+
+def bench_codec(size=1000000):
+    for name, exp in [("random tree", random_tree(size, Random(size), (x, y, z))),
+                      ("derivative 5 of an 8-factor chain", trig_chain(8).derivative(x).derivative(x)
+                                                            .derivative(x).derivative(x).derivative(x))]:
+        results = []
+        for method, encode, decode in [
+                ("codec", expression_codec.encode, expression_codec.decode),
+                ("pickle", lambda e: pickle.dumps(e, pickle.HIGHEST_PROTOCOL), pickle.loads),
+                ("display", lambda e: e.display(), eval)]:
+            start = timer()
+            data = encode(exp)
+            encode_time = timer() - start
+            start = timer()
+            assert decode(data) is exp
+            decode_time = timer() - start
+            results.append("%s %.2f MB, %.0f/%.0f ms" % (method, len(data) / 1e6,
+                                                       1000*encode_time, 1000*decode_time))
+        print("%s, %d tree nodes, %d distinct (size, encode/decode): %s"
+              % (name, count_nodes(exp), len(postorder([exp])), "; ".join(results)))
+
+def distribute(exp):
+    # the tree-based Expression.expand this module had before: distributes
+    # products over sums, leaving powers, differences and quotients alone
+    if isinstance(exp, Sum):
+        return Sum(*[distribute(e) for e in exp.exps])
+    if isinstance(exp, Product):
+        expanded1, expanded2 = distribute(exp.exp1), distribute(exp.exp2)
+        if isinstance(expanded1, Sum):
+            return Sum(*[distribute(Product(e, expanded2)) for e in expanded1.exps])
+        elif isinstance(expanded2, Sum):
+            return Sum(*[Product(expanded1, e) for e in expanded2.exps])
+        return Product(expanded1, expanded2)
+    if isinstance(exp, Apply):
+        return Apply(exp.function, distribute(exp.argument))
+    return exp
+
+def count_terms(exp):
+    # terms of a sum, counting the terms of nested sums
+    count, stack = 0, [exp]
+    while stack:
+        term = stack.pop()
+        if isinstance(term, Sum):
+            stack.extend(term.exps)
+        else:
+            count += 1
+    return count
+
+def bench_expand(degrees=(5, 10, 20, 30, 50), max_distributed_terms=60000):
+    for variables in [(x, y), (x, y, z)]:
+        base = Sum(*variables, Number(1))
+        point = {v.symbol: 0.9 - 0.1 * i for i, v in enumerate(variables)}
+        for n in degrees:
+            clear_caches()
+            start = timer()
+            expanded = Power(base, Number(n)).expand()
+            expand_time = timer() - start
+            expected = base.evaluate(**point) ** n
+            assert abs(expanded.evaluate(**point) - expected) <= 1e-9 * expected
+            result = ("(%s)^%d: expand %.1f ms, %d terms"
+                      % ("+".join(v.symbol for v in variables) + "+1", n,
+                         1000*expand_time, count_terms(expanded)))
+            if len(base.exps) ** n <= max_distributed_terms:
+                # the tree-based version doesn't expand powers, so give it
+                # the power written out as a product
+                product = base
+                for _ in range(1, n):
+                    product = Product(product, base)
+                start = timer()
+                distributed = distribute(product)
+                distribute_time = timer() - start
+                result += ("; tree-based %.1f ms, %d terms"
+                           % (1000*distribute_time, count_terms(distributed)))
+            print(result)
+
+def bench_prune(terms=200, size=1000):
+    # a sum of small random terms in x and y and a parameter z, evaluated
+    # over a grid of x and y with z fixed at 0
+    rng = Random(3)
+    exp = Sum(*[random_tree(15, rng, variables=(x, y, z, Number(2))) for _ in range(0, terms)])
+    grid = np.linspace(0, 1, size)
+    X, Y = grid[:, None], grid[None, :]
+    clear_caches()
+    start = timer()
+    pruned = prune(exp, x=(0, 1), y=(0, 1), z=(0, 0))
+    prune_time = timer() - start
+    low, high = bounds(exp, x=(0, 1), y=(0, 1), z=(0, 0))
+    start = timer()
+    full = evaluate_batch(exp, x=X, y=Y, z=0)
+    full_time = timer() - start
+    start = timer()
+    fast = evaluate_batch(pruned, x=X, y=Y)
+    pruned_time = timer() - start
+    assert np.allclose(full, fast)
+    assert low <= full.min() and full.max() <= high
+    print("prune, %d nodes over a %dx%d grid: analyze and prune %.1f ms, "
+          "%d -> %d distinct nodes, evaluate_batch %.0f -> %.0f ms"
+          % (count_nodes(exp), size, size, 1000*prune_time, count_distinct_nodes(exp),
+             count_distinct_nodes(pruned), 1000*full_time, 1000*pruned_time))
+
+def volume_change(q, t1, t2, dt):
+    # the Riemann sum from the Chapter 8 notebook
+    return sum(q(t) * dt for t in np.arange(t1, t2, dt))
+
+def check_quadrature_bisections():
+    # an integral accepted on the last pass allowed is a result, not an
+    # error; one that isn't raises RuntimeError
+    import expressions
+    limit = expressions._max_bisections
+    try:
+        expressions._max_bisections = 1
+        assert abs(quadrature(np.cos, -1, 1) - 2 * np.sin(1)) <= 1e-10
+        try:
+            quadrature(lambda t: np.sqrt(np.abs(t)), -1, 1)
+            assert False, "expected RuntimeError"
+        except RuntimeError:
+            pass
+    finally:
+        expressions._max_bisections = limit
+
+def bench_integrate(batch=10000):
+    t = Variable("t")
+    for name, exp, exact in [
+            ("flow rate 3(t-4)^2/64", Quotient(Product(Number(3), Power(Difference(t, Number(4)), Number(2))), Number(64)),
+             4.375),
+            ("sin(t^2)", Sin(Power(t, Number(2))), 0.5836708999296234)]:
+        q = exp.compile(["t"])
+        for dt in (0.1, 0.01, 0.001):
+            start = timer()
+            riemann = volume_change(q, 0, 10, dt)
+            elapsed = timer() - start
+            points = len(np.arange(0, 10, dt))
+            print("%s, 0 to 10: Riemann sum dt=%g: error %.1e, %.1f ms, %.2f M evaluations/s"
+                  % (name, dt, abs(riemann - exact), 1000*elapsed, points / elapsed / 1e6))
+        f = exp.compile(["t"], backend="numpy")
+        evaluations = [0]
+        def counted(ts):
+            evaluations[0] += ts.size
+            return f(ts)
+        for tol in (1e-6, 1e-10):
+            evaluations[0] = 0
+            start = timer()
+            value = quadrature(counted, 0, 10, tol)
+            elapsed = timer() - start
+            print("  adaptive quadrature tol=%g: error %.1e, %.2f ms, %d evaluations"
+                  % (tol, abs(value - exact), 1000*elapsed, evaluations[0]))
+        # the volume at many times at once, like approximate_volume_function
+        ends = np.linspace(0, 10, batch)
+        evaluations[0] = 0
+        start = timer()
+        volumes = quadrature(counted, 0, ends, 1e-10)
+        elapsed = timer() - start
+        start = timer()
+        loop = [volume_change(q, 0, T, 0.01) for T in ends[::100]]
+        loop_time = (timer() - start) * 100
+        print("  %d integrals 0 to T: quadrature %.0f ms (%.1f M evaluations/s), "
+              "Riemann sums dt=0.01 about %.0f ms, max difference %.1e"
+              % (batch, 1000*elapsed, evaluations[0] / elapsed / 1e6, 1000*loop_time,
+                 np.abs(volumes[::100] - loop).max()))
+
+def coupled_system(outputs, n):
+    # f_k = sum of sin(v_i) * v_(i+k), plus v_k squared
+    vs = [Variable("v%d" % i) for i in range(0, n)]
+    return [Sum(*[Product(Sin(vs[i]), vs[(i + k) % n]) for i in range(0, n)],
+                Power(vs[k % n], Number(2)))
+            for k in range(0, outputs)], vs
+
+def bench_jacobian(outputs=20, n=100, process_counts=(1, 2, 4)):
+    exps, vs = coupled_system(outputs, n)
+    point = [0.01 * i for i in range(0, n)]
+    clear_caches()
+    start = timer()
+    # one derivative and one compiled function per entry
+    entries = [[e.derivative(v).compile([w.symbol for w in vs]) for v in vs] for e in exps]
+    naive = np.array([[f(*point) for f in row] for row in entries])
+    naive_time = timer() - start
+    print("jacobian, %d outputs of %d variables, entry by entry: %.1f ms"
+          % (outputs, n, 1000*naive_time))
+    for processes in process_counts:
+        clear_caches()
+        start = timer()
+        J = jacobian(exps, vs, processes)(*point)
+        elapsed = timer() - start
+        assert np.allclose(J, naive)
+        print("  jacobian, %d processes: %.1f ms (%.2fx)"
+              % (processes, 1000*elapsed, naive_time / elapsed))
+    for processes in process_counts:
+        clear_caches()
+        start = timer()
+        H = hessian(exps[0], vs, processes)(*point)
+        elapsed = timer() - start
+        assert np.array_equal(H, H.T)
+        print("  hessian of f_0, %d processes: %.1f ms" % (processes, 1000*elapsed))
+    print("  (%d cores available)" % os.cpu_count())
+
+if __name__ == "__main__":
+    check_parse_negative_exponents()
+    check_gradient_constant_subtrees()
+    check_deep_simplify_latex()
+    check_quadrature_bisections()
+    check_codec_errors()
+    check_negative_zero()
+    check_empty_compile()
+    check_evaluate_batch_writable()
+    bench_compile()
+    bench_derivatives()
+    bench_derivatives(8, 5)
+    bench_memoized_derivatives()
+    bench_simplify()
+    bench_cse()
+    bench_cse(2000)
+    bench_gradient()
+    bench_evaluate_batch()
+    bench_parse()
+    bench_codec()
+    bench_expand()
+    bench_prune()
+    bench_integrate()
+    bench_jacobian()
+    bench_deep()
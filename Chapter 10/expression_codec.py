@@ -0,0 +1,266 @@
+import struct
+from expressions import *
+from expressions import _sqrt_latex
+
+# A compact binary format for expression trees. A stream starts with a short
+# header and holds one or more expressions, each in postfix order: a record
+# for an operation follows the records of its operands, and the decoder keeps
+# the operands on a stack. Every distinct node is written once; later
+# occurrences of it (shared subtrees, which interning makes common) are a
+# back-reference to its position. Integers are variable-length, so most
+# records take one to three bytes.
+
+_header = b"EXPR\x02"
+
+(_INT, _FLOAT, _VARIABLE, _FUNCTION, _REF, _SUM, _PRODUCT, _DIFFERENCE,
+ _QUOTIENT, _POWER, _NEGATIVE, _APPLY, _END) = range(13)
+
+_binary_ops = {Product: _PRODUCT, Difference: _DIFFERENCE, Quotient: _QUOTIENT, Power: _POWER}
+_binary_classes = {op: cls for cls, op in _binary_ops.items()}
+# record types that are just the opcode
+_plain_ops = {Negative: _NEGATIVE, **_binary_ops}
+
+_double = struct.Struct("<d")
+
+# how a function's LaTeX is written, after its name in a function record:
+# a plain Function(name), or the \sqrt of Sqrt's function
+_PLAIN_LATEX, _SQRT_LATEX = range(2)
+
+def _latex_kind(function):
+    if function.make_latex is None:
+        return _PLAIN_LATEX
+    if function.make_latex is _sqrt_latex:
+        return _SQRT_LATEX
+    raise ValueError("can't encode function {} with custom LaTeX".format(function.name))
+
+_corrupt = "truncated or corrupt expression stream"
+
+def _check_operands(stack, count):
+    if len(stack) < count:
+        raise ValueError(_corrupt)
+
+def _write_uint(out, n):
+    while n >= 0x80:
+        out.append(n & 0x7f | 0x80)
+        n >>= 7
+    out.append(n)
+
+class _Incomplete(Exception):
+    # the data ends in the middle of a record
+    pass
+
+def _read_uint(data, pos):
+    # the integer and the position after it
+    try:
+        byte = data[pos]
+        if byte < 0x80:
+            return byte, pos + 1
+        n, shift = 0, 0
+        while byte >= 0x80:
+            n |= (byte & 0x7f) << shift
+            shift += 7
+            pos += 1
+            byte = data[pos]
+        return n | byte << shift, pos + 1
+    except IndexError:
+        raise _Incomplete
+
+def _check_length(data, pos, length):
+    if pos + length > len(data):
+        raise _Incomplete
+
+def _write_string(out, string):
+    encoded = string.encode("utf-8")
+    _write_uint(out, len(encoded))
+    out += encoded
+
+class Encoder():
+    # writes expressions to one stream, referring back to nodes written for
+    # earlier expressions as well
+    def __init__(self):
+        self.indices = {}
+        self.functions = {}
+        self.started = False
+
+    def encode(self, exp):
+        out = bytearray()
+        if not self.started:
+            out += _header
+            self.started = True
+        indices = self.indices
+        stack = [(exp, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                if node in indices:
+                    out.append(_REF)
+                    _write_uint(out, len(indices) - indices[node])
+                    continue
+                kids = node.children()
+                if kids:
+                    stack.append((node, True))
+                    stack.extend((c, False) for c in reversed(kids))
+                    continue
+            # looking up the exact class is much faster than isinstance with
+            # the ABC-based node classes
+            op = _plain_ops.get(type(node))
+            if op is None:
+                self._write_node(out, node)
+            else:
+                out.append(op)
+            indices[node] = len(indices)
+        out.append(_END)
+        return bytes(out)
+
+    def _write_node(self, out, node):
+        if isinstance(node, Number):
+            number = node.number
+            if isinstance(number, int):
+                out.append(_INT)
+                # zigzag, so small negative numbers stay short
+                _write_uint(out, 2 * number if number >= 0 else -2 * number - 1)
+            elif isinstance(number, float):
+                out.append(_FLOAT)
+                out += _double.pack(number)
+            else:
+                raise ValueError("can't encode number {!r}".format(number))
+        elif isinstance(node, Variable):
+            out.append(_VARIABLE)
+            _write_string(out, node.symbol)
+        elif isinstance(node, Sum):
+            out.append(_SUM)
+            _write_uint(out, len(node.exps))
+        elif isinstance(node, Apply):
+            function = node.function
+            if function not in self.functions:
+                kind = _latex_kind(function)
+                out.append(_FUNCTION)
+                _write_string(out, function.name)
+                out.append(kind)
+                self.functions[function] = len(self.functions)
+            out.append(_APPLY)
+            _write_uint(out, self.functions[function])
+        else:
+            raise ValueError("can't encode {}".format(type(node).__name__))
+
+def encode(exp):
+    return Encoder().encode(exp)
+
+def dump(exps, file):
+    encoder = Encoder()
+    for exp in exps:
+        file.write(encoder.encode(exp))
+
+class Decoder():
+    # Rebuilds expressions from a stream fed in chunks of any size, e.g. as
+    # they arrive from a pipe; feed returns the expressions completed so far.
+    def __init__(self):
+        self.buffer = b""
+        self.started = False
+        self.stack = []
+        self.nodes = []
+        self.functions = []
+
+    def feed(self, data):
+        data = self.buffer + data
+        pos = 0
+        if not self.started:
+            if len(data) < len(_header):
+                self.buffer = data
+                return []
+            if data[:len(_header)] != _header:
+                raise ValueError("not an encoded expression stream")
+            pos = len(_header)
+            self.started = True
+        stack, nodes, functions = self.stack, self.nodes, self.functions
+        done = []
+        end = len(data)
+        while pos < end:
+            start = pos
+            op = data[pos]
+            pos += 1
+            # each record is read completely before the stack changes, so an
+            # incomplete one at the end of the data is retried on the next feed
+            try:
+                if op == _REF:
+                    distance, pos = _read_uint(data, pos)
+                    if not 0 < distance <= len(nodes):
+                        raise ValueError("bad back-reference {}".format(distance))
+                    stack.append(nodes[len(nodes) - distance])
+                    continue
+                elif op in _binary_classes:
+                    _check_operands(stack, 2)
+                    exp2 = stack.pop()
+                    node = _binary_classes[op](stack.pop(), exp2)
+                elif op == _END:
+                    # each expression leaves exactly its root on the stack
+                    if len(stack) != 1:
+                        raise ValueError(_corrupt)
+                    done.append(stack.pop())
+                    continue
+                elif op == _INT:
+                    n, pos = _read_uint(data, pos)
+                    node = Number(n >> 1 if n % 2 == 0 else -(n >> 1) - 1)
+                elif op == _FLOAT:
+                    _check_length(data, pos, 8)
+                    node = Number(_double.unpack_from(data, pos)[0])
+                    pos += 8
+                elif op == _VARIABLE or op == _FUNCTION:
+                    length, pos = _read_uint(data, pos)
+                    _check_length(data, pos, length)
+                    name = data[pos:pos + length].decode("utf-8")
+                    pos += length
+                    if op == _FUNCTION:
+                        _check_length(data, pos, 1)
+                        kind = data[pos]
+                        pos += 1
+                        if kind == _PLAIN_LATEX:
+                            functions.append(Function(name))
+                        elif kind == _SQRT_LATEX:
+                            functions.append(Function(name, _sqrt_latex))
+                        else:
+                            raise ValueError(_corrupt)
+                        continue
+                    node = Variable(name)
+                elif op == _SUM:
+                    count, pos = _read_uint(data, pos)
+                    if count > len(stack):
+                        raise ValueError("sum of {} terms with {} operands".format(count, len(stack)))
+                    exps = stack[len(stack) - count:]
+                    del stack[len(stack) - count:]
+                    node = Sum(*exps)
+                elif op == _NEGATIVE:
+                    _check_operands(stack, 1)
+                    node = Negative(stack.pop())
+                elif op == _APPLY:
+                    k, pos = _read_uint(data, pos)
+                    if k >= len(functions):
+                        raise ValueError(_corrupt)
+                    _check_operands(stack, 1)
+                    node = Apply(functions[k], stack.pop())
+                else:
+                    raise ValueError("unknown record type {}".format(op))
+            except _Incomplete:
+                pos = start
+                break
+            stack.append(node)
+            nodes.append(node)
+        self.buffer = data[pos:]
+        return done
+
+def decode(data):
+    decoder = Decoder()
+    done = decoder.feed(data)
+    if not decoder.started or decoder.buffer or decoder.stack or not done:
+        raise ValueError(_corrupt)
+    if len(done) != 1:
+        raise ValueError("expected one expression, found {}".format(len(done)))
+    return done[0]
+
+def load(file, chunk_size=1 << 16):
+    # generator of the expressions in the file, decoded as it's read
+    decoder = Decoder()
+    for chunk in iter(lambda: file.read(chunk_size), b""):
+        yield from decoder.feed(chunk)
+    if decoder.buffer or decoder.stack:
+        raise ValueError(_corrupt)
@@ -0,0 +1,149 @@
+import re
+from expressions import *
+from expressions import _apply, _function_bindings
+
+# Parses text like "3 * x^2 + sin(y) / 2" into Expression trees. It's an
+# operator precedence (shunting-yard) parser: operands and pending operators
+# are kept on two explicit stacks, so nesting depth is only limited by memory.
+# Since nodes are interned, repeated subexpressions in the text come out as
+# one shared object.
+
+# each match is one token: a number, a name, an operator or parenthesis, or
+# any other character, which is an error
+_token = re.compile(r"""\s*(?:
+    (\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)
+  | ([A-Za-z_][A-Za-z_0-9]*)
+  | (\*\*|[-+*/^()])
+  | (\S))""", re.VERBOSE)
+
+# binary operators: precedence and whether they group to the right
+_binary = {
+    "+": (1, False),
+    "-": (1, False),
+    "*": (2, False),
+    "/": (2, False),
+    "^": (4, True),
+    "**": (4, True)
+}
+
+# unary minus binds tighter than * and / but looser than ^, so -x^2 is -(x^2)
+_unary_precedence = 3
+
+_functions = {name: _apply(name) for name in _function_bindings}
+# the same Function node as the Sqrt helper, so parsed and built trees match
+_functions["sqrt"] = Sqrt
+
+def tokenize(text):
+    # list of (number, name, operator, error) tuples, one of them non-empty
+    return _token.findall(text)
+
+def _number(text):
+    if "." in text or "e" in text or "E" in text:
+        return Number(float(text))
+    return Number(int(text))
+
+def _term(operand):
+    # terms of a chain like a + b - c are collected in a list and built into
+    # one Sum at the end, rather than nesting a binary Sum per operator
+    return Sum(*operand) if isinstance(operand, list) else operand
+
+def _reduce(operators, operands):
+    op = operators.pop()
+    if op == "neg":
+        operand = _term(operands.pop())
+        # -2 is the number -2, as Number(-2) would be built by hand, so x^-2
+        # differentiates like Power(x, Number(-2))
+        if isinstance(operand, Number):
+            operands.append(Number(-operand.number))
+        else:
+            operands.append(Negative(operand))
+        return
+    right = _term(operands.pop())
+    left = operands.pop()
+    if op in ("+", "-"):
+        if op == "-":
+            right = Negative(right)
+        if isinstance(left, list):
+            left.append(right)
+            operands.append(left)
+        else:
+            operands.append([left, right])
+        return
+    left = _term(left)
+    if op == "*":
+        operands.append(Product(left, right))
+    elif op == "/":
+        operands.append(Quotient(left, right))
+    else:
+        operands.append(Power(left, right))
+
+def _precedence(op):
+    return _unary_precedence if op == "neg" else _binary[op][0]
+
+def parse(text):
+    tokens = tokenize(text)
+    operands, operators = [], []
+    # "(" for a parenthesis, or a function name for a function call
+    opening = []
+    # numbers and variables by their text, to skip interning repeated ones
+    leaves = {}
+    expect_operand = True
+    i, count = 0, len(tokens)
+    while i < count:
+        number, name, op, error = tokens[i]
+        i += 1
+        if error:
+            raise ValueError("unexpected character {!r}".format(error))
+        if expect_operand:
+            if number:
+                leaf = leaves.get(number)
+                if leaf is None:
+                    leaf = leaves[number] = _number(number)
+                operands.append(leaf)
+                expect_operand = False
+            elif name and i < count and tokens[i][2] == "(":
+                if name not in _functions:
+                    raise ValueError("unknown function {}".format(name))
+                opening.append((name, len(operators)))
+                i += 1
+            elif name:
+                leaf = leaves.get(name)
+                if leaf is None:
+                    leaf = leaves[name] = Variable(name)
+                operands.append(leaf)
+                expect_operand = False
+            elif op == "(":
+                opening.append(("(", len(operators)))
+            elif op == "-":
+                operators.append("neg")
+            elif op != "+":
+                raise ValueError("expected an operand, found {!r}".format(op))
+        elif op == ")":
+            if not opening:
+                raise ValueError("unbalanced ')'")
+            kind, depth = opening.pop()
+            while len(operators) > depth:
+                _reduce(operators, operands)
+            operands.append(_term(operands.pop()))
+            if kind != "(":
+                operands.append(_functions[kind](operands.pop()))
+        elif op in _binary:
+            precedence, right = _binary[op]
+            floor = opening[-1][1] if opening else 0
+            while len(operators) > floor:
+                top = _precedence(operators[-1])
+                if top > precedence or (top == precedence and not right):
+                    _reduce(operators, operands)
+                else:
+                    break
+            operators.append(op)
+            expect_operand = True
+        else:
+            raise ValueError("expected an operator, found {!r}".format(number or name or op))
+    if expect_operand:
+        raise ValueError("unexpected end of expression")
+    if opening:
+        raise ValueError("unbalanced '('")
+    while operators:
+        _reduce(operators, operands)
+    return _term(operands.pop())
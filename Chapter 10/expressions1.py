@@ -76,7 +76,7 @@ class Sum(Expression):
         return sum([exp.evaluate(**bindings) for exp in self.exps])
     
     def expand(self):
-        return Sum(*[exp.expand for exp in self.exps])
+        return Sum(*[exp.expand() for exp in self.exps])
     
     def _python_expr(self):
         return " + ".join(f"({exp._python_expr()})" for exp in self.exps)
@@ -0,0 +1,80 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+from expressions import *
+
+# Jacobians and Hessians of systems of expressions, with the symbolic
+# derivatives computed on a pool of processes. Entries known to be zero
+# (the expression doesn't contain the variable) are never computed, the
+# Hessian's lower triangle mirrors the upper one, and the matrices are
+# compiled into one function with shared subexpressions computed once.
+# Derivatives are simplified where they're computed, which keeps the
+# Hessian's second pass and the compiled code small.
+
+def _derivatives(exp, vars):
+    # runs in a worker process: all the expression's derivatives for a
+    # chunk of the variables, so they share the worker's caches
+    return [exp.derivative(var).simplify() for var in vars]
+
+def _chunks(items, count):
+    size = max(1, -(-len(items) // count))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def derivative_table(exps, vars_for, processes=None):
+    # {(exp, var): derivative} for each expression and the variables
+    # vars_for(exp) lists; with processes=1 everything runs here instead
+    processes = processes or os.cpu_count() or 1
+    exps = list(dict.fromkeys(exps))
+    # about four tasks per process, so the work stays balanced when
+    # expressions differ in size
+    parts = max(1, -(-4 * processes // max(1, len(exps))))
+    tasks = [(exp, chunk) for exp in exps
+             for chunk in _chunks(vars_for(exp), parts) if chunk]
+    if processes == 1:
+        results = [_derivatives(exp, chunk) for exp, chunk in tasks]
+    else:
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_derivatives, *zip(*tasks))) if tasks else []
+    table = {}
+    for (exp, chunk), derivatives in zip(tasks, results):
+        table.update(((exp, var), d) for var, d in zip(chunk, derivatives))
+    return table
+
+def _contained(exp, vars):
+    # the variables exp depends on, in the order given
+    symbols = distinct_variables(exp)
+    return [v for v in vars if v.symbol in symbols]
+
+def jacobian_matrix(exps, vars, processes=None):
+    # rows of derivatives of each expression with respect to each variable
+    table = derivative_table(exps, lambda exp: _contained(exp, vars), processes)
+    return [[table.get((exp, var), Number(0)) for var in vars] for exp in exps]
+
+def hessian_matrix(exp, vars, processes=None):
+    gradient = jacobian_matrix([exp], vars, processes)[0]
+    # second derivatives for the upper triangle only
+    later = {}
+    for i, g in enumerate(gradient):
+        # equal entries share one set of derivatives, from the first of them
+        later.setdefault(g, _contained(g, vars[i:]))
+    table = derivative_table(gradient, lambda g: later[g], processes)
+    matrix = [[Number(0)] * len(vars) for _ in vars]
+    for i, g in enumerate(gradient):
+        for j in range(i, len(vars)):
+            matrix[i][j] = matrix[j][i] = table.get((g, vars[j]), Number(0))
+    return matrix
+
+def matrix_function(matrix, vars):
+    # one compiled function of the variables returning the matrix as a
+    # NumPy array
+    rows, columns = len(matrix), len(matrix[0]) if matrix else 0
+    f = compile_many([entry for row in matrix for entry in row], [v.symbol for v in vars])
+    def evaluate_matrix(*values):
+        return np.array(f(*values), dtype=float).reshape(rows, columns)
+    return evaluate_matrix
+
+def jacobian(exps, vars, processes=None):
+    return matrix_function(jacobian_matrix(exps, vars, processes), vars)
+
+def hessian(exp, vars, processes=None):
+    return matrix_function(hessian_matrix(exp, vars, processes), vars)
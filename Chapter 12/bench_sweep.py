@@ -0,0 +1,90 @@
+import os
+from math import sqrt, sin, cos, pi
+from timeit import default_timer as timer
+import numpy as np
+from sweep import sweep, vectorized_sweep
+
+# A grid of gradient ascent runs on the notebook's landing_distance: one at
+# a time as in count_ascent_steps, across process pools of increasing size,
+# and vectorized across the configurations.
+# Run from this directory:  python bench_sweep.py
+
+B = 0.001
+C = 0.005
+v = 20
+g = -9.81
+
+def velocity_components(v,theta,phi):
+    vx = v * cos(theta*pi/180) * cos(phi*pi/180)
+    vy = v * cos(theta*pi/180) * sin(phi*pi/180)
+    vz = v * sin(theta*pi/180)
+    return vx,vy,vz
+
+def landing_distance(theta,phi):
+    vx, vy, vz = velocity_components(v, theta, phi)
+    v_xy = sqrt(vx**2 + vy**2)
+    a = (g/2) - B * vx**2 + C * vy**2
+    b = vz
+    landing_time = -b/a
+    landing_distance = v_xy * landing_time
+    return landing_distance
+
+def landing_distances(theta, phi):
+    # the same, on arrays
+    vx = v * np.cos(theta*pi/180) * np.cos(phi*pi/180)
+    vy = v * np.cos(theta*pi/180) * np.sin(phi*pi/180)
+    vz = v * np.sin(theta*pi/180)
+    a = (g/2) - B * vx**2 + C * vy**2
+    return np.sqrt(vx**2 + vy**2) * (-vz / a)
+
+def approx_gradient(f,x0,y0,dx=1e-6):
+    partial_x = (f(x0+dx,y0) - f(x0-dx,y0)) / (2*dx)
+    partial_y = (f(x0,y0+dx) - f(x0,y0-dx)) / (2*dx)
+    return (partial_x,partial_y)
+
+def count_ascent_steps(f,x,y,rate=1,tolerance=1e-6,max_steps=10000):
+    # the notebook's loop, without collecting the points
+    steps = 0
+    grad = approx_gradient(f,x,y)
+    while sqrt(grad[0]**2 + grad[1]**2) > tolerance and steps < max_steps:
+        x += rate * grad[0]
+        y += rate * grad[1]
+        grad = approx_gradient(f,x,y)
+        steps += 1
+    return steps
+
+def bench_sweep(xs, ys, rates, max_steps=2000):
+    configurations = len(xs) * len(ys) * len(rates)
+    print("%d configurations (%d thetas x %d phis x rates %s), at most %d steps"
+          % (configurations, len(xs), len(ys), rates, max_steps))
+    start = timer()
+    loop_steps = np.array([[[count_ascent_steps(landing_distance, x, y, rate, max_steps=max_steps)
+                             for x in xs] for y in ys] for rate in rates])
+    loop_time = timer() - start
+    print("  %-16s %7.2f s" % ("one at a time:", loop_time))
+    results = {}
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = timer()
+        results[processes] = sweep(landing_distance, xs, ys, rates, max_steps=max_steps,
+                                   processes=processes)
+        elapsed = timer() - start
+        label = "%d process%s:" % (processes, "" if processes == 1 else "es")
+        print("  %-16s %7.2f s (%.1fx)" % (label, elapsed, loop_time / elapsed))
+    start = timer()
+    vectorized = vectorized_sweep(landing_distances, xs, ys, rates, max_steps=max_steps)
+    elapsed = timer() - start
+    print("  %-16s %7.2f s (%.1fx)" % ("vectorized:", elapsed, loop_time / elapsed))
+    for result in results.values():
+        assert np.array_equal(result["steps"], loop_steps)
+    # vectorized trig rounds differently, which can change a step count by
+    # one near the tolerance
+    agree = np.mean(np.abs(vectorized["steps"] - loop_steps) <= 1)
+    print("  vectorized step counts within one of the loop's: %.1f%%" % (100 * agree))
+    for i, rate in enumerate(rates):
+        converged = vectorized["converged"][i]
+        print("  rate %-4g converged %5.1f%%, median steps %d"
+              % (rate, 100 * converged.mean(),
+                 np.median(vectorized["steps"][i][converged]) if converged.any() else 0))
+
+if __name__ == "__main__":
+    bench_sweep(np.linspace(1, 89, 20), np.linspace(0, 360, 20), [1, 1.5, 3, 10, 20])
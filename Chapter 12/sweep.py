@@ -0,0 +1,119 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+
+# Gradient ascent from a grid of starting points and rates at once, as in
+# the notebook's count_ascent_steps heatmaps. Every configuration runs the
+# notebook's gradient_ascent_points loop (x += rate * grad, central
+# difference gradients) until the gradient's length is below the
+# tolerance, the point stops being finite, or max_steps steps are taken.
+#
+#   result = vectorized_sweep(f, thetas, phis, [1, 1.5, 3])   # f takes arrays
+#   result = sweep(f, thetas, phis, [1, 1.5, 3])              # any f(x, y)
+#   plt.pcolormesh(result["start_x"][0], result["start_y"][0], result["steps"][0])
+#
+# The result is a dictionary of arrays of shape (len(rates), len(ys),
+# len(xs)), indexed [rate, y, x] like np.meshgrid's output:
+#   start_x, start_y, rate   the configuration
+#   x, y, value              where it ended up, and f there
+#   steps                    the steps taken (count_ascent_steps counts
+#                            points, which is one more)
+#   converged                whether the gradient got below the tolerance
+
+def _grid(xs, ys, rates):
+    rate, start_y, start_x = np.meshgrid(np.asarray(rates, dtype=float),
+                                         np.asarray(ys, dtype=float),
+                                         np.asarray(xs, dtype=float), indexing="ij")
+    return start_x, start_y, rate
+
+def _result(start_x, start_y, rate, x, y, steps, converged, value):
+    shape = start_x.shape
+    return {"start_x": start_x, "start_y": start_y, "rate": rate,
+            "x": x.reshape(shape), "y": y.reshape(shape), "value": value.reshape(shape),
+            "steps": steps.reshape(shape), "converged": converged.reshape(shape)}
+
+def vectorized_sweep(f, xs, ys, rates, tolerance=1e-6, max_steps=10000, ascent=True, dx=1e-6):
+    # for f built from NumPy operations, so f(x, y) works on arrays: each
+    # step evaluates it four times on the arrays of all the configurations
+    # still running
+    start_x, start_y, rate = _grid(xs, ys, rates)
+    x, y, r = start_x.ravel().copy(), start_y.ravel().copy(), rate.ravel()
+    sign = 1 if ascent else -1
+    steps = np.zeros(x.shape, dtype=int)
+    converged = np.zeros(x.shape, dtype=bool)
+    running = np.arange(0, len(x))
+    with np.errstate(all="ignore"):
+        while len(running) > 0:
+            rx, ry = x[running], y[running]
+            gx = (f(rx + dx, ry) - f(rx - dx, ry)) / (2 * dx)
+            gy = (f(rx, ry + dx) - f(rx, ry - dx)) / (2 * dx)
+            norm = np.hypot(gx, gy)
+            done = norm <= tolerance
+            converged[running[done]] = True
+            # stop the ones that converged, diverged, or are out of steps
+            keep = (norm > tolerance) & (steps[running] < max_steps)
+            running, gx, gy = running[keep], gx[keep], gy[keep]
+            x[running] += sign * r[running] * gx
+            y[running] += sign * r[running] * gy
+            steps[running] += 1
+        value = f(x, y)
+    return _result(start_x, start_y, rate, x, y, steps, converged, np.asarray(value, dtype=float))
+
+def _ascend(f, x, y, rate, tolerance, max_steps, sign, dx):
+    # the notebook's loop for one configuration: (x, y, steps, converged)
+    steps = 0
+    while True:
+        gx = (f(x + dx, y) - f(x - dx, y)) / (2 * dx)
+        gy = (f(x, y + dx) - f(x, y - dx)) / (2 * dx)
+        norm = (gx ** 2 + gy ** 2) ** 0.5
+        if norm <= tolerance:
+            return x, y, steps, True
+        # not finite, or out of steps
+        if not norm > tolerance or steps >= max_steps:
+            return x, y, steps, False
+        x += sign * rate * gx
+        y += sign * rate * gy
+        steps += 1
+
+def _ascend_chunk(f, configurations, tolerance, max_steps, sign, dx):
+    # runs in a worker process: a chunk of (x, y, rate) configurations
+    results = []
+    for x, y, rate in configurations:
+        try:
+            end_x, end_y, steps, converged = _ascend(f, x, y, rate, tolerance, max_steps, sign, dx)
+        except (OverflowError, ValueError, ZeroDivisionError):
+            # a math function failed on a diverging point
+            end_x, end_y, steps, converged = float("nan"), float("nan"), 0, False
+        try:
+            value = f(end_x, end_y)
+        except (OverflowError, ValueError, ZeroDivisionError):
+            value = float("nan")
+        results.append((end_x, end_y, steps, converged, value))
+    return results
+
+def sweep(f, xs, ys, rates, tolerance=1e-6, max_steps=10000, ascent=True, dx=1e-6, processes=None):
+    # for any f(x, y) of two numbers, the configurations split across a pool
+    # of processes (f has to be picklable: a function defined at the top
+    # level of a module); with processes=1 everything runs here instead
+    processes = processes or os.cpu_count() or 1
+    start_x, start_y, rate = _grid(xs, ys, rates)
+    configurations = list(zip(start_x.ravel().tolist(), start_y.ravel().tolist(), rate.ravel().tolist()))
+    sign = 1 if ascent else -1
+    # about four chunks per process, each taking every count-th
+    # configuration, so the work stays balanced when some rates or regions
+    # take far more steps than others
+    count = min(4 * processes, len(configurations)) or 1
+    chunks = [configurations[i::count] for i in range(0, count)]
+    settings = (tolerance, max_steps, sign, dx)
+    if processes == 1:
+        parts = [_ascend_chunk(f, chunk, *settings) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(processes) as pool:
+            parts = list(pool.map(_ascend_chunk, [f] * len(chunks), chunks,
+                                  *[[s] * len(chunks) for s in settings]))
+    rows = [None] * len(configurations)
+    for i, part in enumerate(parts):
+        rows[i::count] = part
+    x, y, steps, converged, value = (np.array(column) for column in zip(*rows)) if rows else [np.zeros(0)] * 5
+    return _result(start_x, start_y, rate, x.astype(float), y.astype(float),
+                   steps.astype(int), converged.astype(bool), value.astype(float))
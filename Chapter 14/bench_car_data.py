@@ -0,0 +1,66 @@
+import subprocess
+import sys
+from timeit import default_timer as timer
+
+# Import time and memory of car_data, and a cost function over its listings.
+# Run from this directory:  python bench_car_data.py
+
+def run(code):
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+
+def import_time(module, preload="numpy"):
+    # best of five fresh interpreters: microseconds to import the module
+    # alone and with its imports, with `preload` already imported (the
+    # notebooks import NumPy anyway)
+    best = None
+    for _ in range(0, 5):
+        result = run("import {}; import {}".format(preload, module))
+        for line in result.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                times = (int(fields[0].split()[-1]), int(fields[1]))
+                best = times if best is None else min(best, times)
+    return best
+
+def import_memory(module, preload="numpy"):
+    code = ("import {}, tracemalloc; tracemalloc.start(); import {}; "
+            "print(*tracemalloc.get_traced_memory())").format(preload, module)
+    current, peak = map(int, run(code).stdout.split())
+    return current, peak
+
+def first_use_time(module, name, preload="numpy"):
+    # best of five fresh interpreters: seconds from the start of the import
+    # until `name` can be used
+    code = ("import {}; from timeit import default_timer as timer; start = timer(); "
+            "from {} import {}; print(timer() - start)").format(preload, module, name)
+    return min(float(run(code).stdout) for _ in range(0, 5))
+
+def sum_squared_error(f, cars):
+    return sum((f(c.mileage) - c.price) ** 2 for c in cars)
+
+def bench_import():
+    self_time, total_time = import_time("car_data")
+    current, peak = import_memory("car_data")
+    print("import car_data: %.1f ms (%.1f ms with its imports), %.0f KiB retained, "
+          "%.0f KiB peak" % (self_time / 1000, total_time / 1000, current / 1024, peak / 1024))
+    print("import car_data and load priuses: %.1f ms" % (1000 * first_use_time("car_data", "priuses")))
+
+def bench_cost(repeats=1000):
+    from car_data import priuses
+    a, b = -0.05, 16000
+    start = timer()
+    for _ in range(0, repeats):
+        loop = sum_squared_error(lambda x: a * x + b, priuses)
+    loop_time = (timer() - start) / repeats
+    start = timer()
+    for _ in range(0, repeats):
+        columns = ((a * priuses.mileage + b - priuses.price) ** 2).sum()
+    column_time = (timer() - start) / repeats
+    print("sum of squared errors over %d priuses: Car objects %.1f us, columns %.1f us"
+          % (len(priuses), 1e6 * loop_time, 1e6 * column_time))
+    assert abs(loop - columns) <= 1e-9 * loop
+
+if __name__ == "__main__":
+    bench_import()
+    bench_cost()
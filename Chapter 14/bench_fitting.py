@@ -0,0 +1,105 @@
+from timeit import default_timer as timer
+from math import exp
+import numpy as np
+from vectors import length
+from fitting import fit_line, fit_polynomial, fit_exponential
+
+# Fitting price models to synthetic listings: the closed-form fits in
+# fitting.py against the notebook's gradient descent on a cost function
+# that loops over the rows in Python.
+# Run from this directory:  python bench_fitting.py
+
+def synthetic_listings(n, seed=0):
+    # mileages up to 300,000 and prices around 16000 e^(-6e-6 x)
+    rng = np.random.default_rng(seed)
+    mileage = rng.uniform(0, 300000, n)
+    price = 16000 * np.exp(-6e-6 * mileage) + rng.normal(0, 2000, n)
+    return mileage, price
+
+# from the Chapter 14 notebook
+def sum_squared_error(f,data):
+    squared_errors = [(f(x) - y)**2 for (x,y) in data]
+    return sum(squared_errors)
+
+def secant_slope(f,xmin,xmax):
+    return (f(xmax) - f(xmin)) / (xmax - xmin)
+
+def approx_derivative(f,x,dx=1e-6):
+    return secant_slope(f,x-dx,x+dx)
+
+def approx_gradient(f,x0,y0,dx=1e-6):
+    partial_x = approx_derivative(lambda x:f(x,y0),x0,dx=dx)
+    partial_y = approx_derivative(lambda y:f(x0,y),y0,dx=dx)
+    return (partial_x,partial_y)
+
+def gradient_descent(f,xstart,ystart,tolerance=1e-6):
+    x = xstart
+    y = ystart
+    grad = approx_gradient(f,x,y)
+    while length(grad) > tolerance:
+        x -= 0.01 * grad[0]
+        y -= 0.01 * grad[1]
+        grad = approx_gradient(f,x,y)
+    return x,y
+
+def notebook_line_fit(data):
+    # the notebook's scaled cost for the line a*x + b, normalized by the
+    # number of rows so the same step size works for any amount of data;
+    # returns (a, b) and the number of passes over the data
+    passes = [0]
+    def coefficient_cost(a,b):
+        passes[0] += 1
+        def p(x):
+            return a * x + b
+        return sum_squared_error(p,data)
+    def scaled_cost_function(c,d):
+        return coefficient_cost(0.5*c,50000*d)/1e13 * 615 / len(data)
+    c, d = gradient_descent(scaled_cost_function,0,0)
+    return (0.5*c, 50000*d), passes[0]
+
+def notebook_exponential_fit(data):
+    passes = [0]
+    def exp_coefficient_cost(q,r):
+        passes[0] += 1
+        def f(x):
+            return q*exp(r*x)
+        return sum_squared_error(f,data)
+    def scaled_exp_coefficient_cost(s,t):
+        return exp_coefficient_cost(30000*s,1e-4*t) / 1e11 * 615 / len(data)
+    s, t = gradient_descent(scaled_exp_coefficient_cost,0,0)
+    return (30000*s, 1e-4*t), passes[0]
+
+def timed(f):
+    start = timer()
+    result = f()
+    return timer() - start, result
+
+def bench_fits(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), gradient_descent_limit=10**3,
+               estimate_limit=10**6):
+    # gradient descent is run for up to gradient_descent_limit rows; for
+    # more, its time is estimated from one pass over the data and the number
+    # of passes it took on the largest size it was run on
+    passes = None
+    for n in sizes:
+        mileage, price = synthetic_listings(n)
+        line_time, (a, b) = timed(lambda: fit_line(mileage, price))
+        cubic_time, _ = timed(lambda: fit_polynomial(mileage, price, 3))
+        exp_time, (q, r) = timed(lambda: fit_exponential(mileage, price))
+        result = ("%d rows: line %.1f ms, cubic %.1f ms, exponential %.1f ms"
+                  % (n, 1000*line_time, 1000*cubic_time, 1000*exp_time))
+        if n <= gradient_descent_limit:
+            data = list(zip(mileage.tolist(), price.tolist()))
+            gd_time, ((gd_a, gd_b), passes) = timed(lambda: notebook_line_fit(data))
+            gd_exp_time, ((gd_q, gd_r), exp_passes) = timed(lambda: notebook_exponential_fit(data))
+            result += ("; gradient descent: line %.0f ms (%d passes, a %.4g vs %.4g), "
+                       "exponential %.0f ms (%d passes, r %.4g vs %.4g)"
+                       % (1000*gd_time, passes, gd_a, a, 1000*gd_exp_time, exp_passes, gd_r, r))
+        elif passes is not None and n <= estimate_limit:
+            data = list(zip(mileage.tolist(), price.tolist()))
+            pass_time, _ = timed(lambda: sum_squared_error(lambda x: a * x + b, data))
+            result += ("; gradient descent: about %.0f s for the line, %.0f s for the exponential"
+                       % (passes * pass_time, exp_passes * pass_time))
+        print(result)
+
+if __name__ == "__main__":
+    bench_fits()
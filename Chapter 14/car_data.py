@@ -1,833 +1,41 @@
-raw_priuses = {('toyota', 'prius', 2001.0, 40.0, 1999.0, 89.53669775157407),
- ('toyota', 'prius', 2001.0, 40.0, 1999.0, 92.31864219824074),
- ('toyota', 'prius', 2001.0, 40.0, 2199.0, 95.71655886936342),
- ('toyota', 'prius', 2001.0, 40.0, 2199.0, 97.19503110253473),
- ('toyota', 'prius', 2001.0, 40.0, 2400.0, 102.53253111582175),
- ('toyota', 'prius', 2001.0, 40.0, 2400.0, 104.67419778694445),
- ('toyota', 'prius', 2001.0, 126.0, 4495.0, 0.2762809419791667),
- ('toyota', 'prius', 2001.0, 126.0, 4495.0, 0.27637631777777777),
- ('toyota', 'prius', 2001.0, 250.0, 4990.0, 4.834614272974537),
- ('toyota', 'prius', 2001.0, 59000.0, 2600.0, 8.163780977789353),
- ('toyota', 'prius', 2001.0, 79159.0, 5499.0, 30.97905873259259),
- ('toyota', 'prius', 2001.0, 90805.0, 2999.0, -11.200107826018519),
- ('toyota', 'prius', 2001.0, 96000.0, 3995.0, 159.76794768059028),
- ('toyota', 'prius', 2001.0, 96749.0, 2900.0, 167.7436421294676),
- ('toyota', 'prius', 2001.0, 96952.0, 5999.0, 88.40128098215278),
- ('toyota', 'prius', 2001.0, 100000.0, 4599.0, 36.46100319048611),
- ('toyota', 'prius', 2001.0, 100000.0, 4599.0, 73.96794764224538),
- ('toyota', 'prius', 2001.0, 104142.0, 3995.0, 107.85822543628473),
- ('toyota', 'prius', 2001.0, 119860.0, 2998.0, 209.94503103155094),
- ('toyota', 'prius', 2001.0, 120000.0, 1250.0, 54.32697549592593),
- ('toyota', 'prius', 2001.0, 121000.0, 3000.0, 10.542253220717592),
- ('toyota', 'prius', 2001.0, 121000.0, 3495.0, 108.00822544512731),
- ('toyota', 'prius', 2001.0, 133000.0, 2000.0, 170.7353088005324),
- ('toyota', 'prius', 2001.0, 134143.0, 1995.0, 223.7366977026273),
- ('toyota', 'prius', 2001.0, 146000.0, 2995.0, -94.13621894155092),
- ('toyota', 'prius', 2001.0, 150000.0, 2900.0, 96.37697553820603),
- ('toyota', 'prius', 2001.0, 155000.0, 1000.0, 100.3985033336574),
- ('toyota', 'prius', 2001.0, 155000.0, 2991.0, 119.85544767615741),
- ('toyota', 'prius', 2001.0, 156000.0, 3500.0, 25.382531020543983),
- ('toyota', 'prius', 2001.0, 162517.0, 5990.0, 229.73669770704862),
- ('toyota', 'prius', 2001.0, 163285.0, 4995.0, 20.959614279756945),
- ('toyota', 'prius', 2001.0, 172345.0, 1000.0, 107.86308655181713),
- ('toyota', 'prius', 2001.0, 175299.0, 3995.0, -99.12510783520834),
- ('toyota', 'prius', 2001.0, 175598.0, 2995.0, -106.26052450630787),
- ('toyota', 'prius', 2001.0, 182916.0, 3995.0, 108.01933656067129),
- ('toyota', 'prius', 2001.0, 184000.0, 2499.0, 9.126975433912037),
- ('toyota', 'prius', 2001.0, 187000.0, 2150.0, 58.316558833645836),
- ('toyota', 'prius', 2001.0, 198000.0, 2001.0, 20.475586567280093),
- ('toyota', 'prius', 2001.0, 200000.0, 2001.0, 100.15544777590277),
- ('toyota', 'prius', 2001.0, 201515.0, 1993.0, -115.21260784405092),
- ('toyota', 'prius', 2001.0, 202019.0, 3990.0, 32.96030873921296),
- ('toyota', 'prius', 2001.0, 217000.0, 1600.0, 52.98322549149306),
- ('toyota', 'prius', 2001.0, 219339.0, 2599.0, 175.85197547162036),
- ('toyota', 'prius', 2001.0, 223000.0, 1300.0, 88.29572552716435),
- ('toyota', 'prius', 2001.0, 233000.0, 1499.0, 96.37280887373842),
- ('toyota', 'prius', 2001.0, 337000.0, 1200.0, 98.4297532087037),
- ('toyota', 'prius', 2002.0, 250.0, 3499.0, 77.44226016228009),
- ('toyota', 'prius', 2002.0, 250.0, 3982.0, 83.9873990643287),
- ('toyota', 'prius', 2002.0, 1000.0, 4899.0, 32.992954580439815),
- ('toyota', 'prius', 2002.0, 20000.0, 1200.0, 0.4867045253356482),
- ('toyota', 'prius', 2002.0, 66000.0, 4999.0, 13.263093502199075),
- ('toyota', 'prius', 2002.0, 66000.0, 4999.0, 19.83878787835648),
- ('toyota', 'prius', 2002.0, 70000.0, 4900.0, 101.37489907738426),
- ('toyota', 'prius', 2002.0, 76000.0, 3833.0, 4.878371196388889),
- ('toyota', 'prius', 2002.0, 77000.0, 2232.0, 68.40128793123843),
- ('toyota', 'prius', 2002.0, 80040.0, 4890.0, 98.50476018413194),
- ('toyota', 'prius', 2002.0, 86527.0, 5995.0, 80.84503794883102),
- ('toyota', 'prius', 2002.0, 89000.0, 4900.0, 80.32698238892361),
- ('toyota', 'prius', 2002.0, 108378.0, 3699.0, 21.849204553680554),
- ('toyota', 'prius', 2002.0, 111176.0, 3595.0, 36.38670458914352),
- ('toyota', 'prius', 2002.0, 114520.0, 3690.0, 27.96170456298611),
- ('toyota', 'prius', 2002.0, 117352.0, 3495.0, 30.863787905034723),
- ('toyota', 'prius', 2002.0, 120000.0, 2900.0, 11.23114903142361),
- ('toyota', 'prius', 2002.0, 124315.0, 3791.0, 34.97559347369213),
- ('toyota', 'prius', 2002.0, 132000.0, 3000.0, 59.113093561111114),
- ('toyota', 'prius', 2002.0, 133203.0, 3950.0, 21.889482327141202),
- ('toyota', 'prius', 2002.0, 135000.0, 2300.0, 87.53948246082176),
- ('toyota', 'prius', 2002.0, 136000.0, 1000.0, 1.4505934273726853),
- ('toyota', 'prius', 2002.0, 136000.0, 2500.0, 18.485315741863428),
- ('toyota', 'prius', 2002.0, 139732.0, 3290.0, 59.95892681574074),
- ('toyota', 'prius', 2002.0, 148777.0, 2995.0, 22.96378789195602),
- ('toyota', 'prius', 2002.0, 154000.0, 2490.0, 16.874898985069443),
- ('toyota', 'prius', 2002.0, 157302.0, 4495.0, 30.88462123403935),
- ('toyota', 'prius', 2002.0, 162000.0, 3200.0, 90.49503802072917),
- ('toyota', 'prius', 2002.0, 163000.0, 2200.0, 24.254065757152777),
- ('toyota', 'prius', 2002.0, 163000.0, 2800.0, 6.1610101163425925),
- ('toyota', 'prius', 2002.0, 165000.0, 2002.0, 80.21309356756944),
- ('toyota', 'prius', 2002.0, 165000.0, 3350.0, 82.0915657919676),
- ('toyota', 'prius', 2002.0, 174511.0, 2990.0, 77.4415657134375),
- ('toyota', 'prius', 2002.0, 201028.0, 2500.0, 91.34989906868056),
- ('toyota', 'prius', 2002.0, 201553.0, 2499.0, 31.96309346496528),
- ('toyota', 'prius', 2002.0, 219000.0, 2500.0, 35.00962133013889),
- ('toyota', 'prius', 2002.0, 220000.0, 2900.0, 63.39226022994213),
- ('toyota', 'prius', 2002.0, 262703.0, 3500.0, 11.838093425196758),
- ('toyota', 'prius', 2002.0, 347143.0, 4990.0, 1.8373989674652778),
- ('toyota', 'prius', 2003.0, 6.0, 750.0, -57.21537466505787),
- ('toyota', 'prius', 2003.0, 6.0, 850.0, -91.18204133606481),
- ('toyota', 'prius', 2003.0, 40.0, 1750.0, 61.65406982523148),
- ('toyota', 'prius', 2003.0, 40.0, 2000.0, 50.962403141076386),
- ('toyota', 'prius', 2003.0, 250.0, 4700.0, 166.86170864614584),
- ('toyota', 'prius', 2003.0, 250.0, 5853.0, -50.1341246606713),
- ('toyota', 'prius', 2003.0, 5000.0, 2800.0, 95.29226431130787),
- ('toyota', 'prius', 2003.0, 51068.0, 5800.0, 90.74920867699075),
- ('toyota', 'prius', 2003.0, 51068.0, 5800.0, 93.74643090355325),
- ('toyota', 'prius', 2003.0, 66845.0, 4995.0, 7.9610141816435185),
- ('toyota', 'prius', 2003.0, 85000.0, 4500.0, 12.255458639594908),
- ('toyota', 'prius', 2003.0, 90000.0, 3200.0, 95.88045876224537),
- ('toyota', 'prius', 2003.0, 91000.0, 4100.0, 227.7464308817477),
- ('toyota', 'prius', 2003.0, 102000.0, 1800.0, 96.10962543331019),
- ('toyota', 'prius', 2003.0, 104000.0, 1900.0, 19.562403114918983),
- ('toyota', 'prius', 2003.0, 104144.0, 4481.0, 47.83393085960648),
- ('toyota', 'prius', 2003.0, 110000.0, 3490.0, 63.00198649609953),
- ('toyota', 'prius', 2003.0, 127000.0, 2500.0, 15.49087531931713),
- ('toyota', 'prius', 2003.0, 128759.0, 4999.0, 225.94434753938657),
- ('toyota', 'prius', 2003.0, 139000.0, 1900.0, 89.4096254116088),
- ('toyota', 'prius', 2003.0, 145000.0, 2900.0, 33.11448646787037),
- ('toyota', 'prius', 2003.0, 145000.0, 2900.0, 57.16031981650463),
- ('toyota', 'prius', 2003.0, 145400.0, 2900.0, 54.87768086398148),
- ('toyota', 'prius', 2003.0, 160212.0, 3499.0, 225.96656976591436),
- ('toyota', 'prius', 2003.0, 184000.0, 2499.0, 13.181153088402779),
- ('toyota', 'prius', 2003.0, 184596.0, 4980.0, 14.838791966342592),
- ('toyota', 'prius', 2003.0, 190000.0, 3000.0, 5.2137919618865745),
- ('toyota', 'prius', 2003.0, 198000.0, 2003.0, 52.241569814328706),
- ('toyota', 'prius', 2003.0, 200000.0, 2300.0, 16.38254199068287),
- ('toyota', 'prius', 2003.0, 211000.0, 2500.0, 91.31656985820602),
- ('toyota', 'prius', 2003.0, 220000.0, 1999.0, 73.5186531784375),
- ('toyota', 'prius', 2003.0, 220000.0, 1999.0, 73.52004206949074),
- ('toyota', 'prius', 2003.0, 220000.0, 2499.0, 91.51031986037037),
- ('toyota', 'prius', 2003.0, 220000.0, 2499.0, 91.51240319586806),
- ('toyota', 'prius', 2003.0, 263000.0, 1500.0, 28.440875352372686),
- ('toyota', 'prius', 2003.0, 278000.0, 1900.0, 20.05268089707176),
- ('toyota', 'prius', 2004.0, 45.0, 3900.0, 21.83741018599537),
- ('toyota', 'prius', 2004.0, 250.0, 4671.0, 34.93741021743055),
- ('toyota', 'prius', 2004.0, 500.0, 2700.0, 15.261021337314816),
- ('toyota', 'prius', 2004.0, 4000.0, 4250.0, 21.634632494930557),
- ('toyota', 'prius', 2004.0, 5000.0, 3500.0, 18.374215805914353),
- ('toyota', 'prius', 2004.0, 27000.0, 4999.0, 32.972826875347224),
- ('toyota', 'prius', 2004.0, 54619.0, 6587.0, 11.849910155462963),
- ('toyota', 'prius', 2004.0, 66000.0, 7799.0, -0.024395448912037036),
- ('toyota', 'prius', 2004.0, 66000.0, 8589.0, 11.961021262210648),
- ('toyota', 'prius', 2004.0, 76000.0, 6999.0, 14.965187941944444),
- ('toyota', 'prius', 2004.0, 77000.0, 8475.0, 12.961715715381944),
- ('toyota', 'prius', 2004.0, 88000.0, 2500.0, 13.43949354417824),
- ('toyota', 'prius', 2004.0, 100732.0, 5490.0, 31.961715759791666),
- ('toyota', 'prius', 2004.0, 101000.0, 3800.0, 21.427688048275463),
- ('toyota', 'prius', 2004.0, 102690.0, 4990.0, 8.886715684826388),
- ('toyota', 'prius', 2004.0, 103255.0, 5995.0, 34.838799101921296),
- ('toyota', 'prius', 2004.0, 106444.0, 5990.0, 10.843660133634259),
- ('toyota', 'prius', 2004.0, 120650.0, 5600.0, 16.294354686087964),
- ('toyota', 'prius', 2004.0, 138000.0, 7999.0, 30.840882421689816),
- ('toyota', 'prius', 2004.0, 157000.0, 2650.0, 20.33324360125),
- ('toyota', 'prius', 2004.0, 160000.0, 3500.0, 8.10616016199074),
- ('toyota', 'prius', 2004.0, 160141.0, 5995.0, 18.834632399467594),
- ('toyota', 'prius', 2004.0, 161673.0, 8988.0, 11.958937920185186),
- ('toyota', 'prius', 2004.0, 166742.0, 3491.0, 25.969354639560184),
- ('toyota', 'prius', 2004.0, 181510.0, 4969.0, 23.992965745925925),
- ('toyota', 'prius', 2004.0, 186757.0, 3995.0, 11.833937924502315),
- ('toyota', 'prius', 2004.0, 188000.0, 3000.0, 9.529076832997685),
- ('toyota', 'prius', 2004.0, 194573.0, 4995.0, 15.879076839560184),
- ('toyota', 'prius', 2004.0, 214000.0, 3000.0, 17.32768802375),
- ('toyota', 'prius', 2004.0, 218704.0, 3488.0, 4.984632342743056),
- ('toyota', 'prius', 2004.0, 220000.0, 3999.0, 5.084632353680556),
- ('toyota', 'prius', 2004.0, 224000.0, 1500.0, 17.997826914814816),
- ('toyota', 'prius', 2004.0, 224930.0, 2995.0, 10.904076804699073),
- ('toyota', 'prius', 2004.0, 227169.0, 4900.0, 15.878382390740741),
- ('toyota', 'prius', 2004.0, 245224.0, 2479.0, 18.909632403842593),
- ('toyota', 'prius', 2004.0, 254867.0, 4947.0, 2.8360212246064815),
- ('toyota', 'prius', 2004.0, 262920.0, 2997.0, 8.8790767915625),
- ('toyota', 'prius', 2005.0, 250.0, 4694.0, -0.1653632596527778),
- ('toyota', 'prius', 2005.0, 992.0, 6999.0, 0.9853312001967592),
- ('toyota', 'prius', 2005.0, 6000.0, 4990.0, 2.8957478875),
- ('toyota', 'prius', 2005.0, 24000.0, 7786.0, 6.877692392430555),
- ('toyota', 'prius', 2005.0, 71333.0, 10500.0, 5.970053483287037),
- ('toyota', 'prius', 2005.0, 74657.0, 4995.0, 5.8332479071875),
- ('toyota', 'prius', 2005.0, 84000.0, 7000.0, 4.556164650011574),
- ('toyota', 'prius', 2005.0, 88000.0, 7599.0, 8.981164641319445),
- ('toyota', 'prius', 2005.0, 95000.0, 6500.0, 5.218664680821759),
- ('toyota', 'prius', 2005.0, 96610.0, 7500.0, 5.961720136412037),
- ('toyota', 'prius', 2005.0, 107542.0, 4995.0, 10.959636870069444),
- ('toyota', 'prius', 2005.0, 112000.0, 4699.0, 7.535331371574074),
- ('toyota', 'prius', 2005.0, 118000.0, 6000.0, 0.4526923210763889),
- ('toyota', 'prius', 2005.0, 118000.0, 6000.0, 0.4527652905671296),
- ('toyota', 'prius', 2005.0, 121000.0, 4981.0, 0.9624145258449074),
- ('toyota', 'prius', 2005.0, 123349.0, 5800.0, 3.883942338460648),
- ('toyota', 'prius', 2005.0, 128063.0, 5400.0, 10.85685911207176),
- ('toyota', 'prius', 2005.0, 135750.0, 5555.0, 10.836025765497686),
- ('toyota', 'prius', 2005.0, 136000.0, 4200.0, 1.2269978962037038),
- ('toyota', 'prius', 2005.0, 137000.0, 4000.0, 1.9207479093518518),
- ('toyota', 'prius', 2005.0, 142000.0, 4000.0, 9.883248055717592),
- ('toyota', 'prius', 2005.0, 142808.0, 4990.0, 8.963109079189815),
- ('toyota', 'prius', 2005.0, 145000.0, 5000.0, 1.0332478896643518),
- ('toyota', 'prius', 2005.0, 147838.0, 6990.0, 2.9728312143055557),
- ('toyota', 'prius', 2005.0, 152000.0, 4499.0, 4.577692434398148),
- ('toyota', 'prius', 2005.0, 155000.0, 5450.0, 3.5422757349189813),
- ('toyota', 'prius', 2005.0, 159684.0, 4981.0, 10.86658134085648),
- ('toyota', 'prius', 2005.0, 162000.0, 4900.0, 9.371442498020834),
- ('toyota', 'prius', 2005.0, 164570.0, 4488.0, 5.897136823668982),
- ('toyota', 'prius', 2005.0, 170000.0, 4200.0, 4.636025774351852),
- ('toyota', 'prius', 2005.0, 171783.0, 4000.0, 7.855470183738426),
- ('toyota', 'prius', 2005.0, 172667.0, 3000.0, 10.836025772164351),
- ('toyota', 'prius', 2005.0, 174080.0, 3179.0, 3.857553456122685),
- ('toyota', 'prius', 2005.0, 176031.0, 6995.0, 1.970053429988426),
- ('toyota', 'prius', 2005.0, 179000.0, 3995.0, 4.656164669780092),
- ('toyota', 'prius', 2005.0, 183000.0, 3800.0, 5.491581356203704),
- ('toyota', 'prius', 2005.0, 184000.0, 3500.0, 2.2825534788541666),
- ('toyota', 'prius', 2005.0, 184290.0, 3995.0, -0.12369660094907407),
- ('toyota', 'prius', 2005.0, 204000.0, 1200.0, 7.092275813819445),
- ('toyota', 'prius', 2005.0, 204000.0, 1800.0, 7.0922758116435185),
- ('toyota', 'prius', 2005.0, 204000.0, 1900.0, 7.092275809490741),
- ('toyota', 'prius', 2005.0, 204000.0, 3300.0, 10.608942504490741),
- ('toyota', 'prius', 2005.0, 204000.0, 3500.0, 2.338803472199074),
- ('toyota', 'prius', 2005.0, 215357.0, 2995.0, 5.838109032210649),
- ('toyota', 'prius', 2005.0, 217000.0, 3800.0, 4.417275754606481),
- ('toyota', 'prius', 2005.0, 250000.0, 2500.0, 3.5394979637152777),
- ('toyota', 'prius', 2005.0, 265128.0, 2459.0, 6.878386843414352),
- ('toyota', 'prius', 2006.0, 5.0, 4200.0, 3.425616320196759),
- ('toyota', 'prius', 2006.0, 24000.0, 5500.0, -0.15702262357638888),
- ('toyota', 'prius', 2006.0, 32000.0, 6459.0, -0.14521705452546296),
- ('toyota', 'prius', 2006.0, 64000.0, 5799.0, 3.8922830155787036),
- ('toyota', 'prius', 2006.0, 66013.0, 6495.0, 3.842977455671296),
- ('toyota', 'prius', 2006.0, 75265.0, 7499.0, 1.8374218539930556),
- ('toyota', 'prius', 2006.0, 76000.0, 8995.0, 2.9172829847106483),
- ('toyota', 'prius', 2006.0, 76377.0, 8491.0, 2.9631163223958334),
- ('toyota', 'prius', 2006.0, 83132.0, 7900.0, 5.878394148657407),
- ('toyota', 'prius', 2006.0, 85000.0, 6995.0, 11.343671958368056),
- ('toyota', 'prius', 2006.0, 88000.0, 3850.0, 4.571449671319445),
- ('toyota', 'prius', 2006.0, 88000.0, 3850.0, 5.542283030810185),
- ('toyota', 'prius', 2006.0, 91175.0, 7300.0, 2.0006163049421297),
- ('toyota', 'prius', 2006.0, 94000.0, 4100.0, 90.1679774269676),
- ('toyota', 'prius', 2006.0, 110000.0, 6000.0, 3.4839496470370372),
- ('toyota', 'prius', 2006.0, 113000.0, 4400.0, 8.287421947337963),
- ('toyota', 'prius', 2006.0, 116000.0, 4500.0, 12.258255298252315),
- ('toyota', 'prius', 2006.0, 123216.0, 6482.0, 3.9665885624421295),
- ('toyota', 'prius', 2006.0, 129220.0, 6000.0, 3.878394113263889),
- ('toyota', 'prius', 2006.0, 141000.0, 4000.0, 7.971449719988426),
- ('toyota', 'prius', 2006.0, 141570.0, 5481.0, 0.8790885075810185),
- ('toyota', 'prius', 2006.0, 144000.0, 5499.0, 15.528394206782407),
- ('toyota', 'prius', 2006.0, 144458.0, 6499.0, 4.958949686608796),
- ('toyota', 'prius', 2006.0, 145000.0, 1000.0, 7.480477495138889),
- ('toyota', 'prius', 2006.0, 157000.0, 4495.0, 0.988116254212963),
- ('toyota', 'prius', 2006.0, 157000.0, 4495.0, 0.9915884830787037),
- ('toyota', 'prius', 2006.0, 160006.0, 4995.0, 2.8332552004166667),
- ('toyota', 'prius', 2006.0, 170035.0, 4000.0, -0.025078172349537037),
- ('toyota', 'prius', 2006.0, 174381.0, 5995.0, 3.8776996601157405),
- ('toyota', 'prius', 2006.0, 177000.0, 2900.0, 5.2672830134027775),
- ('toyota', 'prius', 2006.0, 177000.0, 3700.0, 7.361727488680556),
- ('toyota', 'prius', 2006.0, 184485.0, 7991.0, 5.8832552642939815),
- ('toyota', 'prius', 2006.0, 186000.0, 2950.0, 7.391588604085648),
- ('toyota', 'prius', 2006.0, 186341.0, 3950.0, 4.877699691006945),
- ('toyota', 'prius', 2006.0, 195185.0, 5999.0, 0.9631162918981482),
- ('toyota', 'prius', 2006.0, 198000.0, 3490.0, 4.301310773414352),
- ('toyota', 'prius', 2006.0, 205000.0, 2300.0, 2.0443662809837964),
- ('toyota', 'prius', 2006.0, 212768.0, 2995.0, -0.16396707466435184),
- ('toyota', 'prius', 2006.0, 220000.0, 2000.0, 2.9221440718402776),
- ('toyota', 'prius', 2006.0, 226786.0, 3495.0, -0.1646615258912037),
- ('toyota', 'prius', 2006.0, 229117.0, 3599.0, 5.958949699664352),
- ('toyota', 'prius', 2006.0, 263000.0, 2800.0, 10.350616398414353),
- ('toyota', 'prius', 2006.0, 270000.0, 3100.0, 5.863116379722222),
- ('toyota', 'prius', 2006.0, 292000.0, 2000.0, 0.9700607119444444),
- ('toyota', 'prius', 2007.0, 50.0, 3500.0, 1.256177854074074),
- ('toyota', 'prius', 2007.0, 50.0, 3500.0, 1.3006223053935184),
- ('toyota', 'prius', 2007.0, 200.0, 4499.0, 7.204789126296296),
- ('toyota', 'prius', 2007.0, 250.0, 4980.0, 1.836733454513889),
- ('toyota', 'prius', 2007.0, 250.0, 6993.0, -0.1070165856712963),
- ('toyota', 'prius', 2007.0, 4000.0, 2100.0, 7.10131690193287),
- ('toyota', 'prius', 2007.0, 8000.0, 6489.0, 2.8832612743055557),
- ('toyota', 'prius', 2007.0, 22000.0, 5900.0, -0.019516572453703702),
- ('toyota', 'prius', 2007.0, 26000.0, 5750.0, 0.8659001137152778),
- ('toyota', 'prius', 2007.0, 29000.0, 5875.0, -0.12298884452546296),
- ('toyota', 'prius', 2007.0, 29276.0, 8990.0, 2.8388168255439816),
- ('toyota', 'prius', 2007.0, 55000.0, 7136.0, -0.12159994194444444),
- ('toyota', 'prius', 2007.0, 62000.0, 7000.0, 33.38812232726852),
- ('toyota', 'prius', 2007.0, 67517.0, 7545.0, 1.8457612461574073),
- ('toyota', 'prius', 2007.0, 68000.0, 5000.0, 1.284650068599537),
- ('toyota', 'prius', 2007.0, 91000.0, 11500.0, 2.9874279541782407),
- ('toyota', 'prius', 2007.0, 93197.0, 7300.0, -0.15076659289351851),
- ('toyota', 'prius', 2007.0, 93785.0, 7508.0, -0.03757215625),
- ('toyota', 'prius', 2007.0, 94000.0, 4400.0, 1.494372318599537),
- ('toyota', 'prius', 2007.0, 94000.0, 4400.0, 1.496455658449074),
- ('toyota', 'prius', 2007.0, 102381.0, 5699.0, 0.8520112183217593),
- ('toyota', 'prius', 2007.0, 103000.0, 7499.0, 2.845761283136574),
- ('toyota', 'prius', 2007.0, 110000.0, 5900.0, 4.340900187627315),
- ('toyota', 'prius', 2007.0, 116385.0, 6497.0, 3.8763168473842593),
- ('toyota', 'prius', 2007.0, 117005.0, 6521.0, 2.886733500960648),
- ('toyota', 'prius', 2007.0, 122000.0, 4400.0, 6.310344668946759),
- ('toyota', 'prius', 2007.0, 123000.0, 3200.0, 73.83603893106482),
- ('toyota', 'prius', 2007.0, 124314.0, 6676.0, -0.023683245775462963),
- ('toyota', 'prius', 2007.0, 125637.0, 6981.0, -0.03896105972222222),
- ('toyota', 'prius', 2007.0, 127000.0, 5700.0, 6.492983559965277),
- ('toyota', 'prius', 2007.0, 130548.0, 6359.0, 2.8346501480555557),
- ('toyota', 'prius', 2007.0, 134816.0, 6950.0, 0.8381223229282407),
- ('toyota', 'prius', 2007.0, 140073.0, 6995.0, -0.039655517951388886),
- ('toyota', 'prius', 2007.0, 156496.0, 6000.0, 1.8790945729282407),
- ('toyota', 'prius', 2007.0, 165675.0, 2497.0, 2.8804834878703702),
- ('toyota', 'prius', 2007.0, 167000.0, 5000.0, 2.0547890125925927),
- ('toyota', 'prius', 2007.0, 170000.0, 4995.0, 4.021455725405093),
- ('toyota', 'prius', 2007.0, 186000.0, 4500.0, 7.286733575081018),
- ('toyota', 'prius', 2007.0, 194000.0, 4900.0, 5.115900196319444),
- ('toyota', 'prius', 2007.0, 208000.0, 4600.0, 5.112427971956018),
- ('toyota', 'prius', 2007.0, 215191.0, 3000.0, 1.8617334748842593),
- ('toyota', 'prius', 2007.0, 224000.0, 2000.0, 7.078400233101852),
- ('toyota', 'prius', 2007.0, 236080.0, 2995.0, 3.8770112965625),
- ('toyota', 'prius', 2007.0, 251000.0, 1800.0, 6.2082613334722225),
- ('toyota', 'prius', 2007.0, 284000.0, 4800.0, 6.086733544814815),
- ('toyota', 'prius', 2007.0, 300000.0, 5000.0, 3.0589557057638888),
- ('toyota', 'prius', 2008.0, 30.0, 6000.0, 4.878408885763889),
- ('toyota', 'prius', 2008.0, 30.0, 6200.0, 4.880492225150463),
- ('toyota', 'prius', 2008.0, 30.0, 9995.0, -0.04034119818287037),
- ('toyota', 'prius', 2008.0, 49.0, 4600.0, 5.378408953217592),
- ('toyota', 'prius', 2008.0, 50.0, 3000.0, 0.4582699546759259),
- ('toyota', 'prius', 2008.0, 50.0, 5700.0, 0.22840882361111112),
- ('toyota', 'prius', 2008.0, 50.0, 5700.0, 0.22845971967592593),
- ('toyota', 'prius', 2008.0, 250.0, 5400.0, 4.9756311273263885),
- ('toyota', 'prius', 2008.0, 250.0, 6485.0, 4.881186674074074),
- ('toyota', 'prius', 2008.0, 250.0, 6989.0, 3.9179921973032408),
- ('toyota', 'prius', 2008.0, 250.0, 8363.0, -0.1236745382175926),
- ('toyota', 'prius', 2008.0, 22000.0, 7364.0, -0.16256341385416667),
- ('toyota', 'prius', 2008.0, 23000.0, 8995.0, 0.8506310436689815),
- ('toyota', 'prius', 2008.0, 24000.0, 6200.0, 2.2506311058101853),
- ('toyota', 'prius', 2008.0, 24000.0, 6200.0, 2.8610477484837964),
- ('toyota', 'prius', 2008.0, 31000.0, 8991.0, -0.03548007395833333),
- ('toyota', 'prius', 2008.0, 44000.0, 5600.0, 0.8596588298842592),
- ('toyota', 'prius', 2008.0, 50000.0, 5800.0, 4.575631157974537),
- ('toyota', 'prius', 2008.0, 63368.0, 7848.0, 2.8916032996759258),
- ('toyota', 'prius', 2008.0, 63459.0, 7495.0, 5.917297802789352),
- ('toyota', 'prius', 2008.0, 64431.0, 9788.0, 2.9214644012731483),
- ('toyota', 'prius', 2008.0, 72000.0, 6900.0, 2.4145200140046295),
- ('toyota', 'prius', 2008.0, 72000.0, 6900.0, 2.414520018402778),
- ('toyota', 'prius', 2008.0, 76000.0, 6400.0, 3.5881311470486112),
- ('toyota', 'prius', 2008.0, 84000.0, 8000.0, 7.115908972164352),
- ('toyota', 'prius', 2008.0, 110000.0, 6000.0, 1.3318810840162036),
- ('toyota', 'prius', 2008.0, 113000.0, 5999.0, 5.438825615474537),
- ('toyota', 'prius', 2008.0, 113431.0, 7788.0, 4.9943811317361115),
- ('toyota', 'prius', 2008.0, 115000.0, 4400.0, -0.20006342479166667),
- ('toyota', 'prius', 2008.0, 115000.0, 4400.0, -0.20001266091435185),
- ('toyota', 'prius', 2008.0, 115000.0, 4400.0, 0.8172977375347222),
- ('toyota', 'prius', 2008.0, 120000.0, 5000.0, 1.3853533106018519),
- ('toyota', 'prius', 2008.0, 122454.0, 6800.0, 3.878408872696759),
- ('toyota', 'prius', 2008.0, 129238.0, 6488.0, 0.8652143925231481),
- ('toyota', 'prius', 2008.0, 130000.0, 5000.0, 2.0277144260532407),
- ('toyota', 'prius', 2008.0, 131809.0, 6499.0, 4.835353325856482),
- ('toyota', 'prius', 2008.0, 136000.0, 5500.0, 2.3172977784027777),
- ('toyota', 'prius', 2008.0, 141725.0, 4720.0, 3.845769988171296),
- ('toyota', 'prius', 2008.0, 158681.0, 5288.0, 2.849242184189815),
- ('toyota', 'prius', 2008.0, 160000.0, 4000.0, 2.0534088748842594),
- ('toyota', 'prius', 2008.0, 165025.0, 4750.0, 2.8374366191550924),
- ('toyota', 'prius', 2008.0, 180100.0, 5222.0, 3.8770199794328706),
- ('toyota', 'prius', 2008.0, 189000.0, 4500.0, 4.877020051226852),
- ('toyota', 'prius', 2008.0, 193093.0, 3950.0, 4.886047789594907),
- ('toyota', 'prius', 2008.0, 231000.0, 1500.0, 5.490214506539352),
- ('toyota', 'prius', 2008.0, 265914.0, 7991.0, 5.881186696006944),
- ('toyota', 'prius', 2009.0, 30.0, 4600.0, 1.8804965307175925),
- ('toyota', 'prius', 2009.0, 30.0, 4693.0, 3.876329949571759),
- ('toyota', 'prius', 2009.0, 30.0, 5931.0, 2.860357723009259),
- ('toyota', 'prius', 2009.0, 30.0, 5995.0, 2.881191043298611),
- ('toyota', 'prius', 2009.0, 30.0, 6212.0, 1.8374409423148148),
- ('toyota', 'prius', 2009.0, 30.0, 7795.0, 2.838135474710648),
- ('toyota', 'prius', 2009.0, 30.0, 7890.0, -0.1611701951273148),
- ('toyota', 'prius', 2009.0, 30.0, 7995.0, -0.029920188032407407),
- ('toyota', 'prius', 2009.0, 30.0, 8850.0, 2.9652188254050924),
- ('toyota', 'prius', 2009.0, 40.0, 7981.0, -0.03894798013888889),
- ('toyota', 'prius', 2009.0, 20000.0, 5995.0, 1.8381354088078703),
- ('toyota', 'prius', 2009.0, 32000.0, 7993.0, 1.8513298835300926),
- ('toyota', 'prius', 2009.0, 35000.0, 7496.0, 0.9457742633796297),
- ('toyota', 'prius', 2009.0, 65000.0, 8058.0, 2.931191052002315),
- ('toyota', 'prius', 2009.0, 72000.0, 6950.0, 4.436052128275463),
- ('toyota', 'prius', 2009.0, 73000.0, 6500.0, 3.4756354483796295),
- ('toyota', 'prius', 2009.0, 79000.0, 8995.0, -0.1236702132175926),
- ('toyota', 'prius', 2009.0, 86788.0, 8450.0, 1.8554965573032407),
- ('toyota', 'prius', 2009.0, 93000.0, 6800.0, 11.446468885081018),
- ('toyota', 'prius', 2009.0, 96000.0, 13991.0, 2.9603576925462964),
- ('toyota', 'prius', 2009.0, 99000.0, 2800.0, 12.129107779270834),
- ('toyota', 'prius', 2009.0, 104000.0, 7895.0, 2.874941008310185),
- ('toyota', 'prius', 2009.0, 107000.0, 4650.0, 12.324246670532407),
- ('toyota', 'prius', 2009.0, 107000.0, 4650.0, 14.464524466909722),
- ('toyota', 'prius', 2009.0, 108000.0, 4650.0, 4.345079899386574),
- ('toyota', 'prius', 2009.0, 114000.0, 6500.0, 8.111052178796296),
- ('toyota', 'prius', 2009.0, 116000.0, 4700.0, 7.193691065011574),
- ('toyota', 'prius', 2009.0, 119000.0, 5490.0, 9.190218858530093),
- ('toyota', 'prius', 2009.0, 128004.0, 7190.0, 1.8374409556597222),
- ('toyota', 'prius', 2009.0, 136823.0, 7990.0, 2.95966324375),
- ('toyota', 'prius', 2009.0, 142334.0, 6375.0, 1.9679965421412038),
- ('toyota', 'prius', 2009.0, 144315.0, 5995.0, 2.838135483425926),
- ('toyota', 'prius', 2009.0, 149000.0, 5550.0, 11.477024438171297),
- ('toyota', 'prius', 2009.0, 150000.0, 6000.0, 5.228413254652778),
- ('toyota', 'prius', 2009.0, 152802.0, 5700.0, 2.9596632371875),
- ('toyota', 'prius', 2009.0, 155000.0, 2000.0, -42.5320035599537),
- ('toyota', 'prius', 2009.0, 155000.0, 2000.0, 6.678413149988426),
- ('toyota', 'prius', 2009.0, 155000.0, 2075.0, -29.10839242699074),
- ('toyota', 'prius', 2009.0, 155000.0, 2125.0, -7.3236701904050925),
- ('toyota', 'prius', 2009.0, 162982.0, 6000.0, -0.16533690172453705),
- ('toyota', 'prius', 2009.0, 214711.0, 4830.0, 2.8381354790625),
- ('toyota', 'prius', 2009.0, 320000.0, 2500.0, 1.5353576249189815),
- ('toyota', 'prius', 2010.0, 9.0, 11995.0, 4.256890876284722),
- ('toyota', 'prius', 2010.0, 20.0, 7500.0, 4.127029754259259),
- ('toyota', 'prius', 2010.0, 250.0, 8920.0, -0.12435931157407408),
- ('toyota', 'prius', 2010.0, 250.0, 8920.0, -0.12431820692129629),
- ('toyota', 'prius', 2010.0, 250.0, 12999.0, -0.03894255113425926),
- ('toyota', 'prius', 2010.0, 4000.0, 4950.0, 3.2777241877430554),
- ('toyota', 'prius', 2010.0, 6000.0, 12498.0, -0.03963704371527778),
- ('toyota', 'prius', 2010.0, 15000.0, 10990.0, -0.03685916532407407),
- ('toyota', 'prius', 2010.0, 25000.0, 10000.0, -0.16533151025462964),
- ('toyota', 'prius', 2010.0, 33693.0, 12951.0, -0.1639425712962963),
- ('toyota', 'prius', 2010.0, 37000.0, 11500.0, 28.172862899976852),
- ('toyota', 'prius', 2010.0, 37000.0, 11991.0, -0.03824809355324074),
- ('toyota', 'prius', 2010.0, 63000.0, 10995.0, -0.16324807386574075),
- ('toyota', 'prius', 2010.0, 77231.0, 13599.0, -0.16116471425925927),
- ('toyota', 'prius', 2010.0, 78581.0, 9985.0, -0.16394255773148148),
- ('toyota', 'prius', 2010.0, 80000.0, 9499.0, 0.22911291326388888),
- ('toyota', 'prius', 2010.0, 80000.0, 9499.0, 0.2291541663773148),
- ('toyota', 'prius', 2010.0, 82228.0, 10920.0, -0.03894256458333333),
- ('toyota', 'prius', 2010.0, 84772.0, 9995.0, -0.04102599537037037),
- ('toyota', 'prius', 2010.0, 84772.0, 9995.0, -0.04098490688657407),
- ('toyota', 'prius', 2010.0, 99688.0, 10200.0, -0.1632480804050926),
- ('toyota', 'prius', 2010.0, 105000.0, 8500.0, 0.9777240698148149),
- ('toyota', 'prius', 2010.0, 105984.0, 6993.0, -0.1646370225),
- ('toyota', 'prius', 2010.0, 106124.0, 10998.0, -0.08130371763888888),
- ('toyota', 'prius', 2010.0, 113000.0, 7995.0, 1.9534185949768519),
- ('toyota', 'prius', 2010.0, 113299.0, 9991.0, -0.12088695621527777),
- ('toyota', 'prius', 2010.0, 117000.0, 7500.0, 1.1110574102893518),
- ('toyota', 'prius', 2010.0, 117758.0, 9925.0, -0.03755361631944444),
- ('toyota', 'prius', 2010.0, 121000.0, 9999.0, -0.12297036282407407),
- ('toyota', 'prius', 2010.0, 128183.0, 9992.0, -0.1646370582523148),
- ('toyota', 'prius', 2010.0, 129975.0, 7904.0, -0.16602598623842593),
- ('toyota', 'prius', 2010.0, 129975.0, 7904.0, -0.16598489660879628),
- ('toyota', 'prius', 2010.0, 130000.0, 7250.0, 0.5700851663773148),
- ('toyota', 'prius', 2010.0, 130000.0, 7250.0, 0.5701264357638889),
- ('toyota', 'prius', 2010.0, 134077.0, 7491.0, -0.16324808694444445),
- ('toyota', 'prius', 2010.0, 135000.0, 6995.0, 21.761751930520834),
- ('toyota', 'prius', 2010.0, 147897.0, 9990.0, -0.16602596247685186),
- ('toyota', 'prius', 2010.0, 147897.0, 9990.0, -0.16598473640046296),
- ('toyota', 'prius', 2010.0, 148000.0, 6999.0, 1.2013352087152778),
- ('toyota', 'prius', 2010.0, 148000.0, 7500.0, 4.206890869722222),
- ('toyota', 'prius', 2010.0, 149000.0, 6999.0, 1.2186963265393518),
- ('toyota', 'prius', 2010.0, 153000.0, 6950.0, 4.410363100671296),
- ('toyota', 'prius', 2010.0, 184000.0, 6000.0, 5.161057558263889),
- ('toyota', 'prius', 2010.0, 195000.0, 4750.0, -0.04241487247685185),
- ('toyota', 'prius', 2010.0, 195000.0, 4750.0, -0.042373737766203706),
- ('toyota', 'prius', 2010.0, 204000.0, 4900.0, 1.1534185353009259),
- ('toyota', 'prius', 2010.0, 211359.0, 6001.0, -0.038942544537037035),
- ('toyota', 'prius', 2010.0, 228731.0, 6995.0, -0.03963703642361111),
- ('toyota', 'prius', 2011.0, 2.0, 8488.0, -0.06463367425925926),
- ('toyota', 'prius', 2011.0, 250.0, 5995.0, -0.1424114389699074),
- ('toyota', 'prius', 2011.0, 250.0, 6291.0, -0.021578114340277777),
- ('toyota', 'prius', 2011.0, 250.0, 8398.0, -0.16393927357638888),
- ('toyota', 'prius', 2011.0, 250.0, 10785.0, -0.0382448158912037),
- ('toyota', 'prius', 2011.0, 5000.0, 11203.0, -0.0396337356712963),
- ('toyota', 'prius', 2011.0, 26000.0, 9998.0, -0.15699480275462963),
- ('toyota', 'prius', 2011.0, 39000.0, 10849.0, -0.16532819619212963),
- ('toyota', 'prius', 2011.0, 40000.0, 10574.0, -0.07227257614583334),
- ('toyota', 'prius', 2011.0, 43000.0, 12500.0, 6.458977412939815),
- ('toyota', 'prius', 2011.0, 50528.0, 10990.0, -0.16116147377314816),
- ('toyota', 'prius', 2011.0, 51000.0, 12987.0, -0.14310588775462962),
- ('toyota', 'prius', 2011.0, 68021.0, 9985.0, -0.03893926920138889),
- ('toyota', 'prius', 2011.0, 71085.0, 14998.0, -0.1243559943287037),
- ('toyota', 'prius', 2011.0, 71085.0, 14998.0, -0.12431808934027777),
- ('toyota', 'prius', 2011.0, 76575.0, 12998.0, -0.12296706458333333),
- ('toyota', 'prius', 2011.0, 77336.0, 12599.0, -0.15352257177083334),
- ('toyota', 'prius', 2011.0, 79000.0, 10500.0, 13.002033061030092),
- ('toyota', 'prius', 2011.0, 82094.0, 9981.0, -0.03893927798611111),
- ('toyota', 'prius', 2011.0, 90687.0, 10395.0, -0.16602264722222224),
- ('toyota', 'prius', 2011.0, 92972.0, 10950.0, -0.16324482033564816),
- ('toyota', 'prius', 2011.0, 97077.0, 10998.0, -0.12435598758101851),
- ('toyota', 'prius', 2011.0, 98000.0, 8995.0, 2.4041162665625),
- ('toyota', 'prius', 2011.0, 114000.0, 8295.0, 0.9686995771990741),
- ('toyota', 'prius', 2011.0, 114000.0, 8295.0, 0.9721718060069444),
- ('toyota', 'prius', 2011.0, 115284.0, 8650.0, -0.16532818954861112),
- ('toyota', 'prius', 2011.0, 122000.0, 7900.0, 12.394394163402778),
- ('toyota', 'prius', 2011.0, 126000.0, 9500.0, 2.463144048715278),
- ('toyota', 'prius', 2011.0, 128490.0, 8391.0, -0.16463372684027777),
- ('toyota', 'prius', 2011.0, 130000.0, 6900.0, 12.247866383460648),
- ('toyota', 'prius', 2011.0, 132000.0, 8295.0, -0.1535225674537037),
- ('toyota', 'prius', 2011.0, 132000.0, 8850.0, 2.21453292875),
- ('toyota', 'prius', 2011.0, 151105.0, 7995.0, -0.16255036700231482),
- ('toyota', 'prius', 2011.0, 159179.0, 7995.0, -0.1236615179050926),
- ('toyota', 'prius', 2011.0, 170000.0, 4500.0, 3.339532950833333),
- ('toyota', 'prius', 2011.0, 170000.0, 4800.0, 6.477032972847222),
- ('toyota', 'prius', 2011.0, 195000.0, 4000.0, 11.645783033773148),
- ('toyota', 'prius', 2011.0, 210000.0, 1350.0, 7.341616323576389),
- ('toyota', 'prius', 2011.0, 232946.0, 5680.0, -0.14171698846064815),
- ('toyota', 'prius', 2011.0, 240000.0, 4200.0, 7.158282985949074),
- ('toyota', 'prius', 2012.0, 45.0, 5450.0, 7.095090425775463),
- ('toyota', 'prius', 2012.0, 250.0, 8989.0, -0.1639373891550926),
- ('toyota', 'prius', 2012.0, 5000.0, 9995.0, 7.210368207928241),
- ('toyota', 'prius', 2012.0, 6000.0, 10850.0, -0.1625484915162037),
- ('toyota', 'prius', 2012.0, 6000.0, 14797.0, -0.15907625180555557),
- ('toyota', 'prius', 2012.0, 12000.0, 12724.0, -0.16393741097222223),
- ('toyota', 'prius', 2012.0, 25951.0, 14900.0, -0.16324294030092593),
- ('toyota', 'prius', 2012.0, 36000.0, 12991.0, -0.1625484871412037),
- ('toyota', 'prius', 2012.0, 45000.0, 11500.0, 9.143701563136574),
- ('toyota', 'prius', 2012.0, 59050.0, 14600.0, 0.8374515565972223),
- ('toyota', 'prius', 2012.0, 59050.0, 14600.0, 0.8791182276273148),
- ('toyota', 'prius', 2012.0, 61000.0, 12200.0, 8.508979332164351),
- ('toyota', 'prius', 2012.0, 62000.0, 10500.0, 13.443007140578704),
- ('toyota', 'prius', 2012.0, 64666.0, 13998.0, -0.039631881828703704),
- ('toyota', 'prius', 2012.0, 66307.0, 13997.0, -0.16532633515046297),
- ('toyota', 'prius', 2012.0, 70000.0, 8500.0, 5.706895968252315),
- ('toyota', 'prius', 2012.0, 73000.0, 10300.0, 6.554812643645834),
- ('toyota', 'prius', 2012.0, 74000.0, 14000.0, 3.2089792797337964),
- ('toyota', 'prius', 2012.0, 75000.0, 10995.0, 4.206895955104167),
- ('toyota', 'prius', 2012.0, 79970.0, 11556.0, -0.1646318686226852),
- ('toyota', 'prius', 2012.0, 81294.0, 11990.0, -0.08199301094907407),
- ('toyota', 'prius', 2012.0, 84101.0, 13995.0, -0.03963187524305556),
- ('toyota', 'prius', 2012.0, 84879.0, 11881.0, -0.038937393530092596),
- ('toyota', 'prius', 2012.0, 84900.0, 10800.0, -0.16463186199074073),
- ('toyota', 'prius', 2012.0, 85000.0, 8500.0, 3.2798126174421296),
- ('toyota', 'prius', 2012.0, 87000.0, 8988.0, 60.25689592018519),
- ('toyota', 'prius', 2012.0, 87000.0, 9000.0, 72.31314592671296),
- ('toyota', 'prius', 2012.0, 87000.0, 9100.0, 84.28953482212962),
- ('toyota', 'prius', 2012.0, 88286.0, 10434.0, -0.10074290099537037),
- ('toyota', 'prius', 2012.0, 89000.0, 11995.0, 14.417312715729167),
- ('toyota', 'prius', 2012.0, 95000.0, 10000.0, -46.77296521075232),
- ('toyota', 'prius', 2012.0, 96186.0, 11068.0, -0.1639373979050926),
- ('toyota', 'prius', 2012.0, 99054.0, 10782.0, -0.025048460914351853),
- ('toyota', 'prius', 2012.0, 101000.0, 9400.0, 0.3207847714699074),
- ('toyota', 'prius', 2012.0, 101000.0, 9400.0, 0.3208208122569444),
- ('toyota', 'prius', 2012.0, 103000.0, 7800.0, 13.522173813738426),
- ('toyota', 'prius', 2012.0, 104742.0, 10993.0, -0.11393735855324075),
- ('toyota', 'prius', 2012.0, 105000.0, 8500.0, 14.420090495659721),
- ('toyota', 'prius', 2012.0, 106557.0, 9565.0, -0.16046514503472223),
- ('toyota', 'prius', 2012.0, 106776.0, 8970.0, -0.16393740444444443),
- ('toyota', 'prius', 2012.0, 110000.0, 8450.0, 12.627729358391203),
- ('toyota', 'prius', 2012.0, 110000.0, 8500.0, 16.408284948773147),
- ('toyota', 'prius', 2012.0, 112533.0, 11000.0, -0.16046514945601853),
- ('toyota', 'prius', 2012.0, 116792.0, 9399.0, -0.10907624306712962),
- ('toyota', 'prius', 2012.0, 147000.0, 6900.0, 4.3464792928125),
- ('toyota', 'prius', 2012.0, 162354.0, 5488.0, -0.0958817811111111),
- ('toyota', 'prius', 2012.0, 203872.0, 6249.0, -0.14032622996527777),
- ('toyota', 'prius', 2013.0, 10.0, 9800.0, 4.353425712951389),
- ('toyota', 'prius', 2013.0, 15.0, 14490.0, -0.16393548851851852),
- ('toyota', 'prius', 2013.0, 50.0, 10600.0, 10.346481332361112),
- ('toyota', 'prius', 2013.0, 250.0, 8497.0, -0.16462993729166667),
- ('toyota', 'prius', 2013.0, 250.0, 10808.0, -0.1590743513425926),
- ('toyota', 'prius', 2013.0, 681.0, 11499.0, -0.1528243235300926),
- ('toyota', 'prius', 2013.0, 3000.0, 12989.0, -0.11462989217592592),
- ('toyota', 'prius', 2013.0, 5000.0, 11547.0, -0.16324103541666668),
- ('toyota', 'prius', 2013.0, 8000.0, 9490.0, -0.15212984494212964),
- ('toyota', 'prius', 2013.0, 8000.0, 11891.0, -0.035463244571759256),
- ('toyota', 'prius', 2013.0, 19000.0, 12838.0, -0.15421321677083333),
- ('toyota', 'prius', 2013.0, 24000.0, 13699.0, -0.11949102667824074),
- ('toyota', 'prius', 2013.0, 35000.0, 11100.0, 19.729120053935183),
- ('toyota', 'prius', 2013.0, 37499.0, 13356.0, -0.1521298496412037),
- ('toyota', 'prius', 2013.0, 50781.0, 15998.0, -0.15560211002314814),
- ('toyota', 'prius', 2013.0, 54000.0, 12995.0, -0.16601886810185185),
- ('toyota', 'prius', 2013.0, 54000.0, 12995.0, -0.1659847910300926),
- ('toyota', 'prius', 2013.0, 55000.0, 15750.0, 7.277036862349537),
- ('toyota', 'prius', 2013.0, 55000.0, 15750.0, 7.294397975763889),
- ('toyota', 'prius', 2013.0, 55000.0, 15750.0, 7.303425755856481),
- ('toyota', 'prius', 2013.0, 64000.0, 16759.0, -0.16532440144675925),
- ('toyota', 'prius', 2013.0, 64038.0, 14599.0, -0.1660188591087963),
- ('toyota', 'prius', 2013.0, 65163.0, 12988.0, -0.16324103974537038),
- ('toyota', 'prius', 2013.0, 72759.0, 13501.0, -0.16601885252314816),
- ('toyota', 'prius', 2013.0, 74000.0, 10532.0, 96.93189781855324),
- ('toyota', 'prius', 2013.0, 85056.0, 11651.0, -0.15282431074074074),
- ('toyota', 'prius', 2013.0, 88450.0, 11695.0, -0.15282430146990741),
- ('toyota', 'prius', 2013.0, 89000.0, 8995.0, 0.23675892746527777),
- ('toyota', 'prius', 2013.0, 89000.0, 8995.0, 0.23679302725694445),
- ('toyota', 'prius', 2013.0, 89000.0, 8995.0, 0.23745337850694445),
- ('toyota', 'prius', 2013.0, 89000.0, 8995.0, 0.23748748355324073),
- ('toyota', 'prius', 2013.0, 90000.0, 12500.0, -0.16532439488425926),
- ('toyota', 'prius', 2013.0, 91000.0, 10900.0, 2.1846756609606484),
- ('toyota', 'prius', 2013.0, 91000.0, 11995.0, 1.3082867532638889),
- ('toyota', 'prius', 2013.0, 94766.0, 2013.0, 2.2485645544675927),
- ('toyota', 'prius', 2013.0, 96000.0, 7995.0, 4.311064609537037),
- ('toyota', 'prius', 2013.0, 103202.0, 11987.0, -0.15768545253472221),
- ('toyota', 'prius', 2013.0, 114000.0, 9800.0, 0.5499533916550926),
- ('toyota', 'prius', 2013.0, 114000.0, 9800.0, 0.5499875422916667),
- ('toyota', 'prius', 2013.0, 114000.0, 9950.0, 0.550647842650463),
- ('toyota', 'prius', 2013.0, 114000.0, 9950.0, 0.5506819889930555),
- ('toyota', 'prius', 2013.0, 116000.0, 9500.0, 0.35967560729166664),
- ('toyota', 'prius', 2013.0, 116000.0, 9500.0, 0.35970972796296297),
- ('toyota', 'prius', 2013.0, 116000.0, 9500.0, 8.545092429525463),
- ('toyota', 'prius', 2013.0, 121000.0, 13000.0, 8.156203538287038),
- ('toyota', 'prius', 2013.0, 158439.0, 10800.0, -0.12087991996527778),
- ('toyota', 'prius', 2013.0, 179530.0, 7940.0, -0.06949098583333334),
- ('toyota', 'prius', 2013.0, 190082.0, 5798.0, -0.11671323585648148),
- ('toyota', 'prius', 2013.0, 225000.0, 5000.0, 10.436064663391203),
- ('toyota', 'prius', 2013.0, 230000.0, 5900.0, 9.596481325416667),
- ('toyota', 'prius', 2013.0, 248001.0, 6995.0, -0.04032438829861111),
- ('toyota', 'prius', 2014.0, 51.0, 11000.0, 12.487457993206018),
- ('toyota', 'prius', 2014.0, 51.0, 11600.0, 26.25551359465278),
- ('toyota', 'prius', 2014.0, 1000.0, 13477.0, -0.15976426787037037),
- ('toyota', 'prius', 2014.0, 1000.0, 16488.0, -0.033375369282407405),
- ('toyota', 'prius', 2014.0, 4000.0, 11000.0, 0.5409301067939815),
- ('toyota', 'prius', 2014.0, 4000.0, 11000.0, 0.5409597622337963),
- ('toyota', 'prius', 2014.0, 5000.0, 14400.0, -0.030597580243055554),
- ('toyota', 'prius', 2014.0, 10000.0, 12988.0, -0.16462541619212964),
- ('toyota', 'prius', 2014.0, 22000.0, 16658.0, -0.08268101310185186),
- ('toyota', 'prius', 2014.0, 23000.0, 14488.0, -0.16601435355324073),
- ('toyota', 'prius', 2014.0, 23418.0, 15897.0, -0.03337537461805556),
- ('toyota', 'prius', 2014.0, 29259.0, 20998.0, -0.16045871667824074),
- ('toyota', 'prius', 2014.0, 37000.0, 15000.0, 4.332596808171297),
- ('toyota', 'prius', 2014.0, 39894.0, 16170.0, -0.16115317422453704),
- ('toyota', 'prius', 2014.0, 40000.0, 16999.0, 1.3700967778125),
- ('toyota', 'prius', 2014.0, 40727.0, 17991.0, -0.08129209152777778),
- ('toyota', 'prius', 2014.0, 42000.0, 14950.0, 4.149957914988426),
- ('toyota', 'prius', 2014.0, 42000.0, 14950.0, 12.583291324340278),
- ('toyota', 'prius', 2014.0, 42000.0, 14950.0, 19.331902458877316),
- ('toyota', 'prius', 2014.0, 48617.0, 18250.0, -0.03962542050925926),
- ('toyota', 'prius', 2014.0, 49000.0, 15145.0, -0.07781983653935186),
- ('toyota', 'prius', 2014.0, 49174.0, 16710.0, 0.04370789546296296),
- ('toyota', 'prius', 2014.0, 53675.0, 13525.0, -0.15559757556712964),
- ('toyota', 'prius', 2014.0, 56749.0, 14523.0, -0.12156984530092593),
- ('toyota', 'prius', 2014.0, 59564.0, 13998.0, -0.16462542921296297),
- ('toyota', 'prius', 2014.0, 61960.0, 16998.0, -0.03962543353009259),
- ('toyota', 'prius', 2014.0, 72000.0, 12490.0, 6.558291289884259),
- ('toyota', 'prius', 2014.0, 74000.0, 12600.0, 6.090930170046296),
- ('toyota', 'prius', 2014.0, 77000.0, 13400.0, 23.61315247638889),
- ('toyota', 'prius', 2014.0, 82177.0, 14997.0, -0.07434758709490741),
- ('toyota', 'prius', 2014.0, 85000.0, 14900.0, 6.720791295138889),
- ('toyota', 'prius', 2014.0, 86038.0, 13999.0, -0.038930966435185184),
- ('toyota', 'prius', 2014.0, 87365.0, 12960.0, -0.16601436092592592),
- ('toyota', 'prius', 2014.0, 87365.0, 12960.0, -0.16598486009259258),
- ('toyota', 'prius', 2014.0, 92000.0, 10900.0, 9.540930204398148),
- ('toyota', 'prius', 2014.0, 92180.0, 13998.0, -0.0396254422337963),
- ('toyota', 'prius', 2014.0, 94348.0, 11499.0, -0.038930960983796295),
- ('toyota', 'prius', 2014.0, 100643.0, 9950.0, -0.16531989101851852),
- ('toyota', 'prius', 2014.0, 102000.0, 9997.0, 11.129818984675927),
- ('toyota', 'prius', 2014.0, 111000.0, 9800.0, 2.4874579019675926),
- ('toyota', 'prius', 2014.0, 111000.0, 9800.0, 8.506902416782408),
- ('toyota', 'prius', 2014.0, 111000.0, 9800.0, 12.449957988819444),
- ('toyota', 'prius', 2014.0, 111000.0, 9800.0, 21.50551357875),
- ('toyota', 'prius', 2014.0, 133357.0, 11799.0, -0.04031989541666667),
- ('toyota', 'prius', 2014.0, 155051.0, 7950.0, -0.16045872100694444),
- ('toyota', 'prius', 2014.0, 372000.0, 13995.0, 0.15273564137731482),
- ('toyota', 'prius', 2014.0, 372000.0, 13995.0, 0.15276517164351852),
- ('toyota', 'prius', 2015.0, 71.0, 11695.0, 11.335378904814815),
- ('toyota', 'prius', 2015.0, 107.0, 11900.0, 8.585378879027777),
- ('toyota', 'prius', 2015.0, 250.0, 15963.0, -0.16462116064814813),
- ('toyota', 'prius', 2015.0, 9000.0, 19991.0, -0.0382322519212963),
- ('toyota', 'prius', 2015.0, 18913.0, 19998.0, -0.16601011226851853),
- ('toyota', 'prius', 2015.0, 22000.0, 17999.0, -0.08128784089120371),
- ('toyota', 'prius', 2015.0, 26000.0, 12500.0, 4.199962152256944),
- ('toyota', 'prius', 2015.0, 27000.0, 19995.0, 7.233989968125),
- ('toyota', 'prius', 2015.0, 33567.0, 19900.0, -0.1660101057175926),
- ('toyota', 'prius', 2015.0, 34000.0, 19990.0, -0.16253780305555557),
- ('toyota', 'prius', 2015.0, 41000.0, 18950.0, 13.233295582951389),
- ('toyota', 'prius', 2015.0, 43238.0, 17998.0, -0.04101012987268519),
- ('toyota', 'prius', 2015.0, 43238.0, 17998.0, -0.04098477724537037),
- ('toyota', 'prius', 2015.0, 45000.0, 13900.0, 11.389545569039353),
- ('toyota', 'prius', 2015.0, 45000.0, 17500.0, 14.183295587430555),
- ('toyota', 'prius', 2015.0, 45000.0, 18995.0, -0.03962117886574074),
- ('toyota', 'prius', 2015.0, 46000.0, 14500.0, 26.58954541465278),
- ('toyota', 'prius', 2015.0, 47000.0, 16900.0, 9.314545552268518),
- ('toyota', 'prius', 2015.0, 47916.0, 17309.0, -0.041010094340277775),
- ('toyota', 'prius', 2015.0, 51955.0, 17900.0, -0.16531564091435186),
- ('toyota', 'prius', 2015.0, 52484.0, 12488.0, -0.1236489610300926),
- ('toyota', 'prius', 2015.0, 53751.0, 13785.0, -0.08059337184027777),
- ('toyota', 'prius', 2015.0, 54000.0, 14900.0, 12.336767795891204),
- ('toyota', 'prius', 2015.0, 55000.0, 8500.0, 8.038851088020833),
- ('toyota', 'prius', 2015.0, 55551.0, 16300.0, -0.16601009908564815),
- ('toyota', 'prius', 2015.0, 57000.0, 14995.0, 2.274962112141204),
- ('toyota', 'prius', 2015.0, 61000.0, 11000.0, 2.477739912453704),
- ('toyota', 'prius', 2015.0, 61000.0, 13000.0, 40.09996211431713),
- ('toyota', 'prius', 2015.0, 62000.0, 15500.0, 15.625656711817129),
- ('toyota', 'prius', 2015.0, 63000.0, 15485.0, 11.258990011111111),
- ('toyota', 'prius', 2015.0, 64516.0, 14481.0, -0.038926700729166666),
- ('toyota', 'prius', 2015.0, 64821.0, 21991.0, -0.04101013868055556),
- ('toyota', 'prius', 2015.0, 64821.0, 21991.0, -0.04098483310185185),
- ('toyota', 'prius', 2015.0, 68408.0, 18998.0, -0.12295450300925925),
- ('toyota', 'prius', 2015.0, 72538.0, 16999.0, -0.08128782234953703),
- ('toyota', 'prius', 2015.0, 74019.0, 14975.0, -0.12364896542824073),
- ('toyota', 'prius', 2015.0, 75000.0, 14590.0, -0.037537798680555554),
- ('toyota', 'prius', 2015.0, 77349.0, 16988.0, -0.04101014766203704),
- ('toyota', 'prius', 2015.0, 77349.0, 16988.0, -0.04098485337962963),
- ('toyota', 'prius', 2015.0, 78041.0, 17998.0, -0.039621165243055555),
- ('toyota', 'prius', 2015.0, 79479.0, 14373.0, -0.16531564530092593),
- ('toyota', 'prius', 2015.0, 82852.0, 11550.0, -0.16253779423611112),
- ('toyota', 'prius', 2015.0, 83899.0, 16998.0, -0.04101012106481482),
- ('toyota', 'prius', 2015.0, 83899.0, 16998.0, -0.04098476304398148),
- ('toyota', 'prius', 2015.0, 102000.0, 9300.0, 12.474962247037038),
- ('toyota', 'prius', 2015.0, 116750.0, 10990.0, -0.16531563649305556),
- ('toyota', 'prius', 2016.0, 250.0, 23655.0, -0.04100631829861111),
- ('toyota', 'prius', 2016.0, 250.0, 23655.0, -0.04098488082175926),
- ('toyota', 'prius', 2016.0, 10000.0, 18000.0, 1.5270492640046296),
- ('toyota', 'prius', 2016.0, 10000.0, 19541.0, -0.1660062540625),
- ('toyota', 'prius', 2016.0, 11480.0, 25998.0, -0.041006276319444444),
- ('toyota', 'prius', 2016.0, 11811.0, 25900.0, -0.04031176711805556),
- ('toyota', 'prius', 2016.0, 14000.0, 13392.0, 7.121493799375),
- ('toyota', 'prius', 2016.0, 15000.0, 19999.0, 0.3048270193865741),
- ('toyota', 'prius', 2016.0, 15000.0, 19999.0, 0.3048485537962963),
- ('toyota', 'prius', 2016.0, 15000.0, 19999.0, 8.445104922465278),
- ('toyota', 'prius', 2016.0, 16830.0, 21999.0, -0.04100626611111111),
- ('toyota', 'prius', 2016.0, 17444.0, 20000.0, -0.16600624717592594),
- ('toyota', 'prius', 2016.0, 19000.0, 21900.0, 15.283993846504629),
- ('toyota', 'prius', 2016.0, 20097.0, 22900.0, -0.04100629372685185),
- ('toyota', 'prius', 2016.0, 20097.0, 22900.0, -0.04098480480324074),
- ('toyota', 'prius', 2016.0, 21782.0, 23991.0, -0.041006298518518516),
- ('toyota', 'prius', 2016.0, 21782.0, 23991.0, -0.04098481170138889),
- ('toyota', 'prius', 2016.0, 27616.0, 20999.0, -0.1660063272337963),
- ('toyota', 'prius', 2016.0, 27616.0, 20999.0, -0.16598488761574073),
- ('toyota', 'prius', 2016.0, 28670.0, 18551.0, -0.16531175837962964),
- ('toyota', 'prius', 2016.0, 29929.0, 22988.0, -0.041006261377314814),
- ('toyota', 'prius', 2016.0, 30427.0, 21745.0, -0.08197844262731481),
- ('toyota', 'prius', 2016.0, 31720.0, 17499.0, -0.1653117847337963),
- ('toyota', 'prius', 2016.0, 32144.0, 21490.0, -0.1653117803587963),
- ('toyota', 'prius', 2016.0, 32971.0, 20998.0, -0.041006280717592596),
- ('toyota', 'prius', 2016.0, 33000.0, 18900.0, 13.530521615520833),
- ('toyota', 'prius', 2016.0, 33522.0, 20981.0, -0.0403117715625),
- ('toyota', 'prius', 2016.0, 34266.0, 22900.0, -0.04100630953703704),
- ('toyota', 'prius', 2016.0, 34266.0, 22900.0, -0.040984839814814815),
- ('toyota', 'prius', 2016.0, 35922.0, 19995.0, -0.16531176275462964),
- ('toyota', 'prius', 2016.0, 37239.0, 22991.0, -0.04100630292824074),
- ('toyota', 'prius', 2016.0, 37239.0, 22991.0, -0.04098481863425926),
- ('toyota', 'prius', 2016.0, 38757.0, 2016.0, 6.231216008379629),
- ('toyota', 'prius', 2016.0, 39000.0, 19995.0, 9.108299371319445),
- ('toyota', 'prius', 2016.0, 40000.0, 19000.0, 10.567327160150462),
- ('toyota', 'prius', 2016.0, 40753.0, 19998.0, -0.12433960457175926),
- ('toyota', 'prius', 2016.0, 41376.0, 19450.0, -0.040311797824074076),
- ('toyota', 'prius', 2016.0, 43000.0, 16900.0, 4.145799305150463),
- ('toyota', 'prius', 2016.0, 43169.0, 22998.0, -0.16600628940972223),
- ('toyota', 'prius', 2016.0, 43169.0, 22998.0, -0.16598476993055555),
- ('toyota', 'prius', 2016.0, 45000.0, 19900.0, 11.947882720081019),
- ('toyota', 'prius', 2016.0, 46683.0, 2016.0, 6.283299346168982),
- ('toyota', 'prius', 2016.0, 54000.0, 16986.0, -24.522256320474536),
- ('toyota', 'prius', 2016.0, 59878.0, 22900.0, -0.040311793449074075),
- ('toyota', 'prius', 2016.0, 60000.0, 17995.0, -0.04517298935185185),
- ('toyota', 'prius', 2016.0, 60000.0, 17995.0, -0.04515153578703704),
- ('toyota', 'prius', 2016.0, 74000.0, 15500.0, 10.151354933495371),
- ('toyota', 'prius', 2016.0, 91069.0, 16977.0, -0.1660062850462963),
- ('toyota', 'prius', 2016.0, 91069.0, 16977.0, -0.16598474799768517),
- ('toyota', 'prius', 2016.0, 100000.0, 16966.0, -0.08197845576388889),
- ('toyota', 'prius', 2016.0, 122000.0, 11500.0, 14.974966064340277),
- ('toyota', 'prius', 2017.0, 30.0, 24000.0, 25.164552733738425),
- ('toyota', 'prius', 2017.0, 262.0, 4950.0, 59.23191369758102),
- ('toyota', 'prius', 2017.0, 262.0, 9900.0, 24.294413688784722),
- ('toyota', 'prius', 2017.0, 13000.0, 8900.0, -77.72989184479167),
- ('toyota', 'prius', 2017.0, 14000.0, 23995.0, 28.514552744664353),
- ('toyota', 'prius', 2017.0, 14822.0, 24998.0, -0.04100296030092593),
- ('toyota', 'prius', 2017.0, 14822.0, 24998.0, -0.040984784155092595),
- ('toyota', 'prius', 2017.0, 15059.0, 21990.0, -0.16600297569444444),
- ('toyota', 'prius', 2017.0, 15059.0, 21990.0, -0.16598482605324075),
- ('toyota', 'prius', 2017.0, 15065.0, 24998.0, -0.12433628707175925),
- ('toyota', 'prius', 2017.0, 15065.0, 24998.0, -0.12431807430555555),
- ('toyota', 'prius', 2017.0, 20315.0, 21991.0, -0.041002940578703705),
- ('toyota', 'prius', 2017.0, 21000.0, 2017.0, 9.34233042960648),
- ('toyota', 'prius', 2017.0, 21000.0, 19997.0, 15.214552699675925),
- ('toyota', 'prius', 2017.0, 21000.0, 19997.0, 15.254136035185185),
- ('toyota', 'prius', 2017.0, 21000.0, 19997.0, 15.358997148449074),
- ('toyota', 'prius', 2017.0, 21932.0, 26791.0, -0.08197514900462963),
- ('toyota', 'prius', 2017.0, 24144.0, 24500.0, -0.03961401707175926),
- ('toyota', 'prius', 2017.0, 26000.0, 21500.0, 8.315941514814815),
- ('toyota', 'prius', 2017.0, 27380.0, 24000.0, -0.16391956822916667),
- ('toyota', 'prius', 2017.0, 27380.0, 24000.0, -0.16322510199074075),
- ('toyota', 'prius', 2017.0, 27380.0, 24000.0, -0.16322508457175927),
- ('toyota', 'prius', 2017.0, 27380.0, 24000.0, -0.12155842663194444),
- ('toyota', 'prius', 2017.0, 31889.0, 23998.0, -0.04100294716435185),
- ('toyota', 'prius', 2017.0, 36241.0, 21791.0, -0.16600296689814814),
- ('toyota', 'prius', 2017.0, 36241.0, 21791.0, -0.16598479791666668),
- ('toyota', 'prius', 2017.0, 39899.0, 22991.0, -0.038225110694444446),
- ('toyota', 'prius', 2017.0, 42249.0, 19991.0, -0.038919563854166665),
- ('toyota', 'prius', 2017.0, 43000.0, 19000.0, 9.159691524305556),
- ('toyota', 'prius', 2017.0, 63936.0, 17998.0, -0.12294736238425925),
- ('toyota', 'prius', 2017.0, 67939.0, 21900.0, -0.16391955949074075),
- ('toyota', 'prius', 2017.0, 67939.0, 21900.0, -0.16322510637731483),
- ('toyota', 'prius', 2017.0, 67939.0, 21900.0, -0.1632250889351852),
- ('toyota', 'prius', 2017.0, 67939.0, 21900.0, -0.16322508025462962),
- ('toyota', 'prius', 2017.0, 73164.0, 20883.0, -0.1646140239699074),
- ('toyota', 'prius', 2017.0, 73634.0, 21991.0, -0.04030847790509259),
- ('toyota', 'prius', 2017.0, 75000.0, 26500.0, 14.440941584247685),
- ('toyota', 'prius', 2017.0, 75000.0, 26500.0, 16.061774930613424),
- ('toyota', 'prius', 2017.0, 76621.0, 19884.0, -0.16600298466435184),
- ('toyota', 'prius', 2017.0, 76621.0, 19884.0, -0.16598484660879628),
- ('toyota', 'prius', 2017.0, 100000.0, 19692.0, -0.07989176430555556),
- ('toyota', 'prius', 2017.0, 100000.0, 23981.0, -0.0819751540625),
- ('toyota', 'prius', 2017.0, 100000.0, 25995.0, -0.16600293616898149),
- ('toyota', 'prius', 2018.0, 1.0, 27169.0, 69.18608717525463),
- ('toyota', 'prius', 2018.0, 45.0, 5350.0, 7.088864855243056),
- ('toyota', 'prius', 2018.0, 100.0, 20000.0, 69.40969828855324),
- ('toyota', 'prius', 2018.0, 1000.0, 21300.0, 23.427059346331017),
- ('toyota', 'prius', 2018.0, 4000.0, 19999.0, 7.031920415856481),
- ('toyota', 'prius', 2018.0, 4000.0, 19999.0, 7.031920420243056),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.16391290646990742),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.16391290212962964),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.16391289637731482),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.1639128914699074),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.1639128825462963),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.16391287813657407),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.16321841987268518),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.16321841108796295),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.16321840668981483),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.1222462442361111),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.12155176209490741),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.1215517355787037),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.12155173123842593),
- ('toyota', 'prius', 2018.0, 7099.0, 27400.0, -0.038218424328703704),
- ('toyota', 'prius', 2018.0, 10000.0, 2018.0, 9.444420429039353),
- ('toyota', 'prius', 2018.0, 12000.0, 21999.0, 80.08469829949074),
- ('toyota', 'prius', 2018.0, 12000.0, 22995.0, 46.38886492885417),
- ('toyota', 'prius', 2018.0, 26830.0, 19072.0, -0.16460736482638888),
- ('toyota', 'prius', 2018.0, 27126.0, 19072.0, -0.16460737355324073),
- ('toyota', 'prius', 2018.0, 27126.0, 19072.0, -0.16321841545138888),
- ('toyota', 'prius', 2018.0, 27555.0, 19072.0, -0.04099628884259259),
- ('toyota', 'prius', 2018.0, 27555.0, 19072.0, -0.04099628209490741),
- ('toyota', 'prius', 2018.0, 27555.0, 19072.0, -0.040996275543981484),
- ('toyota', 'prius', 2018.0, 27555.0, 19072.0, -0.04030182672453704),
- ('toyota', 'prius', 2018.0, 27555.0, 19072.0, -0.039607377916666665),
- ('toyota', 'prius', 2018.0, 29187.0, 18872.0, -0.039607369155092595),
- ('toyota', 'prius', 2018.0, 32666.0, 19995.0, -0.12224622032407408),
- ('toyota', 'prius', 2018.0, 100000.0, 22481.0, -0.08057958193287038),
- ('toyota', 'prius', 2019.0, 63.0, 26975.0, 165.75900971607638),
- ('toyota', 'prius', 2019.0, 695.0, 26750.0, -0.14724029496527777),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.847204180046296),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.8478986339699075),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.847898640775463),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.8478986454976853),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.8478986502314814),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.847898654583333),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.8888708424189815),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.888870844560185),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.889565295451389),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.889565297604167),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.8895653099421295),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.889565314351852),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.8895653190856483),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.9312319945023146),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.9722041821875),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.972898637615741),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.9728986567824074),
- ('toyota', 'prius', 2019.0, 2420.0, 26460.0, 2.972898658946759),
- ('toyota', 'prius', 2019.0, 3000.0, 32435.0, 2.8472041736111113),
- ('toyota', 'prius', 2019.0, 3227.0, 20498.0, 0.8548430515856481),
- ('toyota', 'prius', 2019.0, 3647.0, 26990.0, 2.8333152825462964),
- ('toyota', 'prius', 2019.0, 8343.0, 27995.0, 1.837481944837963),
- ('toyota', 'prius', 2019.0, 14129.0, 22000.0, 0.845120825),
- ('toyota', 'prius', 2019.0, 100000.0, 26188.0, -0.0021014016203703702)}
+import os
 
-class Car():
-    def __init__(self,*args):
-        self.make = args[0]
-        self.model = args[1]
-        self.year = args[2]
-        self.mileage = args[3]
-        self.price = args[4]
-        self.time_posted = args[5]
+# The listings are stored by column in the raw_priuses directory next to
+# this file (see car_dataset.py). Importing this module reads nothing (and
+# doesn't import NumPy): each dataset below is built the first time it's
+# used, from columns memory-mapped from the files, and then kept.
 
-distinct_priuses = {
-        (p[3], p[4]): Car(*p)
-        for p in raw_priuses
-    }
+_directory = os.path.dirname(os.path.abspath(__file__))
 
-# filter out values with mileage < 1000 and price > 1000 as many of these are clearly bad data
-priuses = [p for p in distinct_priuses.values() if p.mileage > 1000 and p.price > 1000]
\ No newline at end of file
+def _raw_priuses():
+    from car_dataset import CarDataset
+    return CarDataset.load(os.path.join(_directory, "raw_priuses"), mmap_mode="r")
+
+def _distinct_priuses():
+    return __getattr__("raw_priuses").distinct("mileage", "price")
+
+def _priuses():
+    distinct_priuses = __getattr__("distinct_priuses")
+    # filter out values with mileage < 1000 and price > 1000 as many of these are clearly bad data
+    return distinct_priuses.where((distinct_priuses.mileage > 1000) & (distinct_priuses.price > 1000))
+
+def _car():
+    from car_dataset import Car
+    return Car
+
+_lazy = {
+    "raw_priuses": _raw_priuses,
+    "distinct_priuses": _distinct_priuses,
+    "priuses": _priuses,
+    "Car": _car
+}
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    if name not in globals():
+        globals()[name] = _lazy[name]()
+    return globals()[name]
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
@@ -0,0 +1,118 @@
+import os
+import numpy as np
+
+# Car listings stored by column: a NumPy array per numeric column, and the
+# string columns (make and model) dictionary-encoded as small integer codes
+# into an array of their distinct values. On disk a dataset is a directory
+# with one .npy file per array, which can be memory-mapped.
+
+string_columns = ("make", "model")
+number_columns = ("year", "mileage", "price", "time_posted")
+columns = string_columns + number_columns
+
+class Car():
+    # one listing, as produced by iterating over a CarDataset
+    __slots__ = columns
+    def __init__(self,*args):
+        self.make = args[0]
+        self.model = args[1]
+        self.year = args[2]
+        self.mileage = args[3]
+        self.price = args[4]
+        self.time_posted = args[5]
+
+def encode(strings):
+    # (codes, categories) with categories[codes] equal to the strings
+    categories, codes = np.unique(np.asarray(strings, dtype=str), return_inverse=True)
+    return codes.astype(np.min_scalar_type(max(len(categories) - 1, 0))), categories
+
+class CarDataset():
+    def __init__(self, codes, categories, numbers):
+        # codes and categories: {column: array} for the string columns;
+        # numbers: {column: array} for the others, all of the same length
+        self.codes = codes
+        self.categories = categories
+        self.numbers = numbers
+
+    @classmethod
+    def from_tuples(cls, rows):
+        # from (make, model, year, mileage, price, time_posted) tuples
+        rows = list(rows)
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        codes, categories = {}, {}
+        for name, column in zip(string_columns, values):
+            codes[name], categories[name] = encode(column)
+        numbers = {name: np.array(column, dtype=float)
+                   for name, column in zip(number_columns, values[len(string_columns):])}
+        return cls(codes, categories, numbers)
+
+    def column(self, name):
+        if name in self.numbers:
+            return self.numbers[name]
+        return self.categories[name][self.codes[name]]
+
+    @property
+    def make(self):
+        return self.column("make")
+    @property
+    def model(self):
+        return self.column("model")
+    @property
+    def year(self):
+        return self.numbers["year"]
+    @property
+    def mileage(self):
+        return self.numbers["mileage"]
+    @property
+    def price(self):
+        return self.numbers["price"]
+    @property
+    def time_posted(self):
+        return self.numbers["time_posted"]
+
+    def __len__(self):
+        return len(self.numbers["mileage"])
+
+    def rows(self):
+        # the listings as tuples of Python values, like the old literals
+        return zip(*[self.column(name).tolist() for name in columns])
+
+    def __iter__(self):
+        return (Car(*row) for row in self.rows())
+
+    def __getitem__(self, index):
+        # a Car for an integer index; a CarDataset for a slice, an array of
+        # indices or a boolean mask
+        if isinstance(index, (int, np.integer)):
+            return Car(*[self.column(name)[index].item() for name in columns])
+        return CarDataset({name: codes[index] for name, codes in self.codes.items()},
+                          self.categories,
+                          {name: values[index] for name, values in self.numbers.items()})
+
+    def where(self, mask):
+        return self[np.asarray(mask, dtype=bool)]
+
+    def distinct(self, *names):
+        # the first row for each distinct combination of the given columns
+        keys = np.stack([self.numbers[n] if n in self.numbers else self.codes[n] for n in names], axis=1)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        return self[np.sort(first)]
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        for name in string_columns:
+            np.save(os.path.join(path, name + ".npy"), self.codes[name])
+            np.save(os.path.join(path, name + "_categories.npy"), self.categories[name])
+        for name in number_columns:
+            np.save(os.path.join(path, name + ".npy"), self.numbers[name])
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        # with mmap_mode="r" the arrays are memory-mapped read-only, so
+        # loading reads only the file headers and pages are read as they
+        # are used
+        def array(name):
+            return np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode)
+        return cls({name: array(name) for name in string_columns},
+                   {name: array(name + "_categories") for name in string_columns},
+                   {name: array(name) for name in number_columns})
@@ -0,0 +1,117 @@
+import numpy as np
+
+# Least-squares fits of price models to (mileage, price) data, solved
+# directly on NumPy arrays such as the columns of a CarDataset:
+#
+#   fit_line(priuses.mileage, priuses.price)         -> (a, b), price = a*x + b
+#   fit_polynomial(priuses.mileage, priuses.price, 3) -> a numpy Polynomial
+#   fit_exponential(priuses.mileage, priuses.price)  -> (q, r), price = q*e^(r*x)
+#
+# Linear models are solved with a QR factorization rather than the normal
+# equations, which would square the condition number. The rows are taken in
+# chunks, each chunk's rows folded into the triangular factor of the ones
+# before, so memory stays bounded however many rows there are.
+
+chunk_size = 1 << 18
+
+def _check_data(x, y):
+    if len(x) != len(y):
+        raise ValueError("x and y have different lengths, {} and {}".format(len(x), len(y)))
+    if len(x) == 0:
+        raise ValueError("no data points to fit")
+
+def least_squares(design, x, y):
+    # Coefficients c minimizing |design(x) c - y|^2, and that minimum sum of
+    # squared errors. design maps a chunk of x to its rows of the design
+    # matrix. y is appended to the design matrix as one more column, so the
+    # last column of the triangular factor holds Q^T y and its corner the
+    # norm of the residual.
+    _check_data(x, y)
+    factor = None
+    for start in range(0, len(x), chunk_size):
+        block = np.column_stack([design(x[start:start + chunk_size]), y[start:start + chunk_size]])
+        if factor is not None:
+            block = np.vstack([factor, block])
+        factor = np.linalg.qr(block, mode="r")
+    k = factor.shape[1] - 1
+    # the rank is judged on the design's columns alone, so a large y can't
+    # make them look degenerate
+    if factor.shape[0] < k or np.any(np.abs(np.diag(factor)[:k]) <= 1e-12 * np.abs(factor[:k, :k]).max()):
+        raise ValueError("not enough distinct data points to fit {} coefficients".format(k))
+    coefficients = np.linalg.solve(factor[:k, :k], factor[:k, k])
+    residual = factor[k, k] if factor.shape[0] > k else 0.0
+    return coefficients, residual ** 2
+
+def _scaling(x):
+    # the affine map of x onto [-1, 1], as (center, half width)
+    low, high = float(np.min(x)), float(np.max(x))
+    return (low + high) / 2, (high - low) / 2 or 1.0
+
+def fit_polynomial(x, y, degree):
+    # the least-squares polynomial, as a numpy.polynomial.Polynomial that can
+    # be called on numbers or arrays. It's fit in powers of x scaled onto
+    # [-1, 1] (powers of mileages near 10^5 would be hopelessly ill
+    # conditioned); p.convert().coef gives the coefficients of powers of x.
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    _check_data(x, y)
+    center, half = _scaling(x)
+    def design(xs):
+        return np.vander((xs - center) / half, degree + 1, increasing=True)
+    coefficients, _ = least_squares(design, x, y)
+    return np.polynomial.Polynomial(coefficients, domain=[center - half, center + half])
+
+def fit_line(x, y):
+    # (a, b) for the least-squares line y = a * x + b
+    b, a = fit_polynomial(x, y, 1).convert().coef
+    return float(a), float(b)
+
+def _log_fit(x, y):
+    # (q, r) with log(y) = log(q) + r * x fit by least squares, over the
+    # rows where y > 0: the exact fit for exact exponential data, and a good
+    # start otherwise (it weighs relative rather than absolute errors)
+    positive = y > 0
+    if np.count_nonzero(positive) < 2:
+        raise ValueError("an exponential fit needs at least two positive values")
+    r, log_q = fit_line(x[positive], np.log(y[positive]))
+    return float(np.exp(log_q)), r
+
+def fit_exponential(x, y, method="gauss-newton", tolerance=1e-12, max_steps=100):
+    # (q, r) for y = q * e^(r * x). With method="log", the fit of log(y);
+    # otherwise the least-squares fit of y itself, by Gauss-Newton steps
+    # from there. Each step solves the linear least-squares problem for the
+    # model's Jacobian, [e^(r*x), q*x*e^(r*x)], and is halved while it
+    # doesn't reduce the error.
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    _check_data(x, y)
+    q, r = _log_fit(x, y)
+    if method == "log":
+        return q, r
+    elif method != "gauss-newton":
+        raise ValueError("unknown method {}".format(method))
+    # work with x divided by its largest magnitude, so r is of order 1
+    scale = float(np.max(np.abs(x))) or 1.0
+    t, r = x / scale, r * scale
+    def error(q, r):
+        return float(np.sum((q * np.exp(r * t) - y) ** 2))
+    current = error(q, r)
+    for _ in range(0, max_steps):
+        def design(ts):
+            e = np.exp(r * ts)
+            return np.column_stack([e, q * ts * e])
+        # the residuals, as the y column: solving for the step
+        residuals = y - q * np.exp(r * t)
+        (dq, dr), _ = least_squares(design, t, residuals)
+        step = 1.0
+        while True:
+            candidate = error(q + step * dq, r + step * dr)
+            if candidate <= current or step < 1e-10:
+                break
+            step /= 2
+        if candidate > current:
+            break
+        q, r = q + step * dq, r + step * dr
+        converged = current - candidate <= tolerance * current
+        current = candidate
+        if converged:
+            break
+    return float(q), float(r) / scale
@@ -0,0 +1,103 @@
+from math import exp, log
+from timeit import default_timer as timer
+import numpy as np
+from car_data import bmws, priuses
+from costs import labeled_cars, make_scale, logistic_log_loss
+
+# Cost evaluations per second on the BMW-vs-Prius data, for the notebook's
+# per-row logistic_cost with finite-difference gradients and for the
+# vectorized cost with its analytic gradient.
+# Run from this directory:  python bench_costs.py
+
+def sigmoid(x):
+    return 1 / (1+exp(-x))
+
+def make_logistic(a,b,c):
+    def l(x,p):
+        return sigmoid(a*x + b*p - c)
+    return l
+
+def point_cost(l,x,p,is_bmw):
+    wrong = 1 - is_bmw
+    return -log(abs(wrong - l(x,p)))
+
+def notebook_cost(data):
+    def logistic_cost(a,b,c):
+        l = make_logistic(a,b,c)
+        errors = [point_cost(l,x,p,is_bmw) for x,p,is_bmw in data]
+        return sum(errors)
+    return logistic_cost
+
+def approx_gradient(f,x0,y0,z0,dx=1e-6):
+    partial_x = (f(x0+dx,y0,z0) - f(x0,y0,z0))/dx
+    partial_y = (f(x0,y0+dx,z0) - f(x0,y0,z0))/dx
+    partial_z = (f(x0,y0,z0+dx) - f(x0,y0,z0))/dx
+    return (partial_x,partial_y,partial_z)
+
+def gradient_descent(gradient,x0,y0,z0,tolerance=1e-6,max_steps=1000):
+    # the notebook's gradient_descent3, given a gradient function
+    x,y,z = x0,y0,z0
+    steps = 0
+    while steps < max_steps:
+        grad_x, grad_y, grad_z = gradient(x,y,z)
+        if (grad_x**2 + grad_y**2 + grad_z**2) ** 0.5 < tolerance:
+            break
+        x -= 0.01 * grad_x
+        y -= 0.01 * grad_y
+        z -= 0.01 * grad_z
+        steps += 1
+    return x,y,z
+
+def rate(f, args, seconds=0.5):
+    # calls per second of f(*args)
+    count, start = 0, timer()
+    while timer() - start < seconds:
+        for _ in range(0, 100):
+            f(*args)
+        count += 100
+    return count / (timer() - start)
+
+def scaled_cars(bmws, priuses):
+    mileage, price, is_bmw = labeled_cars(bmws, priuses)
+    scale_mileage, _ = make_scale(mileage)
+    scale_price, _ = make_scale(price)
+    return scale_mileage(mileage), scale_price(price), is_bmw
+
+def bench_costs(name, bmws, priuses, repeats=(1, 100)):
+    x, p, is_bmw = scaled_cars(bmws, priuses)
+    for copies in repeats:
+        # the same rows repeated, to show how each scales with the data
+        xs, ps, ys = (np.tile(column, copies) for column in (x, p, is_bmw))
+        loop_cost = notebook_cost(list(zip(xs.tolist(), ps.tolist(), ys.tolist())))
+        cost, gradient = logistic_log_loss(xs, ps, ys)
+        args = (1.0, 1.0, 1.0)
+        assert abs(loop_cost(*args) - cost(*args)) <= 1e-9 * cost(*args)
+        loop_gradient = lambda a, b, c: approx_gradient(loop_cost, a, b, c)
+        assert np.allclose(loop_gradient(*args), gradient(*args), rtol=1e-4, atol=1e-4 * len(xs))
+        print("%s, %d rows:" % (name, len(xs)))
+        print("  cost:     per row %9.0f/s, vectorized %9.0f/s"
+              % (rate(loop_cost, args), rate(cost, args)))
+        print("  gradient: finite differences %9.0f/s, analytic %9.0f/s"
+              % (rate(loop_gradient, args), rate(gradient, args)))
+
+def bench_descent(bmws, priuses):
+    # the notebook's 1000 steps of gradient descent from (0, 0, 0)
+    x, p, is_bmw = scaled_cars(bmws, priuses)
+    loop_cost = notebook_cost(list(zip(x.tolist(), p.tolist(), is_bmw.tolist())))
+    _, gradient = logistic_log_loss(x, p, is_bmw)
+    start = timer()
+    old = gradient_descent(lambda a, b, c: approx_gradient(loop_cost, a, b, c), 0, 0, 0)
+    old_time = timer() - start
+    start = timer()
+    new = gradient_descent(gradient, 0, 0, 0)
+    new_time = timer() - start
+    print("gradient descent, 1000 steps: finite differences %.3f s, analytic %.3f s"
+          % (old_time, new_time))
+    print("  ", old)
+    print("  ", new)
+
+if __name__ == "__main__":
+    bench_costs("bmws and priuses", bmws, priuses)
+    from car_data import all_bmws, all_priuses
+    bench_costs("all_bmws and all_priuses", all_bmws, all_priuses, repeats=(1,))
+    bench_descent(bmws, priuses)
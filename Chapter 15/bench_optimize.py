@@ -0,0 +1,70 @@
+from timeit import default_timer as timer
+import numpy as np
+from car_data import bmws, priuses
+from costs import labeled_cars, make_scale, line_squared_error, logistic_log_loss
+from optimize import gradient_descent, approx_gradient
+
+# Steps to convergence and wall time of gradient_descent on the notebooks'
+# logistic_cost (Chapter 15) and scaled coefficient_cost (Chapter 14), for
+# each step rule, with the notebook's finite-difference gradient as the
+# baseline. Run from this directory:  python bench_optimize.py
+
+def logistic_problem():
+    mileage, price, is_bmw = labeled_cars(bmws, priuses)
+    scale_mileage, _ = make_scale(mileage)
+    scale_price, _ = make_scale(price)
+    return logistic_log_loss(scale_mileage(mileage), scale_price(price), is_bmw)
+
+def coefficient_problem():
+    # the notebook's scaled_cost_function(c, d) = coefficient_cost(0.5*c, 50000*d) / 1e13
+    cost, gradient = line_squared_error(priuses.mileage, priuses.price)
+    def scaled_cost(c, d):
+        return cost(0.5 * c, 50000 * d) / 1e13
+    def scaled_gradient(c, d):
+        da, db = gradient(0.5 * c, 50000 * d)
+        return 0.5 * da / 1e13, 50000 * db / 1e13
+    return scaled_cost, scaled_gradient
+
+def run(f, gradient, start, **options):
+    telemetry = []
+    began = timer()
+    v = gradient_descent(f, start, gradient=gradient, callback=telemetry.append, **options)
+    elapsed = timer() - began
+    return v, telemetry, elapsed
+
+def report(name, f, gradient, start, runs):
+    print(name)
+    for label, use_gradient, options in runs:
+        v, telemetry, elapsed = run(f, gradient if use_gradient else None, start, **options)
+        last = telemetry[-1]
+        converged = last.gradient_norm <= options.get("tolerance", 1e-6)
+        print("  %-34s %6d steps %8.3f s  cost %.6f  |grad| %.1e%s"
+              % (label, last.step, elapsed, last.cost, last.gradient_norm,
+                 "" if converged else "  (not converged)"))
+        print("  %-34s v = %s" % ("", ", ".join("%.6f" % x for x in v)))
+
+def check_gradients(f, gradient, points):
+    for v in points:
+        assert np.allclose(gradient(*v), approx_gradient(f, v), rtol=1e-5, atol=1e-8)
+
+if __name__ == "__main__":
+    cost, gradient = logistic_problem()
+    check_gradients(cost, gradient, [(0, 0, 0), (1, 2, 3)])
+    report("logistic_cost from (0, 0, 0)", cost, gradient, [0, 0, 0], [
+        ("fixed, finite differences", False, dict(max_steps=10000)),
+        ("fixed, analytic", True, dict(max_steps=10000)),
+        ("backtracking", True, dict(method="backtracking", max_steps=10000)),
+        ("momentum", True, dict(method="momentum", max_steps=10000)),
+        ("adam, learning rate 0.1", True, dict(method="adam", max_steps=10000, learning_rate=0.1)),
+        ("backtracking, cost tolerance 1e-12", True, dict(method="backtracking", max_steps=10000, cost_tolerance=1e-12)),
+    ])
+    cost, gradient = coefficient_problem()
+    check_gradients(cost, gradient, [(0, 0), (-0.1, 0.3)])
+    report("scaled coefficient_cost from (0, 0)", cost, gradient, [0, 0], [
+        ("fixed, finite differences", False, dict(max_steps=100000)),
+        ("fixed, analytic", True, dict(max_steps=100000)),
+        ("backtracking", True, dict(method="backtracking", max_steps=100000)),
+        ("momentum", True, dict(method="momentum", max_steps=100000)),
+        ("adam, learning rate 0.01", True, dict(method="adam", max_steps=100000)),
+        ("backtracking, cost tolerance 1e-12", True, dict(method="backtracking", max_steps=100000, cost_tolerance=1e-12)),
+    ])
@@ -0,0 +1,128 @@
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from timeit import default_timer as timer
+import numpy as np
+
+# Rows per second and peak memory of StreamingLogistic on a synthetic stream
+# of BMW and Prius listings, generated a batch at a time, and on the same
+# kind of listings read from a .npy file. Each run is a fresh interpreter,
+# so its peak RSS is its own.
+# Run from this directory:  python bench_streaming.py [rows]
+
+def listing_statistics():
+    # mean and standard deviation of mileage and price for each make
+    from car_data import all_bmws, all_priuses
+    return [(cars.mileage.mean(), cars.mileage.std(), cars.price.mean(), cars.price.std())
+            for cars in (all_priuses, all_bmws)]
+
+def synthetic_stream(rows, size=8192, seed=0):
+    # batches of (mileage, price, is_bmw), half BMWs, mileage and price
+    # normally distributed with each make's mean and standard deviation
+    rng = np.random.default_rng(seed)
+    statistics = np.array(listing_statistics())
+    for start in range(0, rows, size):
+        count = min(size, rows - start)
+        is_bmw = rng.integers(0, 2, count)
+        mileage_mean, mileage_std, price_mean, price_std = statistics[is_bmw].T
+        batch = np.empty((count, 3))
+        batch[:, 0] = np.maximum(rng.normal(mileage_mean, mileage_std), 0)
+        batch[:, 1] = np.maximum(rng.normal(price_mean, price_std), 1000)
+        batch[:, 2] = is_bmw
+        yield batch
+
+def write_stream(path, batches, rows):
+    # a .npy file of an (rows, 3) array, written a batch at a time
+    with open(path, "wb") as f:
+        np.lib.format.write_array_header_1_0(
+            f, {"descr": "<f8", "fortran_order": False, "shape": (rows, 3)})
+        for batch in batches:
+            batch.astype("<f8").tofile(f)
+
+def peak_rss():
+    # in bytes. Linux's ru_maxrss survives exec, so a child would report its
+    # parent's peak if it was larger; VmHWM is the process's own.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def evaluate(coefficients, rows=10 ** 6):
+    # mean log loss and accuracy of sigmoid(a*mileage + b*price - c) on
+    # listings it wasn't trained on
+    from costs import logistic_log_loss
+    a, b, c = coefficients
+    loss, correct = 0.0, 0
+    for batch in synthetic_stream(rows, seed=1):
+        mileage, price, is_bmw = batch.T
+        cost, _ = logistic_log_loss(mileage, price, is_bmw)
+        loss += cost(a, b, c)
+        correct += int(np.sum((a * mileage + b * price - c > 0) == (is_bmw == 1)))
+    return loss / rows, correct / rows
+
+def train(source, rows, path=None):
+    # runs in a child process: prints rows, seconds, peak RSS before and
+    # after training, and the trained coefficients
+    from streaming import StreamingLogistic, file_batches
+    batches = file_batches(path) if source == "file" else synthetic_stream(rows)
+    listing_statistics()
+    baseline = peak_rss()
+    model = StreamingLogistic()
+    start = timer()
+    model.fit(batches)
+    elapsed = timer() - start
+    print(model.rows, elapsed, baseline, peak_rss(), *model.coefficients())
+
+def run(*args):
+    result = subprocess.run([sys.executable, __file__, *map(str, args)],
+                            capture_output=True, text=True, check=True)
+    rows, elapsed, baseline, peak, a, b, c = result.stdout.split()
+    return int(rows), float(elapsed), int(baseline), int(peak), (float(a), float(b), float(c))
+
+def report(label, rows, elapsed, baseline, peak):
+    print("%s: %d rows in %.1f s, %.2fM rows/s, peak RSS %.0f MiB (%.0f MiB before training)"
+          % (label, rows, elapsed, rows / elapsed / 1e6, peak / 2 ** 20, baseline / 2 ** 20))
+
+def reference_coefficients(rows=2 * 10 ** 5):
+    # the full-batch fit of an in-memory sample, for comparison
+    from costs import logistic_log_loss
+    from optimize import gradient_descent
+    from streaming import RunningMinMax
+    sample = np.vstack(list(synthetic_stream(rows, seed=2)))
+    mileage_scale, price_scale = RunningMinMax(), RunningMinMax()
+    mileage_scale.update(sample[:, 0])
+    price_scale.update(sample[:, 1])
+    cost, gradient = logistic_log_loss(mileage_scale.scale(sample[:, 0]),
+                                       price_scale.scale(sample[:, 1]), sample[:, 2])
+    a, b, c = gradient_descent(lambda a, b, c: cost(a, b, c) / rows, [0, 0, 0],
+                               gradient=lambda a, b, c: np.array(gradient(a, b, c)) / rows,
+                               method="backtracking", max_steps=10000, cost_tolerance=1e-12)
+    m, p = mileage_scale, price_scale
+    return a / m.width, b / p.width, c + a * m.offset / m.width + b * p.offset / p.width
+
+def bench_streaming(rows):
+    streamed, elapsed, baseline, peak, coefficients = run("stream", rows)
+    report("synthetic stream", streamed, elapsed, baseline, peak)
+    print("  holding the rows in memory would take %.0f MiB" % (rows * 3 * 8 / 2 ** 20))
+    for label, fitted in (("streamed", coefficients),
+                          ("full batch, 2*10^5 rows", reference_coefficients())):
+        loss, accuracy = evaluate(fitted)
+        print("  %-23s held-out log loss %.4f, accuracy %.2f%%, coefficients %s"
+              % (label, loss, 100 * accuracy, ", ".join("%.3g" % x for x in fitted)))
+    file_rows = min(rows, 10 ** 7)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "listings.npy")
+        write_stream(path, synthetic_stream(file_rows), file_rows)
+        report("file", *run("file", file_rows, path)[:4])
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        train(sys.argv[1], int(sys.argv[2]), *sys.argv[3:])
+    else:
+        bench_streaming(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 8)
@@ -1,334 +1,40 @@
-all_bmws = [('bmw', '5', 2013.0, 93404.0, 13999.0, 22.09145859494213),
- ('bmw', '5', 2013.0, 110890.0, 13995.0, 22.216458611342592),
- ('bmw', '5', 2013.0, 94133.0, 13982.0, 22.09145862741898),
- ('bmw', '5', 2013.0, 46778.0, 14599.0, 22.217153096608797),
- ('bmw', '5', 2013.0, 53106.0, 22500.0, 22.09215310892361),
- ('bmw', '5', 2013.0, 58761.0, 24998.0, 22.092153121840276),
- ('bmw', '5', 2013.0, 108816.0, 24947.0, 22.133819800694443),
- ('bmw', '5', 2013.0, 81100.0, 13995.0, 22.092847590439813),
- ('bmw', '5', 2013.0, 90000.0, 8400.0, 1.5456253721759259),
- ('bmw', '5', 2013.0, 68613.0, 14995.0, 22.134514275960647),
- ('bmw', '5', 2013.0, 94000.0, 11995.0, 1.4428476133564814),
- ('bmw', '5', 2013.0, 92500.0, 10995.0, 22.092847621446758),
- ('bmw', '5', 2013.0, 112081.0, 11995.0, 22.217847629456017),
- ('bmw', '5', 2013.0, 105121.0, 11500.0, 22.092847637488426),
- ('bmw', '5', 2013.0, 92000.0, 2013.0, 2.2039587605555555),
- ('bmw', '5', 2013.0, 107953.0, 12999.0, 22.094930986747684),
- ('bmw', '5', 2013.0, 56000.0, 18995.0, 2.385903212916667),
- ('bmw', '5', 2013.0, 101191.0, 18900.0, 22.09562544710648),
- ('bmw', '5', 2013.0, 64365.0, 16998.0, 22.221319912546296),
- ('bmw', '5', 2013.0, 66000.0, 10000.0, 3.288681027662037),
- ('bmw', '5', 2013.0, 76675.0, 12500.0, 22.140069920555554),
- ('bmw', '5', 2013.0, 93015.0, 15995.0, 22.22479215880787),
- ('bmw', '5', 2013.0, 80917.0, 14970.0, 22.102569952523147),
- ('bmw', '5', 2013.0, 96000.0, 16795.0, 22.103958849386576),
- ('bmw', '5', 2013.0, 70000.0, 12999.0, 4.237292186701389),
- ('bmw', '5', 2013.0, 107000.0, 11950.0, 4.747014416990741),
- ('bmw', '5', 2013.0, 78000.0, 18995.0, 6.703958900231481),
- ('bmw', '5', 2013.0, 78000.0, 15000.0, 9.259514508877315),
- ('bmw', '5', 2013.0, 92000.0, 2013.0, 10.312292300405092),
- ('bmw', '5', 2014.0, 57624.0, 21963.0, 22.092155934247685),
- ('bmw', '5', 2014.0, 77854.0, 16995.0, 22.092155976689813),
- ('bmw', '5', 2014.0, 48310.0, 22998.0, 22.133822662627313),
- ('bmw', '5', 2014.0, 51656.0, 20998.0, 22.09285046203704),
- ('bmw', '5', 2014.0, 62410.0, 19991.0, 22.13451714667824),
- ('bmw', '5', 2014.0, 39332.0, 29995.0, 22.134517164814813),
- ('bmw', '5', 2014.0, 31420.0, 21000.0, 22.093544993344906),
- ('bmw', '5', 2014.0, 41267.0, 22450.0, 22.219933914097222),
- ('bmw', '5', 2014.0, 73000.0, 19999.0, 2.3220172670601853),
- ('bmw', '5', 2014.0, 94608.0, 11995.0, 22.096322842777777),
- ('bmw', '5', 2014.0, 67000.0, 24964.0, 22.140072872604165),
- ('bmw', '5', 2014.0, 50000.0, 18985.0, 4.374100707777778),
- ('bmw', '5', 2014.0, 73601.0, 16999.0, 22.1414618275),
- ('bmw', '5', 2014.0, 50000.0, 18985.0, 4.403961832592593),
- ('bmw', '5', 2014.0, 95229.0, 15980.0, 22.100489615011575),
- ('bmw', '5', 2014.0, 69000.0, 27247.0, 22.22618406849537),
- ('bmw', '5', 2014.0, 73309.0, 13790.0, 22.10187853105324),
- ('bmw', '5', 2014.0, 41573.0, 21970.0, 22.106045216435184),
- ('bmw', '5', 2014.0, 42172.0, 25842.0, 22.11090633650463),
- ('bmw', '5', 2014.0, 41085.0, 18750.0, 22.15326745648148),
- ('bmw', '5', 2014.0, 81625.0, 13990.0, 22.153267465381944),
- ('bmw', '5', 2014.0, 38000.0, 24900.0, 11.504656385451389),
- ('bmw', '5', 2014.0, 65000.0, 12000.0, 11.672017502094908),
- ('bmw', '5', 2014.0, 103000.0, 16495.0, 11.75951751337963),
- ('bmw', '5', 2014.0, 76000.0, 18500.0, 13.639378653090278),
- ('bmw', '5', 2014.0, 34000.0, 19950.0, 15.112295337476851),
- ('bmw', '5', 2014.0, 66000.0, 29500.0, 18.34146204193287),
- ('bmw', '5', 2015.0, 36756.0, 18999.0, 22.09215845349537),
- ('bmw', '5', 2015.0, 42681.0, 26697.0, 22.092852914201387),
- ('bmw', '5', 2015.0, 29000.0, 29997.0, 22.094936281550925),
- ('bmw', '5', 2015.0, 51000.0, 26968.0, 22.139380758344906),
- ('bmw', '5', 2015.0, 26000.0, 25980.0, 22.098408552118055),
- ('bmw', '5', 2015.0, 88262.0, 18338.0, 22.18313079122685),
- ('bmw', '5', 2015.0, 48321.0, 21322.0, 22.101880809050925),
- ('bmw', '5', 2015.0, 93762.0, 16991.0, 22.122019742939816),
- ('bmw', '5', 2015.0, 79972.0, 16499.0, 22.124797528680556),
- ('bmw', '5', 2015.0, 54177.0, 20774.0, 22.16715864775463),
- ('bmw', '5', 2015.0, 43294.0, 21800.0, 22.128269774780094),
- ('bmw', '5', 2015.0, 55736.0, 24985.0, 22.128964235254628),
- ('bmw', '5', 2015.0, 74896.0, 22599.0, 22.13313091207176),
- ('bmw', '5', 2015.0, 72282.0, 20770.0, 22.13313092011574),
- ('bmw', '5', 2015.0, 58328.0, 22000.0, 23.08868648365741),
- ('bmw', '5', 2015.0, 49856.0, 20998.0, 23.088686491631943),
- ('bmw', '5', 2015.0, 42229.0, 21998.0, 23.213686499618056),
- ('bmw', '5', 2015.0, 38126.0, 25998.0, 23.21368650758102),
- ('bmw', '5', 2015.0, 46000.0, 21900.0, 13.187297646747686),
- ('bmw', '5', 2015.0, 95000.0, 18500.0, 22.25813103615741),
- ('bmw', '5', 2015.0, 30000.0, 19899.0, 22.426186595729167),
- ('bmw', '5', 2015.0, 63000.0, 21500.0, 22.40674215525463),
- ('bmw', '5', 2016.0, 39835.0, 27629.0, 22.09146657775463),
- ('bmw', '5', 2016.0, 51043.0, 25964.0, 22.133133256782408),
- ('bmw', '5', 2016.0, 27000.0, 30998.0, 22.092161046631944),
- ('bmw', '5', 2016.0, 39591.0, 25000.0, 22.092161058738427),
- ('bmw', '5', 2016.0, 37703.0, 35990.0, 22.13382773744213),
- ('bmw', '5', 2016.0, 41467.0, 30254.0, 22.133827751574074),
- ('bmw', '5', 2016.0, 83000.0, 15900.0, 1.3852166609375),
- ('bmw', '5', 2016.0, 58623.0, 21998.0, 22.092161109351853),
- ('bmw', '5', 2016.0, 57276.0, 21998.0, 22.092161117314816),
- ('bmw', '5', 2016.0, 27620.0, 23998.0, 22.217161125300926),
- ('bmw', '5', 2016.0, 40237.0, 21998.0, 22.217855593611112),
- ('bmw', '5', 2016.0, 52961.0, 22998.0, 22.21785560954861),
- ('bmw', '5', 2016.0, 36707.0, 34888.0, 22.217855627511575),
- ('bmw', '5', 2016.0, 42363.0, 29891.0, 22.092855635555555),
- ('bmw', '5', 2016.0, 44943.0, 23697.0, 22.09285564429398),
- ('bmw', '5', 2016.0, 90000.0, 11000.0, 2.642161203877315),
- ('bmw', '5', 2016.0, 90000.0, 13000.0, 2.7886889896412037),
- ('bmw', '5', 2016.0, 42470.0, 30977.0, 22.134522342974538),
- ('bmw', '5', 2016.0, 27000.0, 20999.0, 22.092855684270834),
- ('bmw', '5', 2016.0, 37000.0, 31990.0, 4.252577918900463),
- ('bmw', '5', 2016.0, 63000.0, 2016.0, 4.3220223673263884),
- ('bmw', '5', 2016.0, 51000.0, 2016.0, 4.32202237130787),
- ('bmw', '5', 2016.0, 63000.0, 2016.0, 5.695633527094907),
- ('bmw', '5', 2016.0, 75000.0, 26500.0, 6.701189110821759),
- ('bmw', '5', 2017.0, 38488.0, 39998.0, 23.089385847430556),
- ('bmw', '5', 2017.0, 35136.0, 32495.0, 23.217163639456018),
- ('bmw', '5', 2017.0, 31000.0, 36488.0, 23.110219247118057),
- ('bmw', '5', 2017.0, 26856.0, 36800.0, 24.215774870960647),
- ('bmw', '5', 2017.0, 31499.0, 37990.0, 24.216469323460647),
- ('bmw', '5', 2017.0, 56979.0, 30990.0, 24.134524887118054),
- ('bmw', '5', 2017.0, 34368.0, 35998.0, 24.14633048511574),
- ('bmw', '5', 2018.0, 36242.0, 37400.0, 23.21438951005787),
- ('bmw', '5', 2016.0, 39835.0, 27629.0, 22.091481143877314),
- ('bmw', '5', 2003.0, 92000.0, 6995.0, -0.41407440324074074),
- ('bmw', '5', 2010.0, 82000.0, 8990.0, 22.216481156527777),
- ('bmw', '5', 2012.0, 75643.0, 14995.0, 22.216481168912036),
- ('bmw', '5', 2013.0, 93404.0, 13999.0, 22.091481181377315),
- ('bmw', '5', 2008.0, 61000.0, 9999.0, 22.091481193738424),
- ('bmw', '5', 2008.0, 239144.0, 7600.0, 22.133147874756943),
- ('bmw', '5', 2003.0, 118000.0, 1800.0, -0.4460187825347222),
- ('bmw', '5', 2016.0, 51043.0, 25964.0, 22.133147888287038),
- ('bmw', '5', 2013.0, 110890.0, 13995.0, 22.216481233958334),
- ('bmw', '5', 2013.0, 94133.0, 13982.0, 22.091481246064816),
- ('bmw', '5', 2014.0, 57624.0, 21963.0, 22.092175754837964),
- ('bmw', '5', 2016.0, 27000.0, 30998.0, 22.092175767164353),
- ('bmw', '5', 2016.0, 39591.0, 25000.0, 22.092175792291666),
- ('bmw', '5', 2016.0, 37703.0, 35990.0, 22.133842471273148),
- ('bmw', '5', 2016.0, 41467.0, 30254.0, 22.133842486666666),
- ('bmw', '5', 2013.0, 46778.0, 14599.0, 22.217175833703703),
- ('bmw', '5', 2006.0, 230000.0, 2500.0, -0.2724074530555556),
- ('bmw', '5', 2013.0, 53106.0, 22500.0, 22.09217588644676),
- ('bmw', '5', 2012.0, 101000.0, 11900.0, -0.18837964028935186),
- ('bmw', '5', 2012.0, 101000.0, 11900.0, -0.18560185365740742),
- ('bmw', '5', 2012.0, 101000.0, 11900.0, -0.18351851091435184),
- ('bmw', '5', 1994.0, 99000.0, 9950.0, -0.20435183996527778),
- ('bmw', '5', 2011.0, 100000.0, 8750.0, 0.07273151003472222),
- ('bmw', '5', 2006.0, 97000.0, 13995.0, 0.14773151837962964),
- ('bmw', '5', 2001.0, 180000.0, 2000.0, 0.3012037489699074),
- ('bmw', '5', 2002.0, 79000.0, 3995.0, 0.40189822296296296),
- ('bmw', '5', 1998.0, 150000.0, 1700.0, 0.5442593475462963)]
+import os
 
-all_priuses = [('toyota', 'prius', 2013.0, 59014.0, 13995.0, 22.133071303449075),
- ('toyota', 'prius', 2013.0, 70000.0, 9900.0, -0.5474842421527778),
- ('toyota', 'prius', 2013.0, 84507.0, 14998.0, 22.21779354375),
- ('toyota', 'prius', 2013.0, 76000.0, 8300.0, -0.3829008967013889),
- ('toyota', 'prius', 2013.0, 41868.0, 15998.0, 22.21779355574074),
- ('toyota', 'prius', 2013.0, 40631.0, 13991.0, 22.135154678842593),
- ('toyota', 'prius', 2013.0, 74000.0, 10532.0, 145.18932135427085),
- ('toyota', 'prius', 2013.0, 69703.0, 12900.0, 22.178904691585647),
- ('toyota', 'prius', 2013.0, 37000.0, 15850.0, -0.37873419333333336),
- ('toyota', 'prius', 2013.0, 33000.0, 13995.0, 22.137238036898147),
- ('toyota', 'prius', 2013.0, 75000.0, 9500.0, -0.35442862578703704),
- ('toyota', 'prius', 2013.0, 35000.0, 11100.0, 67.98654360039352),
- ('toyota', 'prius', 2013.0, 97109.0, 11991.0, 22.096960271018517),
- ('toyota', 'prius', 2013.0, 128882.0, 8359.0, 22.097654727395835),
- ('toyota', 'prius', 2013.0, 39000.0, 13759.0, 22.09904362422454),
- ('toyota', 'prius', 2013.0, 65000.0, 13990.0, 0.3101547393287037),
- ('toyota', 'prius', 2013.0, 37000.0, 12950.0, 22.103210321516205),
- ('toyota', 'prius', 2013.0, 130000.0, 9500.0, 1.4927936669791666),
- ('toyota', 'prius', 2013.0, 63430.0, 12995.0, 22.23307145681713),
- ('toyota', 'prius', 2013.0, 120000.0, 7600.0, 2.3712659132407405),
- ('toyota', 'prius', 2013.0, 74000.0, 9000.0, 2.6823770322916665),
- ('toyota', 'prius', 2013.0, 46000.0, 13982.0, 22.235849258483796),
- ('toyota', 'prius', 2013.0, 73428.0, 14991.0, 22.11362704420139),
- ('toyota', 'prius', 2013.0, 200000.0, 7950.0, 3.3177937299537037),
- ('toyota', 'prius', 2013.0, 88180.0, 12998.0, 23.088627077650465),
- ('toyota', 'prius', 2013.0, 89466.0, 14599.0, 23.13029375619213),
- ('toyota', 'prius', 2013.0, 76985.0, 11990.0, 23.088627103159723),
- ('toyota', 'prius', 2013.0, 65000.0, 13990.0, 4.444877107835648),
- ('toyota', 'prius', 2013.0, 63621.0, 12395.0, 23.130988223530093),
- ('toyota', 'prius', 2013.0, 96000.0, 7900.0, 4.6490437835763885),
- ('toyota', 'prius', 2013.0, 74000.0, 9000.0, 4.69765490369213),
- ('toyota', 'prius', 2013.0, 75000.0, 11000.0, 5.379599361689815),
- ('toyota', 'prius', 2013.0, 143000.0, 8999.0, 5.449738259525463),
- ('toyota', 'prius', 2013.0, 112000.0, 8900.0, 7.4025160783680555),
- ('toyota', 'prius', 2013.0, 74000.0, 9000.0, 7.492099420717593),
- ('toyota', 'prius', 2013.0, 185000.0, 5950.0, 8.643488344004629),
- ('toyota', 'prius', 2014.0, 80424.0, 13000.0, 22.133073873333334),
- ('toyota', 'prius', 2014.0, 48655.0, 17998.0, 22.09279610804398),
- ('toyota', 'prius', 2014.0, 102000.0, 9997.0, 59.38724056059028),
- ('toyota', 'prius', 2014.0, 67508.0, 14991.0, 22.220573909988428),
- ('toyota', 'prius', 2014.0, 39395.0, 18998.0, 22.220573918032407),
- ('toyota', 'prius', 2014.0, 44531.0, 16577.0, 22.097657259363427),
- ('toyota', 'prius', 2014.0, 68000.0, 12495.0, 2.253212818912037),
- ('toyota', 'prius', 2014.0, 35000.0, 11999.0, 22.098351711782406),
- ('toyota', 'prius', 2014.0, 68000.0, 12495.0, 2.2573794935879627),
- ('toyota', 'prius', 2014.0, 115000.0, 10900.0, 2.2698795015740743),
- ('toyota', 'prius', 2014.0, 66293.0, 14472.0, 22.102518394560185),
- ('toyota', 'prius', 2014.0, 141000.0, 10000.0, 2.596962842997685),
- ('toyota', 'prius', 2014.0, 109496.0, 9677.0, 22.103907291400464),
- ('toyota', 'prius', 2014.0, 82000.0, 7500.0, 3.4275184144675928),
- ('toyota', 'prius', 2014.0, 106361.0, 10953.0, 22.148351751770832),
- ('toyota', 'prius', 2014.0, 187000.0, 8800.0, 4.657379541527778),
- ('toyota', 'prius', 2014.0, 76912.0, 11993.0, 22.11293510107639),
- ('toyota', 'prius', 2014.0, 117000.0, 9450.0, 5.746962882824074),
- ('toyota', 'prius', 2014.0, 113963.0, 11494.0, 22.159462886782407),
- ('toyota', 'prius', 2014.0, 72000.0, 12490.0, 5.752518446319445),
- ('toyota', 'prius', 2014.0, 71218.0, 11994.0, 22.1184906725),
- ('toyota', 'prius', 2014.0, 48924.0, 13786.0, 23.08862957738426),
- ('toyota', 'prius', 2014.0, 100000.0, 7800.0, 8.531685136909722),
- ('toyota', 'prius', 2014.0, 98531.0, 10979.0, 23.08862958534722),
- ('toyota', 'prius', 2014.0, 43015.0, 16977.0, 23.134462926689814),
- ('toyota', 'prius', 2014.0, 29695.0, 16599.0, 23.140018490266204),
- ('toyota', 'prius', 2014.0, 44640.0, 16900.0, 23.140712942662038),
- ('toyota', 'prius', 2014.0, 56478.0, 13990.0, 23.18237961728009),
- ('toyota', 'prius', 2014.0, 114959.0, 11060.0, 23.09974073729167),
- ('toyota', 'prius', 2014.0, 83861.0, 13000.0, 23.099740745266203),
- ('toyota', 'prius', 2015.0, 91314.0, 11911.0, 22.13307795650463),
- ('toyota', 'prius', 2015.0, 37000.0, 16375.0, -0.4558109197685185),
- ('toyota', 'prius', 2015.0, 46000.0, 14500.0, 74.84696686222222),
- ('toyota', 'prius', 2015.0, 45358.0, 16991.0, 22.133772421828702),
- ('toyota', 'prius', 2015.0, 68432.0, 16998.0, 22.217800216689813),
- ('toyota', 'prius', 2015.0, 37739.0, 19998.0, 22.13446689949074),
- ('toyota', 'prius', 2015.0, 89352.0, 12995.0, 22.092800251805556),
- ('toyota', 'prius', 2015.0, 65000.0, 13500.0, 0.4115502655439815),
- ('toyota', 'prius', 2015.0, 61000.0, 13000.0, 88.35738360476851),
- ('toyota', 'prius', 2015.0, 35385.0, 13988.0, 22.094883609421295),
- ('toyota', 'prius', 2015.0, 65000.0, 13500.0, 0.43516139172453705),
- ('toyota', 'prius', 2015.0, 57000.0, 16791.0, 22.09488362309028),
- ('toyota', 'prius', 2015.0, 90019.0, 14790.0, 22.09557807642361),
- ('toyota', 'prius', 2015.0, 136095.0, 11595.0, 22.222661420138888),
- ('toyota', 'prius', 2015.0, 27000.0, 16235.0, 22.22405031806713),
- ('toyota', 'prius', 2015.0, 54480.0, 17910.0, 22.099744774768517),
- ('toyota', 'prius', 2015.0, 100000.0, 16000.0, 22.228217027777777),
- ('toyota', 'prius', 2015.0, 65899.0, 16482.0, 22.103911485138887),
- ('toyota', 'prius', 2015.0, 27000.0, 17734.0, 22.146272617002314),
- ('toyota', 'prius', 2015.0, 144000.0, 9800.0, 1.7434948433680555),
- ('toyota', 'prius', 2015.0, 26989.0, 17925.0, 22.23099484741898),
- ('toyota', 'prius', 2015.0, 67662.0, 13400.0, 22.10807819372685),
- ('toyota', 'prius', 2015.0, 38401.0, 16998.0, 22.23307820184028),
- ('toyota', 'prius', 2015.0, 80982.0, 13999.0, 22.23516154334491),
- ('toyota', 'prius', 2015.0, 43000.0, 17492.0, 22.19696711497685),
- ('toyota', 'prius', 2015.0, 87428.0, 11794.0, 22.117106025856483),
- ('toyota', 'prius', 2015.0, 34028.0, 17491.0, 22.243494924247685),
- ('toyota', 'prius', 2015.0, 37000.0, 15800.0, 4.574744933425926),
- ('toyota', 'prius', 2015.0, 32000.0, 20995.0, 5.242106066574074),
- ('toyota', 'prius', 2015.0, 89000.0, 12999.0, 6.782383888078703),
- ('toyota', 'prius', 2015.0, 64000.0, 15000.0, 7.580300589027778),
- ('toyota', 'prius', 2015.0, 45000.0, 16900.0, 8.490717274699074),
- ('toyota', 'prius', 2015.0, 38000.0, 13500.0, 9.501828402071759),
- ('toyota', 'prius', 2015.0, 71000.0, 12500.0, 9.621967299004629),
- ('toyota', 'prius', 2016.0, 54000.0, 16986.0, 23.735165327233798),
- ('toyota', 'prius', 2016.0, 38000.0, 16998.0, 0.6532209039930555),
- ('toyota', 'prius', 2016.0, 53759.0, 17995.0, 22.09210980476852),
- ('toyota', 'prius', 2016.0, 26796.0, 20998.0, 22.13377649133102),
- ('toyota', 'prius', 2016.0, 47015.0, 21887.0, 22.21710983302083),
- ('toyota', 'prius', 2016.0, 100000.0, 20491.0, 22.092109842638887),
- ('toyota', 'prius', 2016.0, 70090.0, 19998.0, 22.21710985097222),
- ('toyota', 'prius', 2016.0, 49249.0, 20990.0, 22.175443192696758),
- ('toyota', 'prius', 2016.0, 40080.0, 18998.0, 22.21710986761574),
- ('toyota', 'prius', 2016.0, 25764.0, 18998.0, 22.176137658148146),
- ('toyota', 'prius', 2016.0, 53396.0, 17147.0, 22.217804351261574),
- ('toyota', 'prius', 2016.0, 108531.0, 14988.0, 22.217804369953704),
- ('toyota', 'prius', 2016.0, 31000.0, 20981.0, 22.21780438060185),
- ('toyota', 'prius', 2016.0, 100000.0, 17700.0, 22.093498896574076),
- ('toyota', 'prius', 2016.0, 59424.0, 19490.0, 22.218498911851853),
- ('toyota', 'prius', 2016.0, 48000.0, 19998.0, 22.09488781818287),
- ('toyota', 'prius', 2016.0, 44548.0, 19688.0, 22.221276731493056),
- ('toyota', 'prius', 2016.0, 26000.0, 19500.0, 6.724748982974537),
- ('toyota', 'prius', 2016.0, 64896.0, 18886.0, 22.096971218194444),
- ('toyota', 'prius', 2016.0, 38000.0, 17998.0, 7.582387898865741),
- ('toyota', 'prius', 2016.0, 63000.0, 16950.0, 10.80391575394676),
- ('toyota', 'prius', 2016.0, 38000.0, 17998.0, 14.394193580983796),
- ('toyota', 'prius', 2016.0, 150000.0, 11250.0, 14.29836025287037),
- ('toyota', 'prius', 2017.0, 100000.0, 21990.0, 22.135168480081017),
- ('toyota', 'prius', 2017.0, 27407.0, 20991.0, 22.13655740753472),
- ('toyota', 'prius', 2017.0, 100000.0, 19991.0, 22.220585214305554),
- ('toyota', 'prius', 2017.0, 28189.0, 20495.0, 22.221279742060187),
- ('toyota', 'prius', 2017.0, 94000.0, 13900.0, 10.251835302175927),
- ('toyota', 'prius', 2017.0, 53581.0, 18274.0, 22.097668666712963),
- ('toyota', 'prius', 2017.0, 38163.0, 19887.0, 22.182390905266203),
- ('toyota', 'prius', 2017.0, 83501.0, 16311.0, 22.183779802222222),
- ('toyota', 'prius', 2017.0, 26000.0, 20500.0, 15.218502058101851),
- ('toyota', 'prius', 2017.0, 100000.0, 24995.0, 22.103918728819444),
- ('toyota', 'prius', 2017.0, 33520.0, 19999.0, 22.230307635462964),
- ('toyota', 'prius', 2017.0, 41572.0, 19500.0, 22.231696535104167),
- ('toyota', 'prius', 2017.0, 94447.0, 12995.0, 22.150446572777778),
- ('toyota', 'prius', 2017.0, 31000.0, 17000.0, 28.66919669826389),
- ('toyota', 'prius', 2018.0, 27000.0, 22900.0, 22.091421611203703),
- ('toyota', 'prius', 2018.0, 30610.0, 21097.0, 22.092116132858795),
- ('toyota', 'prius', 2018.0, 32000.0, 19950.0, 22.217810605358796),
- ('toyota', 'prius', 2018.0, 27236.0, 23743.0, 22.13586617925926),
- ('toyota', 'prius', 2018.0, 29000.0, 23500.0, 13.560866201631944),
- ('toyota', 'prius', 2018.0, 36271.0, 20445.0, 22.099060650486113),
- ('toyota', 'prius', 2018.0, 100000.0, 25206.0, 22.099755103819444),
- ('toyota', 'prius', 2018.0, 33540.0, 18950.0, 22.106005175555556),
- ('toyota', 'prius', 2018.0, 50186.0, 18477.0, 22.10808851773148),
- ('toyota', 'prius', 2018.0, 100000.0, 23999.0, 22.151144083449076),
- ('toyota', 'prius', 2018.0, 54513.0, 17582.0, 22.2476719040625),
- ('toyota', 'prius', 2018.0, 36638.0, 19177.0, 22.124060801828705),
- ('toyota', 'prius', 2018.0, 31971.0, 17996.0, 22.12406080994213),
- ('toyota', 'prius', 2019.0, 100000.0, 27600.0, 22.10253525502315),
- ('toyota', 'prius', 2019.0, 100000.0, 23388.0, 24.217118668645835),
- ('toyota', 'prius', 2019.0, 100000.0, 24989.0, 24.232396470451388),
- ('toyota', 'prius', 2019.0, 100000.0, 27488.0, 25.22197983650463),
- ('toyota', 'prius', 2019.0, 100000.0, 26804.0, 25.10045206269676),
- ('toyota', 'prius', 2011.0, 89929.0, 12495.0, 22.13309390300926),
- ('toyota', 'prius', 2018.0, 27000.0, 22900.0, 22.091427259409723),
- ('toyota', 'prius', 2014.0, 80424.0, 13000.0, 22.13309395201389),
- ('toyota', 'prius', 2013.0, 59014.0, 13995.0, 22.133093968506945),
- ('toyota', 'prius', 2007.0, 138001.0, 5900.0, 22.174760647407407),
- ('toyota', 'prius', 2015.0, 65000.0, 13500.0, 0.4115662111226852),
- ('toyota', 'prius', 2015.0, 91314.0, 11911.0, 22.133093993252317),
- ('toyota', 'prius', 2013.0, 65000.0, 13990.0, 0.3101773538888889),
- ('toyota', 'prius', 2015.0, 65000.0, 13500.0, 0.4351773664236111),
- ('toyota', 'prius', 2007.0, 209395.0, 2200.0, 22.174760703958334),
- ('toyota', 'prius', 2009.0, 196000.0, 3000.0, 0.43656626990740743),
- ('toyota', 'prius', 2007.0, 201452.0, 3995.0, 22.09142738597222),
- ('toyota', 'prius', 2016.0, 53759.0, 17995.0, 22.092121859016203),
- ('toyota', 'prius', 2016.0, 26796.0, 20998.0, 22.133788554074073),
- ('toyota', 'prius', 2016.0, 47015.0, 21887.0, 22.21712190179398),
- ('toyota', 'prius', 2016.0, 100000.0, 20491.0, 22.092121915625),
- ('toyota', 'prius', 2016.0, 70090.0, 19998.0, 22.21712194681713),
- ('toyota', 'prius', 2016.0, 49249.0, 20990.0, 22.175455298402778),
- ('toyota', 'prius', 2009.0, 109996.0, 10598.0, 22.092121979641203),
- ('toyota', 'prius', 2008.0, 175000.0, 2008.0, 0.3685108771643518),
- ('toyota', 'prius', 2010.0, 125247.0, 10599.0, 22.133788659131945),
- ('toyota', 'prius', 2018.0, 30610.0, 21097.0, 22.092122007824074),
- ('toyota', 'prius', 2015.0, 45358.0, 16991.0, 22.133788694270834),
- ('toyota', 'prius', 2016.0, 40080.0, 18998.0, 22.21712204357639),
- ('toyota', 'prius', 2011.0, 103692.0, 10998.0, 22.092816497199074),
- ('toyota', 'prius', 2016.0, 38000.0, 16998.0, 0.6532332185416667),
- ('toyota', 'prius', 2004.0, 157000.0, 3000.0, 0.7226777025925926),
- ('toyota', 'prius', 2008.0, 201000.0, 4600.0, 0.61712215125)]
+# The listings are stored by column in the all_priuses and all_bmws
+# directories next to this file (see car_dataset.py). Importing this module
+# reads nothing (and doesn't import NumPy): each dataset below is built the
+# first time it's used, from columns memory-mapped from the files, and then
+# kept.
 
-class Car():
-    def __init__(self,*args):
-        self.make = args[0]
-        self.model = args[1]
-        self.year = args[2]
-        self.mileage = args[3]
-        self.price = args[4]
-        self.time_posted = args[5]
-        
-priuses = [Car(*p) for p in all_priuses[:100]]
-bmws = [Car(*b) for b in all_bmws[:100]]
\ No newline at end of file
+_directory = os.path.dirname(os.path.abspath(__file__))
+
+def _stored(name):
+    def load():
+        from car_dataset import CarDataset
+        return CarDataset.load(os.path.join(_directory, name), mmap_mode="r")
+    return load
+
+def _first_hundred(name):
+    return lambda: __getattr__(name)[:100]
+
+def _car():
+    from car_dataset import Car
+    return Car
+
+_lazy = {
+    "all_bmws": _stored("all_bmws"),
+    "all_priuses": _stored("all_priuses"),
+    "priuses": _first_hundred("all_priuses"),
+    "bmws": _first_hundred("all_bmws"),
+    "Car": _car
+}
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    if name not in globals():
+        globals()[name] = _lazy[name]()
+    return globals()[name]
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
@@ -0,0 +1,75 @@
+import numpy as np
+
+# Cost functions over whole datasets. Each builder takes the data as arrays
+# once (converting, scaling and labeling it up front) and returns a pair of
+# closures, (cost, gradient), each computing its result as one NumPy
+# expression over all the rows instead of calling a model per row:
+#
+#   cost, gradient = logistic_log_loss(mileages, prices, is_bmw)
+#   cost(a, b, c), gradient(a, b, c)
+#
+# The gradients are analytic, so a step of gradient descent costs one pass
+# over the data rather than two cost evaluations per coordinate.
+
+def labeled_cars(bmws, priuses):
+    # (mileage, price, is_bmw) arrays for two CarDatasets, BMWs first, like
+    # all_car_data in the notebook
+    mileage = np.concatenate([bmws.mileage, priuses.mileage])
+    price = np.concatenate([bmws.price, priuses.price])
+    is_bmw = np.concatenate([np.ones(len(bmws)), np.zeros(len(priuses))])
+    return mileage, price, is_bmw
+
+def make_scale(data):
+    # the notebook's min-max scaling, for numbers or arrays
+    data = np.asarray(data, dtype=float)
+    min_val, max_val = float(data.min()), float(data.max())
+    def scale(x):
+        return (x-min_val) / (max_val - min_val)
+    def unscale(y):
+        return y * (max_val - min_val) + min_val
+    return scale, unscale
+
+def sum_squared_error(f, x, y):
+    # for a model f that works on arrays, e.g. lambda x: a * x + b
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    return float(np.sum((f(x) - y) ** 2))
+
+def line_squared_error(x, y):
+    # the sum of squared errors of y = a * x + b, as cost(a, b), and its
+    # gradient (d/da, d/db)
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    def cost(a, b):
+        return float(np.sum((a * x + b - y) ** 2))
+    def gradient(a, b):
+        error = a * x + b - y
+        return 2 * float(error @ x), 2 * float(error.sum())
+    return cost, gradient
+
+def exponential_squared_error(x, y):
+    # the same for y = q * e^(r * x), as cost(q, r) and gradient (d/dq, d/dr)
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    def cost(q, r):
+        return float(np.sum((q * np.exp(r * x) - y) ** 2))
+    def gradient(q, r):
+        e = np.exp(r * x)
+        error = q * e - y
+        return 2 * float(error @ e), 2 * q * float(error @ (x * e))
+    return cost, gradient
+
+def logistic_log_loss(x, p, is_bmw):
+    # The notebook's logistic_cost for sigmoid(a*x + b*p - c): the sum over
+    # the rows of -log(l) for BMWs and -log(1 - l) for the others, as
+    # cost(a, b, c), and its gradient (d/da, d/db, d/dc).
+    # -log(sigmoid(z)) is log(1 + e^(-z)), computed with logaddexp so it
+    # doesn't overflow or round to log(0) for large |z|.
+    x, p = np.asarray(x, dtype=float), np.asarray(p, dtype=float)
+    is_bmw = np.asarray(is_bmw, dtype=float)
+    # -z for BMWs and z for the others
+    sign = 1 - 2 * is_bmw
+    def cost(a, b, c):
+        return float(np.sum(np.logaddexp(0, sign * (a * x + b * p - c))))
+    def gradient(a, b, c):
+        # d(cost)/dz is sigmoid(z) - is_bmw for each row
+        error = np.exp(-np.logaddexp(0, -(a * x + b * p - c))) - is_bmw
+        return float(error @ x), float(error @ p), -float(error.sum())
+    return cost, gradient
@@ -0,0 +1,118 @@
+from collections import namedtuple
+from timeit import default_timer as timer
+import numpy as np
+
+# Gradient descent for a function of several numbers, f(*v), like the
+# notebook's gradient_descent(f, vstart) but taking the gradient as a
+# function too (e.g. the analytic ones from costs.py), with a choice of step
+# rules and stopping criteria, and reporting each step to a callback:
+#
+#   cost, gradient = logistic_log_loss(x, p, is_bmw)
+#   gradient_descent(cost, [0, 0, 0], gradient=gradient, method="backtracking")
+#
+# Steps:
+#   "fixed"         v -= learning_rate * grad, as in the notebook
+#   "backtracking"  the step is halved until it reduces f enough (Armijo's
+#                   condition), and tried at double the size next time
+#   "momentum"      v -= learning_rate * velocity, the velocity a decaying
+#                   sum of past gradients
+#   "adam"          steps scaled per coordinate by running averages of the
+#                   gradient and its square
+#
+# It stops when the gradient's length is below `tolerance`, after max_steps
+# steps or max_time seconds, when a step changes f by at most
+# cost_tolerance (relative) or moves v by at most step_tolerance, or when
+# the callback returns True.
+
+# step_size is the learning rate, or for "backtracking" the step the line
+# search accepted (0 if it found none); step_length is how far v moved.
+Iteration = namedtuple("Iteration", ["step", "v", "cost", "gradient_norm", "step_size",
+                                     "step_length", "time"])
+
+methods = ("fixed", "backtracking", "momentum", "adam")
+
+def approx_gradient(f, v, dx=1e-6):
+    # central differences, two evaluations of f per coordinate
+    v = np.asarray(v, dtype=float)
+    grad = np.empty(len(v))
+    for i in range(0, len(v)):
+        step = np.zeros(len(v))
+        step[i] = dx
+        grad[i] = (f(*(v + step)) - f(*(v - step))) / (2 * dx)
+    return grad
+
+def gradient_descent(f, vstart, gradient=None, method="fixed", learning_rate=0.01,
+                     tolerance=1e-6, max_steps=1000, cost_tolerance=None,
+                     step_tolerance=None, max_time=None, callback=None,
+                     momentum=0.9, beta1=0.9, beta2=0.999, epsilon=1e-8,
+                     shrink=0.5, sufficient_decrease=1e-4):
+    # returns the final point as a list. callback, if given, is called with
+    # an Iteration after every step, and once with step 0 for the start.
+    if method not in methods:
+        raise ValueError("unknown method {}".format(method))
+    if gradient is None:
+        def gradient(*v):
+            return approx_gradient(f, v)
+    def grad_at(v):
+        return np.asarray(gradient(*v), dtype=float)
+    # f itself is only needed for line search and cost-based stopping, or
+    # to report it
+    track_cost = method == "backtracking" or cost_tolerance is not None or callback is not None
+    start = timer()
+    v = np.array(vstart, dtype=float)
+    grad = grad_at(v)
+    cost = f(*v) if track_cost else None
+    if callback is not None:
+        callback(Iteration(0, v.tolist(), cost, float(np.linalg.norm(grad)), 0.0, 0.0, 0.0))
+    step_size = learning_rate
+    velocity = np.zeros(len(v))
+    mean, square = np.zeros(len(v)), np.zeros(len(v))
+    steps = 0
+    while np.linalg.norm(grad) > tolerance and steps < max_steps:
+        accepted = learning_rate
+        if method == "fixed":
+            new_v = v - learning_rate * grad
+        elif method == "backtracking":
+            squared_norm = float(grad @ grad)
+            while True:
+                new_v = v - step_size * grad
+                new_cost = f(*new_v)
+                if new_cost <= cost - sufficient_decrease * step_size * squared_norm:
+                    accepted = step_size
+                    break
+                step_size *= shrink
+                if step_size * np.sqrt(squared_norm) <= 1e-15 * (1 + np.linalg.norm(v)):
+                    # no step makes progress in floating point
+                    new_v, new_cost, accepted = v, cost, 0.0
+                    break
+        elif method == "momentum":
+            velocity = momentum * velocity + grad
+            new_v = v - learning_rate * velocity
+        else:
+            mean = beta1 * mean + (1 - beta1) * grad
+            square = beta2 * square + (1 - beta2) * grad ** 2
+            corrected_mean = mean / (1 - beta1 ** (steps + 1))
+            corrected_square = square / (1 - beta2 ** (steps + 1))
+            new_v = v - learning_rate * corrected_mean / (np.sqrt(corrected_square) + epsilon)
+        if track_cost and method != "backtracking":
+            new_cost = f(*new_v)
+        moved = float(np.linalg.norm(new_v - v))
+        v, old_cost = new_v, cost
+        cost = new_cost if track_cost else None
+        grad = grad_at(v)
+        steps += 1
+        stop = False
+        if callback is not None:
+            stop = callback(Iteration(steps, v.tolist(), cost, float(np.linalg.norm(grad)),
+                                      float(accepted), moved, timer() - start))
+        if method == "backtracking":
+            if moved == 0:
+                break
+            step_size /= shrink
+        if (stop
+                or (cost_tolerance is not None
+                    and abs(old_cost - cost) <= cost_tolerance * max(abs(cost), 1e-300))
+                or (step_tolerance is not None and moved <= step_tolerance)
+                or (max_time is not None and timer() - start >= max_time)):
+            break
+    return v.tolist()
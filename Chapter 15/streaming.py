@@ -0,0 +1,164 @@
+from itertools import islice
+import numpy as np
+from costs import logistic_log_loss
+
+# The notebook's logistic regression of is_bmw on mileage and price, trained
+# by mini-batch stochastic gradient descent on a stream of listings, so the
+# listings never need to be in memory at once. Batches are arrays of
+# (mileage, price, is_bmw) rows, read from a generator of rows or a .npy
+# file a batch at a time:
+#
+#   model = StreamingLogistic().fit(file_batches("listings.npy"))
+#   l = model.logistic()        # like make_logistic(a, b, c), on raw values
+#   l(30000, 25000)
+#
+# Mileage and price are scaled as in make_scale, but with statistics that
+# are updated as batches arrive: the min and max seen so far, or the
+# running mean and standard deviation.
+
+def row_batches(rows, size=8192):
+    # arrays of up to `size` rows from an iterable of (mileage, price, is_bmw)
+    rows = iter(rows)
+    while True:
+        batch = np.array(list(islice(rows, size)), dtype=float).reshape(-1, 3)
+        if len(batch) == 0:
+            return
+        yield batch
+
+def file_batches(path, size=8192):
+    # the same from a .npy file holding an (n, 3) array of floats, read with
+    # ordinary reads rather than memory-mapped, so only one batch is ever in
+    # memory (pages of a memory map stay resident after they're read)
+    with open(path, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        if fortran_order or len(shape) != 2 or shape[1] != 3:
+            raise ValueError("expected a C-ordered (n, 3) array, got shape {}".format(shape))
+        for start in range(0, shape[0], size):
+            count = min(size, shape[0] - start)
+            yield np.fromfile(f, dtype=dtype, count=3 * count).reshape(count, 3).astype(float)
+
+class RunningMinMax():
+    # make_scale's (x - min) / (max - min), over everything seen so far
+    def __init__(self):
+        self.low, self.high = np.inf, -np.inf
+    def update(self, values):
+        if len(values) > 0:
+            self.low = min(self.low, float(np.min(values)))
+            self.high = max(self.high, float(np.max(values)))
+    @property
+    def offset(self):
+        return self.low
+    @property
+    def width(self):
+        return (self.high - self.low) or 1.0
+    def scale(self, x):
+        return (x - self.offset) / self.width
+    def unscale(self, y):
+        return y * self.width + self.offset
+
+class RunningMeanStd(RunningMinMax):
+    # (x - mean) / standard deviation, each batch's count, mean and sum of
+    # squared deviations merged into the running ones (Chan et al.'s
+    # parallel update, which doesn't lose precision the way accumulating
+    # sums of squares does)
+    def __init__(self):
+        self.count, self.mean, self.squares = 0, 0.0, 0.0
+    def update(self, values):
+        n = len(values)
+        if n == 0:
+            return
+        mean = float(np.mean(values))
+        squares = float(np.sum((values - mean) ** 2))
+        total = self.count + n
+        delta = mean - self.mean
+        self.squares += squares + delta ** 2 * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+    @property
+    def offset(self):
+        return self.mean
+    @property
+    def width(self):
+        return (self.squares / self.count) ** 0.5 if self.count and self.squares else 1.0
+
+class StreamingLogistic():
+    def __init__(self, scaler=RunningMinMax, learning_rate=1.0, momentum=0.9):
+        # scaler: RunningMinMax or RunningMeanStd. Each step moves (a, b, c)
+        # by learning_rate times the mean gradient of the batch's log loss,
+        # plus momentum times the previous step.
+        self.mileage_scale, self.price_scale = scaler(), scaler()
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        # (a, b, c) for sigmoid(a*x + b*p - c) on the scaled mileage x and
+        # price p
+        self.parameters = np.zeros(3)
+        self.velocity = np.zeros(3)
+        self.rows = 0
+
+    def _update_scales(self, mileage, price):
+        # When the statistics change, (a, b, c) are adjusted to describe the
+        # same function of the raw mileage and price as before. The map is
+        # linear, so the velocity, a difference of parameters, goes through
+        # it too and the next step keeps moving in the same raw direction.
+        old = [(s.offset, s.width) for s in (self.mileage_scale, self.price_scale)]
+        self.mileage_scale.update(mileage)
+        self.price_scale.update(price)
+        if self.rows == 0:
+            return
+        for vector in (self.parameters, self.velocity):
+            c = vector[2]
+            for i, (scale, (offset, width)) in enumerate(zip((self.mileage_scale, self.price_scale), old)):
+                slope = vector[i] / width
+                c += slope * (offset - scale.offset)
+                vector[i] = slope * scale.width
+            vector[2] = c
+
+    def partial_fit(self, batch):
+        # one step of gradient descent on a batch of (mileage, price, is_bmw)
+        # rows
+        batch = np.asarray(batch, dtype=float)
+        if len(batch) == 0:
+            return self
+        mileage, price, is_bmw = batch[:, 0], batch[:, 1], batch[:, 2]
+        self._update_scales(mileage, price)
+        _, gradient = logistic_log_loss(self.mileage_scale.scale(mileage),
+                                        self.price_scale.scale(price), is_bmw)
+        step = np.array(gradient(*self.parameters)) / len(batch)
+        self.velocity = self.momentum * self.velocity - self.learning_rate * step
+        self.parameters += self.velocity
+        self.rows += len(batch)
+        return self
+
+    def fit(self, batches):
+        for batch in batches:
+            self.partial_fit(batch)
+        return self
+
+    def coefficients(self):
+        # (a, b, c) with the model sigmoid(a*mileage + b*price - c) on the raw
+        # values
+        a, b, c = self.parameters
+        m, p = self.mileage_scale, self.price_scale
+        return (float(a / m.width), float(b / p.width),
+                float(c + a * m.offset / m.width + b * p.offset / p.width))
+
+    def logistic(self):
+        a, b, c = self.coefficients()
+        def l(mileage, price):
+            return 1 / (1 + np.exp(-(a * mileage + b * price - c)))
+        return l
+
+    def cost(self, batches):
+        # the mean log loss over a stream of batches, with the current scales
+        total, rows = 0.0, 0
+        for batch in batches:
+            batch = np.asarray(batch, dtype=float)
+            cost, _ = logistic_log_loss(self.mileage_scale.scale(batch[:, 0]),
+                                        self.price_scale.scale(batch[:, 1]), batch[:, 2])
+            total += cost(*self.parameters)
+            rows += len(batch)
+        return total / rows if rows else 0.0